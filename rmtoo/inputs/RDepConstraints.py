@@ -10,9 +10,11 @@
 '''
 
 from rmtoo.lib.digraph.Digraph import Digraph
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.InputModuleTypes import InputModuleTypes
 
+tracer = get_tracer("digraph")  # pylint: disable=invalid-name
+
 
 class RDepConstraints(Digraph.Node):
     """Holding Constraints"""
@@ -10,12 +10,14 @@
 '''
 
 from rmtoo.lib.digraph.ConnectedComponents \
-    import connected_components
+    import connected_components, is_connected
 from rmtoo.lib.digraph.Digraph import Digraph
 from rmtoo.lib.RMTException import RMTException
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.InputModuleTypes import InputModuleTypes
 
+tracer = get_tracer("digraph")  # pylint: disable=invalid-name
+
 
 class RDepOneComponent(Digraph.Node):
     """Dependency: component checker"""
@@ -37,13 +39,14 @@ class RDepOneComponent(Digraph.Node):
         components.
         """
         tracer.debug("Called.")
-        components = connected_components(reqset)
-
-        if components.get_length() == 1:
+        if is_connected(reqset):
             # Everything is ok: graph is connected
             tracer.debug("Finished.")
             return True
 
+        # Compute the components only for the error message.
+        components = connected_components(reqset)
+
         raise RMTException(
             69, "Requirements graph has two or more connected "
             "components. Please fix the edges between the nodes."
@@ -10,9 +10,12 @@
 '''
 
 from rmtoo.lib.digraph.Digraph import Digraph
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.digraph.TopologicalSort import topological_sort
+from rmtoo.lib.logging import get_tracer, DEBUG
 from rmtoo.lib.InputModuleTypes import InputModuleTypes
 
+tracer = get_tracer("digraph")  # pylint: disable=invalid-name
+
 
 class RDepPriority(Digraph.Node):
     '''This class computes the priority.
@@ -34,36 +37,43 @@ class RDepPriority(Digraph.Node):
 
     @staticmethod
     def rewrite(reqset):
-        """Do a DFS and compute the priority during that way.
-        If there is a node which was already visited, only recompute the
-        subtree, if the new priority is higher.
+        """Compute the priorities in one pass over the nodes in
+        topological order: the priority of a node is the maximum of the
+        priorities of its incoming nodes multiplied by its factor.
+        (The graph has no directed circles - this is checked before.)
+        As before, an already available priority is only overwritten
+        if the new priority is higher.
         """
         tracer.debug("Called.")
 
-        def handle_priorization(node, inc_weight):
-            """The second argument (the number) is the weight of the
-            outgoing edge.
-            """
-            tracer.debug("Node [%s] inc_weight [%4.3f]",
-                         node.get_id(), inc_weight)
+        # The maximum weight of the incoming edges of each node which is
+        # reached from one of the master nodes.
+        inc_weights = {}
+        trace_debug = tracer.isEnabledFor(DEBUG)
+        for req in reqset.get_master_nodes():
+            inc_weights[req] = 1.0
+
+        # The topological sort returns the nodes beneath first.
+        for node in reversed(topological_sort(reqset)):
+            if node not in inc_weights:
+                continue
+            inc_weight = inc_weights[node]
+            if trace_debug:
+                tracer.debug("Node [%s] inc_weight [%4.3f]",
+                             node.get_id(), inc_weight)
             # This is the weight which is inherited
             weight = inc_weight * node.get_value("Factor")
 
-            # If there is none, or if the current priority is lower
-            # that the newly computed, recompute this node and
-            # everything beneath.
-            if not node.is_value_available("Priority") \
-                    or node.get_value("Priority") < weight:
+            # If the current priority is higher than the newly computed
+            # one, this node does not change anything beneath.
+            if node.is_value_available("Priority") \
+                    and node.get_value("Priority") >= weight:
+                continue
+            if trace_debug:
                 tracer.debug("Node [%s] set priority to [%4.3f]",
                              node.get_id(), weight)
-                node.set_value("Priority", weight)
-                for out_node in node.outgoing:
-                    tracer.debug(
-                        "Recursive call to node [%s] with weight [%4.3f]",
-                        out_node.get_id(), weight)
-                    handle_priorization(out_node, weight)
-
-        # Start at the root (master) node and evaluate all nodes
-        # there.
-        for req in reqset.get_master_nodes():
-            handle_priorization(req, 1.0)
+            node.set_value("Priority", weight)
+            for out_node in node.outgoing:
+                if out_node not in inc_weights \
+                        or inc_weights[out_node] < weight:
+                    inc_weights[out_node] = weight
@@ -8,11 +8,10 @@
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.analytics.HotSpot import HotSpot
-from rmtoo.lib.analytics.DescWords import DescWords
-from rmtoo.lib.analytics.ReqTopicCohe import ReqTopicCohe
-from rmtoo.lib.analytics.TopicCohe import TopicCohe
+from rmtoo.lib.analytics.Engine import Engine
+from rmtoo.lib.analytics.Trend import Trend
 from rmtoo.lib.logging import tracer
+from rmtoo.lib.Profiler import profiler
 
 
 # pylint: disable=too-few-public-methods
@@ -21,15 +20,28 @@ class Analytics(object):
 
     @staticmethod
     def execute(config, topic_continuum_set, mstderr):
-        '''Executes all the available analytics modules.'''
+        '''Executes all the enabled analytics modules.
+           The newest topic set is walked only once for all modules:
+           the time of each module is recorded in 'walk/<name>'.
+           If configured, the trend over all topic sets is written.'''
         tracer.debug("Called.")
+        engine = Engine(config)
+        with profiler.phase("walk"):
+            topic_continuum_set.execute(engine, "")
         success = True
-        for analytic_type in [DescWords, HotSpot, ReqTopicCohe, TopicCohe]:
-            tracer.debug("Calling [%s]", analytic_type)
-            analytics = analytic_type(config)
-            topic_continuum_set.execute(analytics, "")
-            analytics.write_result(mstderr)
+        for name, analytics in engine.get_analytics():
+            tracer.debug("Results of [%s]", name)
+            with profiler.phase(name):
+                analytics.write_result(mstderr)
             if not analytics.get_success():
                 success = False
+        result_cache = engine.get_result_cache()
+        trend = Trend.create_from_config(config, result_cache)
+        if trend is not None:
+            with profiler.phase("trend"):
+                topic_continuum_set.execute(trend, "")
+            result_cache = trend.get_result_cache()
+        if result_cache is not None:
+            result_cache.log_stats()
         tracer.debug("Finished with success [%s]", success)
         return success
@@ -16,9 +16,11 @@ from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.storagebackend.txtfile.TxtRecord import TxtRecord
 from rmtoo.lib.storagebackend.txtfile.TxtIOConfig import TxtIOConfig
 from rmtoo.lib.UsableFlag import UsableFlag
-from rmtoo.lib.logging import tracer, logger
+from rmtoo.lib.logging import get_tracer, logger
 from rmtoo.lib.logging.LogFormatter import LogFormatter
 
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
+
 
 # pylint: disable=too-many-instance-attributes
 class BaseRMObject(UsableFlag):
@@ -104,6 +106,20 @@ class BaseRMObject(UsableFlag):
         # inspection.
         self.brmo = brmo
 
+    def get_parsed_state(self):
+        '''Returns the state of the object directly after parsing
+           and handling the tag modules.  This is used by the
+           persistent cache and the parallel parser.'''
+        return (self.record, self.values, self.brmo, self.otags,
+                self.is_usable())
+
+    def set_parsed_state(self, state):
+        '''Restores the state which was returned by
+           get_parsed_state().'''
+        self.record, self.values, self.brmo, self.otags, usable = state
+        if not usable:
+            self._set_not_usable()
+
     def handle_modules_tag(self, reqs):
         """Process all the modules"""
         if self.mods is None:
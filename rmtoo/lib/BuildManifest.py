@@ -0,0 +1,265 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Build manifest: records for each output the digest of all the
+   inputs which went into it (requirements, topics, constraints, test
+   cases, templates and configuration) and the digests of the written
+   files.  An output whose inputs did not change and whose files are
+   still there must not be generated again; outputs which write many
+   files (like html) can skip writing the files which did not change.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import os
+
+from six import iteritems, string_types, text_type
+
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.vcs.PersistentCache import get_rmtoo_code_version
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
+
+def digest_content(content):
+    '''Returns the digest of the given (text or binary) content.'''
+    if isinstance(content, text_type):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def digest_path(path):
+    '''Returns the digest of the content of the given file or of all
+       the files in the given directory.  Returns None if there is no
+       such file or directory.'''
+    if os.path.isfile(path):
+        with open(path, "rb") as path_fd:
+            return digest_content(path_fd.read())
+    if not os.path.isdir(path):
+        return None
+    path_hash = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            path_hash.update(("%s\n%s\n" % (
+                os.path.relpath(full_path, path),
+                digest_path(full_path))).encode("utf-8"))
+    return path_hash.hexdigest()
+
+
+class OutputRecord(object):
+    '''The manifest entry of one output.
+       The files are the ones which are written by the output (the
+       'output_filename' or 'output_directory' of the configuration);
+       the pages are the single files written by outputs which support
+       skipping unchanged files.'''
+
+    # The configuration entries which name the written files.
+    output_keys = ("output_filename", "output_directory")
+
+    def __init__(self, inputs_digest, files, old_pages=None):
+        self.__inputs_digest = inputs_digest
+        self.__files = files
+        self.__old_pages = old_pages or {}
+        self.__pages = {}
+
+    @staticmethod
+    def create(inputs_digest, cfg, old_record=None):
+        '''Creates a new record for the output with the given
+           configuration.  The pages of the old record are used to
+           detect unchanged pages.'''
+        files = sorted(cfg[key] for key in OutputRecord.output_keys
+                       if isinstance(cfg.get(key), string_types))
+        old_pages = None
+        if old_record is not None:
+            old_pages = old_record.get_pages()
+        return OutputRecord(inputs_digest, files, old_pages)
+
+    @staticmethod
+    def from_dict(record_dict):
+        '''Creates a record from the stored representation.'''
+        record = OutputRecord(record_dict["inputs"], record_dict["files"])
+        record.__pages = record_dict["pages"]
+        return record
+
+    def to_dict(self):
+        '''Returns the representation which is stored.'''
+        return {"inputs": self.__inputs_digest, "files": self.__files,
+                "pages": self.__pages}
+
+    def collect_files(self):
+        '''Replaces the configured output files by the files which were
+           written.  Some outputs add an extension to the configured
+           output filename.'''
+        files = []
+        for filename in self.__files:
+            if os.path.exists(filename):
+                files.append(filename)
+                continue
+            directory, basename = os.path.split(filename)
+            try:
+                files.extend(sorted(
+                    os.path.join(directory, dentry)
+                    for dentry in os.listdir(directory or ".")
+                    if dentry.startswith(basename + ".")))
+            except OSError:
+                pass
+        self.__files = files
+
+    def get_inputs_digest(self):
+        '''Returns the digest of all the inputs.'''
+        return self.__inputs_digest
+
+    def get_pages(self):
+        '''Returns the digests of all pages (by filename).'''
+        return self.__pages
+
+    def is_up_to_date(self, inputs_digest):
+        '''Returns True if the output was created from the same inputs
+           and all the output files are still there.'''
+        return inputs_digest == self.__inputs_digest \
+            and all(os.path.exists(filename) for filename in self.__files) \
+            and all(os.path.exists(filename) for filename in self.__pages)
+
+    def is_page_unchanged(self, filename, content):
+        '''Records the digest of the content of the page and returns
+           True if the file is already there with the same content.'''
+        digest = digest_content(content)
+        self.__pages[filename] = digest
+        return self.__old_pages.get(filename) == digest \
+            and os.path.exists(filename)
+
+
+class BuildManifest(object):
+    '''Stores the records of all outputs in one (JSON) file.'''
+
+    # Increment when the format or the way the digests are computed
+    # changes: old manifests are then ignored.
+    manifest_version = 1
+
+    def __init__(self, filename, config_digest):
+        '''Creates the manifest; if the file exists, the records of
+           the last run are read in.'''
+        tracer.debug("called: filename [%s]", filename)
+        self.__filename = filename
+        self.__env_digest = digest_content(
+            "%s\n%s" % (get_rmtoo_code_version(), config_digest))
+        self.__records = {}
+        self.__stats_cnt_skipped = 0
+        self.__stats_cnt_run = 0
+        self.__read()
+
+    @staticmethod
+    def create_from_config(config):
+        '''Creates a build manifest if 'processing.manifest.filename' is
+           configured.  If not, None is returned.'''
+        filename = config.get_rvalue_default(
+            "processing.manifest.filename", None)
+        if filename is None:
+            tracer.debug("No build manifest configured.")
+            return None
+        # The output configuration and the sources are part of the
+        # digest of each output; the processing and the actions have
+        # no influence on the content of the outputs.
+        config_digest = json.dumps(
+            dict((key, value) for key, value in config.items()
+                 if key not in ("topics", "processing", "actions")),
+            sort_keys=True, default=str)
+        return BuildManifest(filename, config_digest)
+
+    def __read(self):
+        '''Reads the records of the last run.  A missing or unusable
+           manifest is handled like an empty one.'''
+        try:
+            with io.open(self.__filename, "r", encoding="utf-8") as man_fd:
+                manifest = json.load(man_fd)
+            if manifest.get("version") != self.manifest_version:
+                tracer.info("Ignoring build manifest [%s] with version [%s]",
+                            self.__filename, manifest.get("version"))
+                return
+            for key, record in iteritems(manifest["outputs"]):
+                self.__records[key] = OutputRecord.from_dict(record)
+        except (IOError, OSError):
+            tracer.debug("No build manifest [%s] available",
+                         self.__filename)
+        except (ValueError, KeyError, TypeError) as excp:
+            tracer.info("Ignoring unusable build manifest [%s]: [%s]",
+                        self.__filename, excp)
+
+    def write(self):
+        '''Writes all the records into the manifest file.'''
+        tracer.debug("Writing build manifest [%s]", self.__filename)
+        tmp_filename = self.__filename + ".tmp"
+        with io.open(tmp_filename, "w", encoding="utf-8") as man_fd:
+            man_fd.write(text_type(json.dumps(
+                {"version": self.manifest_version,
+                 "outputs": dict((key, record.to_dict()) for key, record
+                                 in iteritems(self.__records))},
+                indent=1, sort_keys=True)))
+            man_fd.write("\n")
+        os.rename(tmp_filename, self.__filename)
+
+    def compute_inputs_digest(self, topic_continuum, oconfig_name, cfg,
+                              dates=None):
+        '''Computes the digest of all inputs of the output: the content
+           of all topic sets of the continuum, the configuration of the
+           output and all files and directories named in it (e.g.
+           templates).
+           For outputs which use the start and end date, the dates must
+           be given: if not configured, they depend on the day of the
+           run.'''
+        inputs_hash = hashlib.sha256()
+        inputs_hash.update(self.__env_digest.encode("utf-8"))
+        inputs_hash.update(("\n%s\n%s\n" % (
+            oconfig_name, json.dumps(cfg, sort_keys=True, default=str)))
+                           .encode("utf-8"))
+        if dates is not None:
+            inputs_hash.update(("%s %s\n" % dates).encode("utf-8"))
+        for key, value in sorted(iteritems(cfg)):
+            if key in OutputRecord.output_keys \
+                    or not isinstance(value, string_types):
+                continue
+            path_digest = digest_path(value)
+            if path_digest is not None:
+                inputs_hash.update(("%s\n%s\n" % (key, path_digest))
+                                   .encode("utf-8"))
+        for commit_info in topic_continuum.get_vcs_commit_ids():
+            topic_set = topic_continuum.get_topic_set(
+                commit_info.get_commit()).get_topic_set()
+            inputs_hash.update(("%s\n%s\n" % (
+                commit_info.get_commit(), topic_set.get_content_digest()))
+                               .encode("utf-8"))
+        return inputs_hash.hexdigest()
+
+    def get_record(self, key):
+        '''Returns the record of the last run for the output with the
+           given key (or None).'''
+        return self.__records.get(key)
+
+    def set_record(self, key, record):
+        '''Sets the record for the output with the given key.
+           None removes the record.'''
+        if record is None:
+            self.__records.pop(key, None)
+            return
+        record.collect_files()
+        self.__records[key] = record
+
+    def count_skipped(self, skipped):
+        '''Counts a skipped or executed output.'''
+        if skipped:
+            self.__stats_cnt_skipped += 1
+        else:
+            self.__stats_cnt_run += 1
+
+    def get_stats(self):
+        '''Returns the number of skipped and executed outputs.'''
+        return self.__stats_cnt_skipped, self.__stats_cnt_run
@@ -10,6 +10,9 @@
  For licensing details see COPYING
 '''
 from rmtoo.lib.RMTException import RMTException
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 # Some common used functions
@@ -19,20 +22,61 @@ def ce3assert(bool_expr, errmsg):
         raise RMTException(90, "Failed CE3 assert: msg [%s]" % errmsg)
 
 
+class CE3CodeCache(object):
+    """Holds the compiled code of the constraints' CE3 bodies and of
+    the call expressions.
+
+    Many requirements share the same few constraints: each distinct
+    code is compiled only once.  The key is the source code itself,
+    therefore the cache can be used for constraints of all commits.
+    """
+
+    def __init__(self):
+        self.__codes = {}
+        self.__stats_cnt_compile = 0
+        self.__stats_cnt_exec = 0
+
+    def get_code(self, source, mode):
+        """Returns the compiled code for the source.
+        The mode is 'exec' or 'eval'."""
+        key = (source, mode)
+        code = self.__codes.get(key)
+        if code is None:
+            code = compile(source, "<CE3>", mode)
+            self.__codes[key] = code
+            self.__stats_cnt_compile += 1
+        return code
+
+    def count_exec(self):
+        """Counts one execution of CE3 code."""
+        self.__stats_cnt_exec += 1
+
+    def get_stats(self):
+        """Returns the usage statistics as a tuple: compile, exec."""
+        return self.__stats_cnt_compile, self.__stats_cnt_exec
+
+    def log_stats(self):
+        """Prints out the usage statistics."""
+        tracer.info("CE3 code statistics: compiled [%d] executed [%d]",
+                    self.__stats_cnt_compile, self.__stats_cnt_exec)
+
+
 class CE3(dict):
     """Constraint Execution and Evaluation Environment
 
     All results from the execution phase are stored in the dict.
     """
 
+    # The code cache which is shared by all CE3s.
+    code_cache = CE3CodeCache()
+
     def __hash__(self):
         return hash(tuple(self.keys()))
 
     def __repr__(self):
         return "<CE3 %s>" % list(self.keys())
 
-    # This is not found because of the 'exec' call
-    # pylint: disable=no-self-use,exec-used,unused-argument
+    # pylint: disable=exec-used,eval-used
     def eval(self, constraint, class_name, cstr_call):
         """Evaluates the constraint using the provided parameters"""
         constraint_value = constraint.get_value("CE3")
@@ -43,8 +87,15 @@ class CE3(dict):
         for exec_line in constraint_value.get_content_with_nl():
             exec_str += exec_line[1:] + "\n"
 
-        exec(exec_str) in globals(), locals()
-        exec("self[class_name] = %s" % cstr_call)
+        # Each evaluation gets its own namespace (and therefore its own
+        # classes); only the compiled code is shared.
+        namespace = {}
+        exec(self.code_cache.get_code(exec_str, "exec"),
+             globals(), namespace)
+        self.code_cache.count_exec()
+        self[class_name] = eval(self.code_cache.get_code(cstr_call, "eval"),
+                                globals(), namespace)
+        self.code_cache.count_exec()
 
     def unite(self, oce3s):
         """Try to unite all given ce3s into the local ce3"""
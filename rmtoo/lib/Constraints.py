@@ -12,7 +12,9 @@ from __future__ import unicode_literals
 
 from six import iteritems
 
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 class Constraints(object):
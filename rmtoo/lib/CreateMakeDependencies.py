@@ -8,7 +8,9 @@
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
 
 
 class CreateMakeDependencies(object):
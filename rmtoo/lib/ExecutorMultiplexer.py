@@ -0,0 +1,80 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Executor which fans out all the callbacks to a list of executors.
+   This is used to walk the topic continuum only once for all the
+   executors which use the same order of the topic sets and
+   requirements.
+   When names are given, the time of the callbacks of each executor is
+   recorded in the profiler as phase with the name of the executor.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.FuncCall import FanOut, get_function
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
+
+class ExecutorMultiplexer(FanOut):
+    '''Calls each callback for all the executors in the given order.
+       All executors must return the same topic continuum order and
+       must use the same topic set and requirement set sort method.'''
+
+    def __init__(self, executors, topic_sets, names=None):
+        self.__executors = executors
+        self.__topic_sets = topic_sets
+        if names is None:
+            names = [None] * len(executors)
+        FanOut.__init__(self, list(zip(names, executors)))
+
+    @staticmethod
+    def create_groups(executors, vcs_commit_ids, topic_sets, names=None):
+        '''Groups the executors by their order and returns a
+           multiplexer for each group.
+           The optional names (one for each executor) are used as
+           profiler phases.
+           The topic continuum order is checked by comparing the results
+           of topic_continuum_sort() (which is called exactly once for
+           each executor); the topic set and requirement set orders are
+           the same when the same sort methods are used.'''
+        groups = []
+        group_index = {}
+        if names is None:
+            names = [None] * len(executors)
+        for executor, name in zip(executors, names):
+            sorted_topic_sets = executor.topic_continuum_sort(
+                vcs_commit_ids, topic_sets)
+            key = (tuple(id(topic_set) for topic_set in sorted_topic_sets),
+                   get_function(executor.topic_set_sort),
+                   get_function(executor.requirement_set_sort))
+            if key not in group_index:
+                group_index[key] = len(groups)
+                groups.append(([], [], sorted_topic_sets))
+            groups[group_index[key]][0].append(executor)
+            groups[group_index[key]][1].append(name)
+        tracer.debug("Executors [%d] groups [%d]", len(executors),
+                     len(groups))
+        return [ExecutorMultiplexer(group_executors, sorted_topic_sets,
+                                    group_names)
+                for group_executors, group_names, sorted_topic_sets
+                in groups]
+
+    def get_executors(self):
+        '''Returns the executors.'''
+        return self.__executors
+
+    def topic_continuum_sort(self, _vcs_commit_ids, _topic_sets):
+        '''Returns the (already sorted) list of topic sets.'''
+        return self.__topic_sets
+
+    def topic_set_sort(self, list_to_sort):
+        '''All executors use the same sort method.'''
+        return self.__executors[0].topic_set_sort(list_to_sort)
+
+    def requirement_set_sort(self, list_to_sort):
+        '''All executors use the same sort method: sort only once.'''
+        return self.__executors[0].requirement_set_sort(list_to_sort)
@@ -8,7 +8,12 @@
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer, DEBUG
+from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
+from rmtoo.lib.Executor import Executor
+from rmtoo.lib.Profiler import profiler
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
 
 
 # pylint: disable=too-few-public-methods
@@ -22,10 +27,145 @@ class FuncCall(object):
         Call the method with the method_name on the given object
         with the given arguments - if the method exists.
         '''
-        tracer.debug("pcall: trying to call [%s]", method_name)
-        if not hasattr(obj, method_name):
-            tracer.debug("pcall: method [%s] does not exist.", method_name)
+        method = getattr(obj, method_name, None)
+        # This is called for each element during output: only trace
+        # when it is really needed.
+        if tracer.isEnabledFor(DEBUG):
+            tracer.debug("pcall: method [%s] %s", method_name,
+                         "does not exist." if method is None else "called")
+        if method is None:
             # No way to call the method.
             return
-        tracer.debug("pcall: calling method [%s]", method_name)
-        return getattr(obj, method_name)(*args)
+        return method(*args)
+
+
+def get_function(method):
+    '''Returns the function of the (bound or unbound) method.'''
+    return getattr(method, "__func__", method)
+
+
+# The default implementations of the executor base classes which do
+# nothing: there is no need to call them.
+_NOP_HOOKS = set(
+    get_function(getattr(base_class, hook))
+    for base_class in (ExecutorTopicContinuum, Executor)
+    for hook in dir(base_class)
+    if not hook.startswith("_") and not hook.endswith("_sort"))
+
+# For each executor class and method name: is there a hook which
+# must be called?
+_CLASS_HOOKS = {}
+
+
+def get_hook(executor, method_name):
+    '''Returns the (bound) method with the given name of the executor
+       or None if there is no such method or it is one of the default
+       implementations which do nothing.
+       The lookup is done once for each class; only for executors
+       which create their methods dynamically (__getattr__) it is done
+       for the object.'''
+    key = (type(executor), method_name)
+    implemented = _CLASS_HOOKS.get(key)
+    if implemented is None:
+        function = getattr(type(executor), method_name, None)
+        if function is None and hasattr(type(executor), "__getattr__"):
+            return getattr(executor, method_name, None)
+        implemented = function is not None \
+            and get_function(function) not in _NOP_HOOKS
+        _CLASS_HOOKS[key] = implemented
+    return getattr(executor, method_name) if implemented else None
+
+
+def create_fan_out(method_name, named_executors, is_active=None):
+    '''Returns the callback which calls the method with the given name
+       for all the (name, executor) pairs whose executor implements it
+       (or None if there is none).
+       The time of each method is recorded in the profiler phase with
+       the name of the executor (if the name is not None).
+       If is_active is given, only the executors for whose name it
+       returns True are called.'''
+    methods = []
+    for name, executor in named_executors:
+        method = get_hook(executor, method_name)
+        if method is None:
+            continue
+        if name is not None:
+            method = profiler.timed(name, method)
+        methods.append((name, method))
+    if not methods:
+        return None
+
+    if is_active is None:
+        def callback(*args):
+            '''Calls all the methods.'''
+            for _, method in methods:
+                method(*args)
+    else:
+        def callback(*args):
+            '''Calls the methods of the active executors.'''
+            for name, method in methods:
+                if is_active(name):
+                    method(*args)
+    return callback
+
+
+class FanOut(object):
+    '''Base class for executors which call each callback for a list of
+       (name, executor) pairs - see create_fan_out().'''
+
+    def __init__(self, named_executors, is_active=None):
+        self.__named_executors = named_executors
+        self.__is_active = is_active
+
+    def _create_fan_out(self, method_name):
+        '''Returns the callback for the method with the given name.'''
+        return create_fan_out(method_name, self.__named_executors,
+                              self.__is_active)
+
+    def __getattr__(self, name):
+        '''Returns the callback for the method with the given name
+           (or None).  The result is stored - so that this is done only
+           once for each callback.'''
+        if name.startswith("_"):
+            raise AttributeError(name)
+        callback = self._create_fan_out(name)
+        setattr(self, name, callback)
+        return callback
+
+
+class DispatchTable(object):
+    '''The hooks of one executor for one function prefix.
+       Each attribute is the bound method which must be called or None.
+       This is used by the execute() methods, so that there is no
+       method lookup for each element of the traversal.'''
+
+    HOOKS = ("topic_continuum_set_pre", "topic_continuum_set_post",
+             "topic_continuum_pre", "topic_continuum_post",
+             "topic_set_pre", "topic_set_post",
+             "topic_pre", "topic_name", "topic_text", "topic_sub_pre",
+             "topic_sub_post", "topic_post",
+             "requirement_set_pre", "requirement_set_post", "requirement")
+
+    __slots__ = HOOKS
+
+    def __init__(self, executor, func_prefix):
+        for hook in self.HOOKS:
+            setattr(self, hook, get_hook(executor, func_prefix + hook))
+
+    @staticmethod
+    def get(executor, func_prefix):
+        '''Returns the dispatch table of the executor for the given
+           prefix.  The table is created once and stored in the
+           executor.'''
+        try:
+            tables = executor.__dict__["_dispatch_tables"]
+        except KeyError:
+            tables = {}
+            executor.__dict__["_dispatch_tables"] = tables
+        table = tables.get(func_prefix)
+        if table is None:
+            tracer.debug("Creating dispatch table for [%s] prefix [%s]",
+                         type(executor).__name__, func_prefix)
+            table = DispatchTable(executor, func_prefix)
+            tables[func_prefix] = table
+        return table
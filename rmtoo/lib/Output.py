@@ -14,36 +14,126 @@ from stevedore import extension
 from six import iteritems
 
 from rmtoo.lib.Executor import Executor
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.Profiler import profiler
 from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.ParallelOutput import ParallelOutput
+from rmtoo.lib.BuildManifest import BuildManifest, OutputRecord
+from rmtoo.lib.StdOutputParams import StdOutputParams
+from rmtoo.lib.configuration.Cfg import Cfg
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
 
 
 class Output(Executor):
     '''Handle different outputs.'''
 
-    def __init__(self, config):
-        '''Creates the output module handler.'''
+    def __init__(self, config, parallel_output=None, build_manifest=None):
+        '''Creates the output module handler.
+           If a parallel_output is given, the outputs are only added
+           to it.  If a build_manifest is given, only the outputs whose
+           inputs changed are executed.'''
         tracer.debug("Called.")
         self.__config = config
+        self.__parallel_output = parallel_output
+        self.__build_manifest = build_manifest
         self.__cmad_file = None
-        self.__plugin_manager = extension.ExtensionManager(
-            namespace='rmtoo.output.plugin',
-            invoke_on_load=False)
+        with profiler.phase("plugins"):
+            self.__plugin_manager = extension.ExtensionManager(
+                namespace='rmtoo.output.plugin',
+                invoke_on_load=False)
+
+    def __get_outputs(self, topic_continuum):
+        '''Returns the outputs of the topic continuum as a list of
+           the output name, the configuration, the key in the build
+           manifest and the new build manifest record.
+           Outputs which are up to date are skipped.  (Without a build
+           manifest all outputs are returned without key and record.)'''
+        outputs = []
+        for oconfig_name, oconfig in iteritems(
+                topic_continuum.get_output_config()):
+            for idx, cfg in enumerate(oconfig):
+                if self.__build_manifest is None:
+                    outputs.append((oconfig_name, cfg, None, None))
+                    continue
+                key = "%s:%s:%d" % (topic_continuum.get_name(),
+                                    oconfig_name, idx)
+                dates = None
+                if getattr(self.__plugin_manager[oconfig_name].plugin,
+                           "uses_dates", False):
+                    dates = StdOutputParams.get_start_and_end_date(
+                        Cfg(cfg))
+                with profiler.phase("manifest"):
+                    inputs_digest = \
+                        self.__build_manifest.compute_inputs_digest(
+                            topic_continuum, oconfig_name, cfg, dates)
+                old_record = self.__build_manifest.get_record(key)
+                skip = old_record is not None \
+                    and old_record.is_up_to_date(inputs_digest)
+                self.__build_manifest.count_skipped(skip)
+                if skip:
+                    tracer.info("Output [%s] is up to date - skipping.",
+                                key)
+                    continue
+                # Until the output was successful there is no record.
+                self.__build_manifest.set_record(key, None)
+                outputs.append((oconfig_name, cfg, key, OutputRecord.create(
+                    inputs_digest, cfg, old_record)))
+        return outputs
 
     def __common_topic_continuum_pre(self, topic_continuum, special):
         '''Common method used by cmad_ and normal callback.'''
         tracer.info("Called.")
-        output_config = topic_continuum.get_output_config()
-
-        for oconfig_name, oconfig in iteritems(output_config):
-            for cfg in oconfig:
-                output_obj = self.__plugin_manager[oconfig_name].plugin(cfg)
-                if special != "":
-                    FuncCall.pcall(output_obj, "init_" + special,
-                                   self.__cmad_file)
-                topic_continuum.execute(output_obj, special)
+        if special != "":
+            for oconfig_name, oconfig in iteritems(
+                    topic_continuum.get_output_config()):
+                for cfg in oconfig:
+                    with profiler.phase(oconfig_name):
+                        output_obj = \
+                            self.__plugin_manager[oconfig_name].plugin(cfg)
+                        # All outputs write into the one cmad file:
+                        # keep the order of the entries.
+                        FuncCall.pcall(output_obj, "init_" + special,
+                                       self.__cmad_file)
+                        topic_continuum.execute(output_obj, special)
+            tracer.info("Finished.")
+            return
+
+        outputs = self.__get_outputs(topic_continuum)
+        if self.__parallel_output is not None:
+            for oconfig_name, cfg, key, record in outputs:
+                self.__parallel_output.add(topic_continuum, oconfig_name,
+                                           cfg, record, key)
+            tracer.info("Finished; outputs will run in parallel.")
+            return
+
+        output_objs = []
+        for oconfig_name, cfg, _key, record in outputs:
+            with profiler.phase(oconfig_name):
+                output_objs.append(self.__create_output_obj(
+                    oconfig_name, cfg, record))
+
+        # Walk the topic continuum only once for all the outputs
+        # which use the same order; the time of the callbacks of each
+        # output is recorded in the phase 'walk/<output name>'.
+        with profiler.phase("walk"):
+            topic_continuum.execute_multiplexed(
+                output_objs, special,
+                [oconfig_name for oconfig_name, _cfg, _key, _record
+                 in outputs])
+        for _oconfig_name, _cfg, key, record in outputs:
+            if record is not None:
+                self.__build_manifest.set_record(key, record)
         tracer.info("Finished.")
 
+    def __create_output_obj(self, oconfig_name, cfg, record):
+        '''Creates the output object; if there is a build manifest
+           record, it is passed to the output.'''
+        output_obj = self.__plugin_manager[oconfig_name].plugin(cfg)
+        if record is not None:
+            FuncCall.pcall(output_obj, "init_build_manifest", record)
+        return output_obj
+
     def topic_continuum_pre(self, topic_continuum):
         '''This is called in the TopicsContinuum pre-phase.'''
         tracer.debug("Called.")
@@ -66,8 +156,40 @@ class Output(Executor):
         # This is a link to the topics_continuum pre
         return self.__common_topic_continuum_pre(topic_continuum, "cmad_")
 
+    def execute_one(self, topic_continuum, oconfig_name, cfg, record=None,
+                    _key=None):
+        '''Executes one output for the given topic continuum.
+           Returns the (filled) build manifest record.'''
+        output_obj = self.__create_output_obj(oconfig_name, cfg, record)
+        topic_continuum.execute(output_obj, "")
+        return record
+
+    def set_build_manifest_record(self, job, record):
+        '''Stores the record of a successful parallel output.'''
+        if record is not None:
+            self.__build_manifest.set_record(job[4], record)
+
     @staticmethod
-    def execute(config, topic_continuum_set, _mstderr, func_prefix):
-        """Run this output module"""
-        output = Output(config)
-        return topic_continuum_set.execute(output, func_prefix)
+    def execute(config, topic_continuum_set, mstderr, func_prefix):
+        """Run this output module.
+           Returns False if one of the parallel executed outputs
+           failed."""
+        parallel_output = None
+        build_manifest = None
+        if func_prefix == "":
+            parallel_output = ParallelOutput.create_from_config(config)
+            build_manifest = BuildManifest.create_from_config(config)
+        output = Output(config, parallel_output, build_manifest)
+        try:
+            topic_continuum_set.execute(output, func_prefix)
+            if parallel_output is None:
+                return True
+            with profiler.phase("parallel"):
+                return parallel_output.run(
+                    output.execute_one, mstderr,
+                    output.set_build_manifest_record)
+        finally:
+            if build_manifest is not None:
+                tracer.info("Build manifest: outputs skipped [%d] "
+                            "executed [%d]", *build_manifest.get_stats())
+                build_manifest.write()
@@ -0,0 +1,127 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Parallel execution of the output plugins.
+   The output plugins only read the (already built) topic continuum
+   set and write their own files.  Therefore each configured output
+   can run in a worker process.  The workers are forked after the
+   topic continuum set was read: nothing must be pickled or read in
+   again.  Each output runs in its own process; errors and everything
+   written to stderr are collected and written out in the original
+   order of the outputs.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import sys
+import traceback
+
+from rmtoo.lib.Encoding import Encoding
+from rmtoo.lib.ParallelParser import get_fork_context
+from rmtoo.lib.logging import get_tracer, create_log_handler, \
+    init_worker_logging
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
+# The state of a worker process: set up once by the initializer.
+# pylint: disable=invalid-name
+_worker_state = {}
+
+
+def _init_worker(execute_one, jobs):
+    '''Initializes a worker process.'''
+    _worker_state["execute_one"] = execute_one
+    _worker_state["jobs"] = jobs
+
+
+def _capture_stderr():
+    '''Replaces stderr and the handlers of the logger by a buffer.
+       Returns the buffer.'''
+    stderr = io.StringIO()
+    init_worker_logging(create_log_handler(stderr))
+    sys.stderr = stderr
+    return stderr
+
+
+def _execute_one(job_idx):
+    '''Executes one output in the worker process.
+       Returns the error (or None), everything written to stderr and
+       the result of the output.'''
+    stderr = _capture_stderr()
+    error = None
+    result = None
+    try:
+        result = _worker_state["execute_one"](
+            *_worker_state["jobs"][job_idx])
+    # Each error of an output must be reported in the main process.
+    # pylint: disable=broad-except
+    except Exception:
+        error = Encoding.to_unicode(traceback.format_exc())
+    return error, stderr.getvalue(), result
+
+
+class ParallelOutput(object):
+    '''Collects the outputs and executes them in worker processes.'''
+
+    def __init__(self, workers, context):
+        tracer.debug("called: workers [%d]", workers)
+        self.__workers = workers
+        self.__context = context
+        self.__jobs = []
+
+    @staticmethod
+    def create_from_config(config):
+        '''Creates a parallel output if
+           'processing.parallel.output_workers' is configured with more
+           than one worker.  If not (or if the platform does not support
+           forking) None is returned.'''
+        workers = config.get_integer(
+            "processing.parallel.output_workers", 1)
+        if workers <= 1:
+            return None
+        context = get_fork_context()
+        if context is None:
+            tracer.info("Parallel output not supported on this "
+                        "platform - using sequential output.")
+            return None
+        return ParallelOutput(workers, context)
+
+    def add(self, *job):
+        '''Adds an output: the arguments are passed to the execute_one
+           function given to run().'''
+        self.__jobs.append(job)
+
+    def run(self, execute_one, mstderr, handle_result=None):
+        '''Runs all the outputs.  Returns True if all outputs were
+           successful.  If given, handle_result is called in the main
+           process with the job and the result of each successful
+           output.'''
+        tracer.debug("called: job count [%d]", len(self.__jobs))
+        if not self.__jobs:
+            return True
+        # Each output gets a fresh copy of the topic continuum set.
+        pool = self.__context.Pool(
+            min(self.__workers, len(self.__jobs)), _init_worker,
+            (execute_one, self.__jobs), 1)
+        try:
+            results = pool.map(_execute_one, range(len(self.__jobs)), 1)
+        finally:
+            pool.close()
+            pool.join()
+
+        success = True
+        for job, (error, stderr, result) in zip(self.__jobs, results):
+            mstderr.write(stderr)
+            if error is not None:
+                mstderr.write("+++ ERROR: output [%s] failed:\n%s"
+                              % (job[1], error))
+                success = False
+            elif handle_result is not None:
+                handle_result(job, result)
+        tracer.debug("Finished: success [%s]", success)
+        return success
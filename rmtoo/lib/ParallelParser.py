@@ -0,0 +1,141 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Parallel parsing of requirements, constraints and test cases.
+   Parsing one file (TxtRecord and all tag input modules) does not
+   depend on any other file.  Therefore the files can be parsed in a
+   pool of worker processes.  The workers are forked: the input
+   modules and the configuration are inherited and must not be
+   pickled.  Log records created during parsing are collected in the
+   workers and returned, so that they can be emitted in the original
+   order in the main process.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import logging
+import multiprocessing
+
+from rmtoo.lib.logging import get_tracer, init_worker_logging
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
+
+
+class _LogRecordCollector(logging.Handler):
+    '''Collects all log records instead of writing them.'''
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        # The message is formatted here: the arguments are possible
+        # not picklable.
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+# The state of a worker process: set up once by the initializer.
+# pylint: disable=invalid-name
+_worker_state = {}
+
+
+def _init_worker(config, input_mods):
+    '''Initializes a worker process: the log handlers inherited from the
+       main process are replaced by a collector.'''
+    collector = _LogRecordCollector()
+    init_worker_logging(collector)
+    _worker_state["config"] = config
+    _worker_state["input_mods"] = input_mods
+    _worker_state["collector"] = collector
+
+
+def _parse_one(job):
+    '''Parses one element in the worker process.
+       Returns the parsed state and the collected log records.'''
+    element_class, content, rid, file_path = job
+    collector = _worker_state["collector"]
+    collector.records = []
+    element = element_class(content, rid, file_path,
+                            _worker_state["input_mods"],
+                            _worker_state["config"])
+    return element.get_parsed_state(), collector.records
+
+
+def get_fork_context():
+    '''Returns the multiprocessing context which forks the workers or
+       None if forking is not supported on this platform.'''
+    if not hasattr(multiprocessing, "get_context"):
+        # Python 2: multiprocessing always forks on POSIX systems.
+        return multiprocessing
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+class ParallelParser(object):
+    '''Parses elements in a pool of worker processes.
+       The pool is created with the first call of parse() and must
+       be closed with close().'''
+
+    # Forking the pool costs more than parsing some files (e.g. the
+    # changed files of one commit when reading incrementally): less
+    # jobs than this for each worker are parsed in the main process.
+    min_jobs_per_worker = 2
+
+    def __init__(self, config, input_mods, workers, context):
+        tracer.debug("called: workers [%d]", workers)
+        self.__config = config
+        self.__input_mods = input_mods
+        self.__workers = workers
+        self.__context = context
+        self.__pool = None
+
+    @staticmethod
+    def create_from_config(config, input_mods):
+        '''Creates a parallel parser if 'processing.parallel.workers'
+           is configured with more than one worker.  If not (or if
+           the platform does not support forking) None is returned.'''
+        workers = config.get_integer("processing.parallel.workers", 1)
+        if workers <= 1:
+            return None
+        context = get_fork_context()
+        if context is None:
+            tracer.info("Parallel parsing not supported on this "
+                        "platform - using sequential parsing.")
+            return None
+        return ParallelParser(config, input_mods, workers, context)
+
+    def parse(self, element_class, jobs):
+        '''Parses the given jobs - a list of (content, rid, file_path).
+           Returns a list of (parsed state, log records) in the same
+           order as the jobs.  If there are only a few jobs, nothing is
+           done and None is returned: the jobs must then be parsed in
+           the main process.'''
+        tracer.debug("called: job count [%d]", len(jobs))
+        if len(jobs) < self.__workers * self.min_jobs_per_worker:
+            return None
+        if self.__pool is None:
+            self.__pool = self.__context.Pool(
+                self.__workers, _init_worker,
+                (self.__config, self.__input_mods))
+        chunksize = max(1, len(jobs) // (self.__workers * 4))
+        return self.__pool.map(
+            _parse_one,
+            [(element_class, content, rid, file_path)
+             for content, rid, file_path in jobs],
+            chunksize)
+
+    def close(self):
+        '''Stops the worker processes.'''
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
@@ -0,0 +1,175 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Profiler: records the wall and cpu time of the different phases
+   of a rmtoo run.
+   The phases are nested (e.g. reading a commit is part of reading
+   the topic continuum); the times of all phases with the same path
+   are summed up.  Only coarse phases are recorded (per commit, per
+   module, per output plugin) - therefore the times are always
+   recorded; the report is written only when configured.
+   Work which is interleaved with other work (like the callbacks of
+   the output plugins which share one walk) is recorded with timed():
+   the times of all calls are summed up into one phase.  Because
+   these are many calls, they are only timed when the profile is
+   enabled.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import cProfile
+import io
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from six import text_type
+
+from rmtoo.lib.logging import tracer
+
+try:
+    _CPU_TIME = time.process_time
+    _WALL_TIME = time.perf_counter
+except AttributeError:
+    # Python 2
+    _CPU_TIME = time.clock
+    _WALL_TIME = time.time
+
+
+class Profiler(object):
+    '''Records the times of the phases.'''
+
+    def __init__(self):
+        self.__enabled = False
+        self.__cprofile_directory = None
+        self.__stack = []
+        self.__phases = {}
+        self.__phase_order = []
+        self.__cprofile = None
+        self.__cprofile_cnt = 0
+
+    def reset(self):
+        '''Removes all recorded phases.'''
+        self.__enabled = False
+        self.__cprofile_directory = None
+        self.__stack = []
+        self.__phases = {}
+        self.__phase_order = []
+        self.__cprofile = None
+        self.__cprofile_cnt = 0
+
+    def set_cprofile_directory(self, cprofile_directory):
+        '''When a directory is set, a cProfile dump is written for
+           each following top level phase into this directory.'''
+        self.__cprofile_directory = cprofile_directory
+
+    def set_enabled(self, enabled):
+        '''Enables the profile (when a report is written).'''
+        self.__enabled = enabled
+
+    def is_enabled(self):
+        '''Returns True if the profile report or the cProfile dumps
+           are written.'''
+        return self.__enabled or self.__cprofile_directory is not None
+
+    @contextmanager
+    def phase(self, name):
+        '''Records the time of the phase with the given name.'''
+        self.__stack.append(name)
+        path = tuple(self.__stack)
+        self.__register(path)
+        cprofile = self.__start_cprofile()
+        wall_start = _WALL_TIME()
+        cpu_start = _CPU_TIME()
+        try:
+            yield
+        finally:
+            self.__add(path, _WALL_TIME() - wall_start,
+                       _CPU_TIME() - cpu_start)
+            if cprofile is not None:
+                self.__stop_cprofile(cprofile, path)
+            self.__stack.pop()
+
+    def timed(self, name, function):
+        '''Returns a function which calls the given function and adds
+           its time to the phase with the given name below the current
+           phase.  The count of the phase is the number of calls.
+           If the profile is not enabled, the function itself is
+           returned.'''
+        if not self.is_enabled():
+            return function
+
+        def timed_function(*args):
+            '''Calls the function and records the time.'''
+            wall_start = _WALL_TIME()
+            cpu_start = _CPU_TIME()
+            try:
+                return function(*args)
+            finally:
+                path = tuple(self.__stack) + (name,)
+                self.__register(path)
+                self.__add(path, _WALL_TIME() - wall_start,
+                           _CPU_TIME() - cpu_start)
+        return timed_function
+
+    def __register(self, path):
+        '''Adds the phase with the given path (if not already there).'''
+        if path not in self.__phases:
+            self.__phases[path] = {"count": 0, "wall": 0.0, "cpu": 0.0}
+            self.__phase_order.append(path)
+
+    def __add(self, path, wall, cpu):
+        '''Adds the times to the phase with the given path.'''
+        times = self.__phases[path]
+        times["count"] += 1
+        times["wall"] += wall
+        times["cpu"] += cpu
+
+    def __start_cprofile(self):
+        '''Starts the cProfile for top level phases (cProfile can not
+           be nested).'''
+        if self.__cprofile_directory is None or self.__cprofile is not None:
+            return None
+        self.__cprofile = cProfile.Profile()
+        self.__cprofile.enable()
+        return self.__cprofile
+
+    def __stop_cprofile(self, cprofile, path):
+        '''Stops the cProfile and writes the dump.'''
+        cprofile.disable()
+        self.__cprofile = None
+        self.__cprofile_cnt += 1
+        filename = os.path.join(
+            self.__cprofile_directory, "%03d-%s.prof" % (
+                self.__cprofile_cnt,
+                re.sub(r"[^\w.-]", "_", "-".join(path))))
+        tracer.debug("Writing cProfile dump [%s]", filename)
+        cprofile.dump_stats(filename)
+
+    def get_report(self):
+        '''Returns the report: a list of all phases in the order in
+           which they were started.'''
+        return {"phases": [
+            {"name": path[-1], "path": list(path),
+             "count": self.__phases[path]["count"],
+             "wall": self.__phases[path]["wall"],
+             "cpu": self.__phases[path]["cpu"]}
+            for path in self.__phase_order]}
+
+    def write_report(self, filename):
+        '''Writes the report as JSON into the given file.'''
+        tracer.debug("Writing profile report [%s]", filename)
+        with io.open(filename, "w", encoding="utf-8") as fd:
+            fd.write(text_type(json.dumps(self.get_report(), indent=2,
+                                          sort_keys=True)))
+            fd.write("\n")
+
+
+# The global profiler instance (like the tracer).
+# pylint: disable=invalid-name
+profiler = Profiler()
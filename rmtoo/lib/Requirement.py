@@ -16,10 +16,12 @@ from enum import Enum
 from rmtoo.lib.Encoding import Encoding
 from rmtoo.lib.digraph.Digraph import Digraph
 from rmtoo.lib.BaseRMObject import BaseRMObject
-from rmtoo.lib.logging import tracer
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.FuncCall import DispatchTable
 from rmtoo.lib.InputModuleTypes import InputModuleTypes
 
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
+
 
 # pylint: disable=too-few-public-methods
 class RequirementType(Enum):
@@ -54,9 +56,9 @@ class Requirement(Digraph.Node, BaseRMObject):
 
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for Requirement.'''
-        tracer.debug("Called: name [%s]", self.name)
-        FuncCall.pcall(executor, func_prefix + "requirement", self)
-        tracer.debug("Finished: name [%s]", self.name)
+        hook = DispatchTable.get(executor, func_prefix).requirement
+        if hook is not None:
+            hook(self)
 
     # pylint: disable=too-many-arguments
     def __init__(self, content, rid, file_path, mods, config):
@@ -17,22 +17,28 @@ import io
 import json
 import os
 
-from six import iteritems, itervalues
+from six import iteritems, itervalues, string_types
+from six.moves import cPickle as pickle
 
 from rmtoo.lib.Requirement import Requirement, RequirementType
 from rmtoo.lib.Constraint import Constraint
+from rmtoo.lib.InputModuleTypes import InputModuleTypes
+from rmtoo.lib.ParallelParser import ParallelParser
 from rmtoo.lib.digraph.Digraph import Digraph
 from rmtoo.lib.storagebackend.RecordEntry import RecordEntry
-from rmtoo.lib.logging import tracer, logger
+from rmtoo.lib.logging import get_tracer, logger
+from rmtoo.lib.Profiler import profiler
 from rmtoo.lib.UsableFlag import UsableFlag
 from rmtoo.lib.CE3Set import CE3Set
 from rmtoo.lib.CE3 import CE3
 from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.digraph.TopologicalSort import topological_sort
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.FuncCall import DispatchTable
 from rmtoo.lib.GenIterator import GenIterator
 from rmtoo.lib.logging.LogFormatter import LogFormatter
 
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
+
 
 # pylint: disable=too-many-public-methods
 class RequirementSet(Digraph, UsableFlag):
@@ -55,12 +61,173 @@ class RequirementSet(Digraph, UsableFlag):
         self.__ce3set = CE3Set()
         # All the test cases for this requirement set
         self.__testcases = {}
+        # Only set while reading: parses the files in worker processes.
+        self.__parallel_parser = None
+        # The results of the parallel parser: the key is the filename,
+        # the value the parsed state and the log records.
+        self.__parsed = {}
+        # Only set while reading in incremental mode: the previous
+        # requirement set and the names of the changed files.
+        self.__incremental = None
+        # In incremental mode the (pickled) parsed state of each
+        # element is kept: the key is the filename.
+        self.__parsed_states = {}
+        # The index topic -> list of (position, requirement) - computed
+        # on demand.
+        self.__topic_index = None
         tracer.debug("Finished.")
 
     def __str__(self):
         return "Master nodes [%s]  Requirements [%s]" % \
             (self.__master_nodes, self.__requirements)
 
+    def __restore_element(self, element_class, state, rid, fileinfo,
+                          input_mods):
+        '''Creates the element from an already parsed state.'''
+        element = element_class(None, rid, fileinfo.get_filename(),
+                                input_mods, self._config)
+        element.set_parsed_state(state)
+        return element
+
+    # pylint: disable=too-many-arguments
+    def __create_element(self, element_class, type_name, tagtype,
+                         fileinfo, rid, input_mods, object_cache):
+        '''Creates the element from the content of the file.
+           If the element was already parsed by the parallel parser,
+           this result is used.
+           If the object cache has a persistent cache, the parsed state
+           is taken from there if available; newly parsed usable
+           elements are added.'''
+        if fileinfo.get_filename() in self.__parsed:
+            state, log_records = self.__parsed.pop(fileinfo.get_filename())
+            # Emit the logs from the worker at the same place where
+            # they are emitted when parsing sequentially.
+            for log_record in log_records:
+                logger.handle(log_record)
+            return self.__restore_element(element_class, state, rid,
+                                          fileinfo, input_mods)
+
+        file_content = fileinfo.get_content()
+        if not object_cache.is_persistent():
+            return element_class(file_content, rid, fileinfo.get_filename(),
+                                 input_mods, self._config)
+
+        pkey = object_cache.create_persistent_key(
+            type_name, file_content,
+            list(input_mods.get_tagtype(tagtype).keys()))
+        state = object_cache.get_persistent(pkey)
+        if state is not None:
+            tracer.debug("Parsed state of [%s] found in persistent cache",
+                         rid)
+            return self.__restore_element(element_class, state, rid,
+                                          fileinfo, input_mods)
+
+        element = element_class(file_content, rid, fileinfo.get_filename(),
+                                input_mods, self._config)
+        # Elements with errors are not stored: the error messages
+        # must be shown in each run.
+        if element.is_usable():
+            object_cache.add_persistent(pkey, element.get_parsed_state())
+        return element
+
+    def __get_unchanged_state(self, fileinfo):
+        '''In incremental mode returns the pickled parsed state of the
+           element from the previous requirement set if the file did
+           not change.  Otherwise None is returned.'''
+        if self.__incremental is None:
+            return None
+        previous_set, changed_files = self.__incremental
+        if previous_set is None or changed_files is None \
+           or fileinfo.get_filename() in changed_files:
+            return None
+        return previous_set.get_parsed_state_snapshot(
+            fileinfo.get_filename())
+
+    def __is_reusable(self, fileinfo, type_name, object_cache):
+        '''Returns True if the element needs not to be parsed.'''
+        if self.__incremental is not None:
+            return self.__get_unchanged_state(fileinfo) is not None
+        return object_cache.contains(type_name, fileinfo.get_vcs_id())
+
+    # pylint: disable=too-many-arguments
+    def __get_element(self, fileinfo, element_class, type_name, tagtype,
+                      rid, input_mods, object_cache):
+        '''Returns the element for the given file info.
+           In incremental mode unchanged elements are restored from the
+           parsed state of the previous requirement set: each
+           requirement set gets its own objects.
+           Otherwise the objects are shared using the object cache.'''
+        if self.__incremental is None:
+            vcs_id = fileinfo.get_vcs_id()
+            element = object_cache.get(type_name, vcs_id)
+            if element is None:
+                element = self.__create_element(
+                    element_class, type_name, tagtype,
+                    fileinfo, rid, input_mods, object_cache)
+                # Add the element to the cache.
+                object_cache.add(vcs_id, type_name, element)
+            return element
+
+        state = self.__get_unchanged_state(fileinfo)
+        if state is not None:
+            tracer.debug("Reusing unchanged [%s]", rid)
+            element = self.__restore_element(
+                element_class, pickle.loads(state), rid, fileinfo,
+                input_mods)
+        else:
+            element = self.__create_element(
+                element_class, type_name, tagtype,
+                fileinfo, rid, input_mods, object_cache)
+            state = pickle.dumps(element.get_parsed_state(),
+                                 pickle.HIGHEST_PROTOCOL)
+        self.__parsed_states[fileinfo.get_filename()] = state
+        return element
+
+    def get_parsed_state_snapshot(self, filename):
+        '''Returns the pickled parsed state of the element which was
+           read from the given file - or None if not available.
+           This is only available for sets read in incremental mode.'''
+        return self.__parsed_states.get(filename)
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def __parse_parallel(self, fileinfos, file_suffix, element_class,
+                         type_name, tagtype, input_mods, object_cache):
+        '''If configured, parse all the elements which are neither in
+           the object cache nor in the persistent cache with the help
+           of the parallel parser.  The results are stored and used
+           by __create_element.'''
+        if self.__parallel_parser is None:
+            return
+        jobs = []
+        job_infos = []
+        for fileinfo in fileinfos:
+            if not fileinfo.get_filename().endswith(file_suffix) \
+               or self.__is_reusable(fileinfo, type_name, object_cache):
+                continue
+            file_content = fileinfo.get_content()
+            rid = fileinfo.get_filename_sub_part()[:-4]
+            pkey = None
+            if object_cache.is_persistent():
+                pkey = object_cache.create_persistent_key(
+                    type_name, file_content,
+                    list(input_mods.get_tagtype(tagtype).keys()))
+                state = object_cache.get_persistent(pkey)
+                if state is not None:
+                    self.__parsed[fileinfo.get_filename()] = (state, [])
+                    continue
+            jobs.append((file_content, rid, fileinfo.get_filename()))
+            job_infos.append((fileinfo.get_filename(), pkey))
+
+        results = self.__parallel_parser.parse(element_class, jobs)
+        if results is None:
+            return
+        for (filename, pkey), (state, log_records) \
+                in zip(job_infos, results):
+            # The last element of the state is the usable flag.
+            if pkey is not None and state[-1]:
+                object_cache.add_persistent(pkey, state)
+            self.__parsed[filename] = (state, log_records)
+
     def __read_one_requirement(self, fileinfo, input_mods, object_cache):
         '''Read in one requirement from the file info.'''
         tracer.debug("Called.")
@@ -68,18 +235,11 @@ class RequirementSet(Digraph, UsableFlag):
         if not fileinfo.get_filename().endswith(".req"):
             tracer.info("skipping file [%s]", fileinfo.get_filename())
             return
-        # Handle caching.
-        vcs_id = fileinfo.get_vcs_id()
         rid = fileinfo.get_filename_sub_part()[:-4]
-        req = object_cache.get("Requirement", vcs_id)
         tracer.info("Reading requirement [%s]", rid)
-
-        if req is None:
-            file_content = fileinfo.get_content()
-            req = Requirement(file_content, rid, fileinfo.get_filename(),
-                              input_mods, self._config)
-            # Add the requirement to the cache.
-            object_cache.add(vcs_id, "Requirement", req)
+        req = self.__get_element(fileinfo, Requirement, "Requirement",
+                                 InputModuleTypes.reqtag, rid, input_mods,
+                                 object_cache)
 
         self._adapt_usablility(req)
 
@@ -100,6 +260,9 @@ class RequirementSet(Digraph, UsableFlag):
         '''Read in all the requirements from the input handler.'''
         tracer.debug("Called.")
         fileinfos = input_handler.get_file_infos(commit, "requirements")
+        self.__parse_parallel(fileinfos, ".req", Requirement, "Requirement",
+                              InputModuleTypes.reqtag, input_mods,
+                              object_cache)
         for fileinfo in fileinfos:
             self.__read_one_requirement(fileinfo, input_mods, object_cache)
         tracer.debug("Finished.")
@@ -109,7 +272,8 @@ class RequirementSet(Digraph, UsableFlag):
            class Requirement - but with one major difference: for this
            implementation stop if an error occurred.'''
         for module in input_mods.get_reqdeps_sorted():
-            state = module.rewrite(self)
+            with profiler.phase("reqdeps:" + type(module).__name__):
+                state = module.rewrite(self)
             if state is False:
                 # Some semantic error occurred.
                 self._set_not_usable()
@@ -165,18 +329,11 @@ class RequirementSet(Digraph, UsableFlag):
         if not fileinfo.get_filename().endswith(file_suffix):
             tracer.info("skipping file [%s]", fileinfo.get_filename())
             return None
-        # Handle caching.
-        vcs_id = fileinfo.get_vcs_id()
         rid = fileinfo.get_filename_sub_part()[:-4]
-        ctr = object_cache.get("Constraint", vcs_id)
-        tracer.info("Reading constraint [%s]", rid)
-
-        if ctr is None:
-            file_content = fileinfo.get_content()
-            element = Constraint(file_content, rid, fileinfo.get_filename(),
-                                 input_mods, self._config)
-            # Add the requirement to the cache.
-            object_cache.add(vcs_id, type_name, element)
+        tracer.info("Reading %s [%s]", type_name, rid)
+        element = self.__get_element(fileinfo, Constraint, type_name,
+                                     InputModuleTypes.ctstag, rid,
+                                     input_mods, object_cache)
 
         self._adapt_usablility(element)
         tracer.debug("Finished.")
@@ -205,6 +362,9 @@ class RequirementSet(Digraph, UsableFlag):
         '''Read in all the constraints from the input handler.'''
         tracer.debug("Called.")
         fileinfos = input_handler.get_file_infos(commit, "constraints")
+        self.__parse_parallel(fileinfos, ".ctr", Constraint, "Constraint",
+                              InputModuleTypes.ctstag, input_mods,
+                              object_cache)
         for fileinfo in fileinfos:
             self.__read_one_constraint(fileinfo, input_mods, object_cache)
         tracer.debug("Finished.")
@@ -233,6 +393,9 @@ class RequirementSet(Digraph, UsableFlag):
         '''Read in all the testcases from the input handler.'''
         tracer.debug("Called.")
         fileinfos = input_handler.get_file_infos(commit, "testcases")
+        self.__parse_parallel(fileinfos, ".tec", Constraint, "TestCase",
+                              InputModuleTypes.ctstag, input_mods,
+                              object_cache)
         for fileinfo in fileinfos:
             self.__read_one_testcase(fileinfo, input_mods, object_cache)
         tracer.debug("Finished.")
@@ -241,24 +404,55 @@ class RequirementSet(Digraph, UsableFlag):
                           object_cache):
         '''Reads in all the requirements from the input_handler.'''
         tracer.debug("Called; reading requirements.")
-        self.__read_all_requirements(input_handler, commit, input_mods,
-                                     object_cache)
-
-        tracer.debug("Reading constrains.")
-        self.__read_all_constraints(input_handler, commit, input_mods,
-                                    object_cache)
-
-        tracer.debug("Reading test cases.")
-        self.__read_all_testcases(input_handler, commit, input_mods,
-                                  object_cache)
+        self.__parallel_parser = ParallelParser.create_from_config(
+            self._config, input_mods)
+        try:
+            with profiler.phase("parse"):
+                self.__read_all_requirements(input_handler, commit,
+                                             input_mods, object_cache)
+
+                tracer.debug("Reading constrains.")
+                self.__read_all_constraints(input_handler, commit,
+                                            input_mods, object_cache)
+
+                tracer.debug("Reading test cases.")
+                self.__read_all_testcases(input_handler, commit,
+                                          input_mods, object_cache)
+        finally:
+            if self.__parallel_parser is not None:
+                self.__parallel_parser.close()
+                self.__parallel_parser = None
 
         self._handle_modules(input_mods)
         tracer.debug("Finished.")
 
+    # pylint: disable=too-many-arguments
+    def read_requirements_incremental(self, input_handler, commit,
+                                      input_mods, object_cache,
+                                      previous_set, changed_files):
+        '''Reads in all the requirements in incremental mode:
+           the elements of all files which are not in the given set of
+           changed files are restored from the previous requirement set
+           (without reading or parsing the file again); only the
+           changed files are parsed.  If previous_set or changed_files
+           is None, all files are parsed.
+           The requirement set modules (dependencies, priorities, CE3)
+           are always run on the complete set, because their results
+           are propagated along the graph.'''
+        tracer.debug("Called; changed files [%s]", changed_files)
+        self.__incremental = (previous_set, changed_files)
+        try:
+            self.read_requirements(input_handler, commit, input_mods,
+                                   object_cache)
+        finally:
+            self.__incremental = None
+        tracer.debug("Finished.")
+
     def add_requirement(self, req):
         '''Add requirement to the internal container.'''
         tracer.debug("Add requirement [%s]", req.get_id())
         self.__requirements[req.get_id()] = req
+        self.__topic_index = None
 
     def add_constraint(self, ctr):
         '''Add constraint to the internal container.'''
@@ -298,28 +492,54 @@ class RequirementSet(Digraph, UsableFlag):
                 restricted_reqs.add_testcase(self.__testcases[testcase])
         return restricted_reqs
 
+    def __get_topic_index(self):
+        '''Returns the index topic -> list of (position, requirement).
+           The position is the position of the requirement in the
+           requirement map: it is used to keep the order.'''
+        if self.__topic_index is None:
+            tracer.debug("Building topic index.")
+            self.__topic_index = {}
+            for pos, req in enumerate(self.__requirements.values()):
+                self.__topic_index.setdefault(req.get_topic(), []).append(
+                    (pos, req))
+        return self.__topic_index
+
     def restrict_to_topics(self, topic_set):
         '''Restrict the list (dictionary) of requirements to the given
            topic set - i.e. only requirements are returned which belong to
-           one of the topics in the topic set.'''
+           one of the topics in the topic set.
+           The topic set can also be the name of one topic.
+           The requirements are looked up in the topic index which is
+           built once; the CE3s, constraints and testcases are shared
+           with this requirement set.'''
         tracer.debug("Called.")
+        if isinstance(topic_set, string_types):
+            topic_set = [topic_set]
+        topic_index = self.__get_topic_index()
+        reqs = []
+        for topic in set(topic_set):
+            reqs.extend(topic_index.get(topic, []))
+        reqs.sort(key=lambda pos_req: pos_req[0])
+
         restricted_reqs = RequirementSet(self._config)
-        for req in self.__requirements.values():
-            if req.get_topic() in topic_set:
-                restricted_reqs = self.__restrict_to_topics_one_req(
-                    restricted_reqs, req)
+        for _, req in reqs:
+            restricted_reqs = self.__restrict_to_topics_one_req(
+                restricted_reqs, req)
         return restricted_reqs
 
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for RequirementSet.'''
+        dispatch = DispatchTable.get(executor, func_prefix)
         tracer.debug("calling pre")
-        FuncCall.pcall(executor, func_prefix + "requirement_set_pre", self)
+        if dispatch.requirement_set_pre is not None:
+            dispatch.requirement_set_pre(self)
         tracer.debug("calling sub requirement set")
         for requirement in executor.requirement_set_sort(
                 self.__requirements.values()):
             requirement.execute(executor, func_prefix)
         tracer.debug("calling post")
-        FuncCall.pcall(executor, func_prefix + "requirement_set_post", self)
+        if dispatch.requirement_set_post is not None:
+            dispatch.requirement_set_post(self)
         tracer.debug("finished")
 
     def __resolve_solved_by_one_req_deps(self, req):
@@ -22,6 +22,7 @@ from rmtoo.lib.Analytics import Analytics
 from rmtoo.lib.Output import Output
 from rmtoo.lib.main.MainHelper import MainHelper
 from rmtoo.lib.logging import configure_logging
+from rmtoo.lib.Profiler import profiler
 
 
 def execute_cmds(config, input_mods, _mstdout, mstderr):
@@ -30,7 +31,8 @@ def execute_cmds(config, input_mods, _mstdout, mstderr):
        Please note: there is no 'ONE' latest continuum any more
        - but a list.'''
     try:
-        topic_continuum_set = TopicContinuumSet(input_mods, config)
+        with profiler.phase("read"):
+            topic_continuum_set = TopicContinuumSet(input_mods, config)
     except RMTException as rmte:
         mstderr.write("+++ ERROR: Problem reading in the continuum [%s]\n"
                       % Encoding.to_unicode(rmte))
@@ -49,18 +51,25 @@ def execute_cmds(config, input_mods, _mstdout, mstderr):
     cmad_filename = config.get_value_wo_throw(
         'actions.create_makefile_dependencies')
     if cmad_filename is not None:
-        Output.execute(config, topic_continuum_set, mstderr, "cmad_")
+        with profiler.phase("output"):
+            Output.execute(config, topic_continuum_set, mstderr, "cmad_")
         return True
 
     # The requirements are syntactically correct now: therefore it is
     # possible to do some analytics on them.
     # Note that analytics are only run on the latest version.
-    if not Analytics.execute(config, topic_continuum_set, mstderr):
+    with profiler.phase("analytics"):
+        analytics_success = Analytics.execute(config, topic_continuum_set,
+                                              mstderr)
+    if not analytics_success:
         if config.get_bool('processing.analytics.stop_on_errors', True):
             return False
 
     # Output everything
-    Output.execute(config, topic_continuum_set, mstderr, "")
+    with profiler.phase("output"):
+        if not Output.execute(config, topic_continuum_set, mstderr, ""):
+            mstderr.write("+++ ERROR: there were errors during output.\n")
+            return False
     return True
 
 
@@ -69,9 +78,18 @@ def main_func(args, mstdout, mstderr):
        o get config
        o set up logging
        o do everything'''
+    profiler.reset()
     config, input_mods = MainHelper.main_setup(args, mstdout, mstderr)
     configure_logging(config, mstderr)
-    return execute_cmds(config, input_mods, mstdout, mstderr)
+    profiler.set_cprofile_directory(config.get_value_wo_throw(
+        'actions.profile.cprofile_directory'))
+    profile_filename = config.get_value_wo_throw('actions.profile.filename')
+    profiler.set_enabled(profile_filename is not None)
+    try:
+        return execute_cmds(config, input_mods, mstdout, mstderr)
+    finally:
+        if profile_filename is not None:
+            profiler.write_report(profile_filename)
 
 
 def main_impl(args, mstdout, mstderr, mainfunc=main_func, exitfun=sys.exit):
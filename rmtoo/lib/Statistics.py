@@ -10,6 +10,8 @@
 '''
 
 import datetime
+
+import numpy
 from scipy import stats
 
 from rmtoo.lib.RequirementStatus import RequirementStatusNotDone, \
@@ -20,32 +22,36 @@ from rmtoo.lib.ClassType import ClassTypeSelected
 class Statistics(object):
     """Statistics handling"""
 
-    # pylint: disable=too-many-arguments
-    @staticmethod
-    def inc_stats(result_vec, start_date, idx, invented_on, today, efe):
-        """Increment statistics for the given time period"""
-        start_index = (invented_on - start_date).days
-        end_index = (today - start_date).days
-        for i in range(start_index, end_index + 1):
-            result_vec[i][idx] += efe
-
-    @staticmethod
-    def prepare_result_vector(start_date, end_date):
-        """Prepares a statistics result vector for the given time period"""
-        result_vec = []
-        diff = end_date - start_date
-        diff_in_days = diff.days
-
-        for _ in range(0, diff_in_days + 1):
-            result_vec.append([0, 0, 0])
-        return result_vec
+    # The result vectors of get_units() and get_units_sprint() by
+    # kind, requirement set and time period: all outputs which need the
+    # same statistics share one result vector.
+    __units_cache = {}
 
     @staticmethod
     def get_units_generic(rset, start_date, end_date, skip_requirement):
         """Run through the requirements and count the not done
         depending on the date.
+        Returns an array with one row for each day: the units which
+        are not done, assigned and finished.  For each requirement the
+        effort estimation is added at the first day and subtracted
+        after the last day of its time periods; the cumulative sum of
+        these deltas is the result.
         """
-        result_vec = Statistics.prepare_result_vector(start_date, end_date)
+        days = (end_date - start_date).days + 1
+        firsts = []
+        lasts = []
+        columns = []
+        efes = []
+
+        def add_period(column, first_date, last_date, efe):
+            """Adds the efe to the column for the given time period"""
+            first = (first_date - start_date).days
+            last = min((last_date - start_date).days, days - 1)
+            if first <= last:
+                firsts.append(first)
+                lasts.append(last)
+                columns.append(column)
+                efes.append(efe)
 
         for _, req in rset.get_requirements_iteritems():
             invented_on = req.get_value("Invented on")
@@ -67,9 +73,7 @@ class Statistics(object):
                 # Only count those which are implementable
                 #                rclass = req.get_value("Class")
                 if req.get_value("Class").is_implementable():
-                    Statistics.inc_stats(
-                        result_vec, start_date, 0, invented_on,
-                        end_date, efe)
+                    add_period(0, invented_on, end_date, efe)
             elif isinstance(status, RequirementStatusAssigned):
                 assigned_date = status.get_date()
 
@@ -79,11 +83,9 @@ class Statistics(object):
                 adm1 = assigned_date - datetime.timedelta(1)
 
                 # Count from start_date until it was assigned as open:
-                Statistics.inc_stats(result_vec, start_date, 0, start_date,
-                                     adm1, efe)
+                add_period(0, start_date, adm1, efe)
                 # Count from assigned date until end_date as assigned
-                Statistics.inc_stats(result_vec, start_date, 1, assigned_date,
-                                     end_date, efe)
+                add_period(1, assigned_date, end_date, efe)
 
             elif isinstance(status, RequirementStatusFinished):
                 finished_date = status.get_date()
@@ -97,12 +99,34 @@ class Statistics(object):
                 adm1 = finished_date - datetime.timedelta(1)
 
                 # Count from start_date until it was finished as open:
-                Statistics.inc_stats(result_vec, start_date, 0, start_date,
-                                     adm1, efe)
+                add_period(0, start_date, adm1, efe)
                 # Count from assigned date until end_date as assigned
-                Statistics.inc_stats(result_vec, start_date, 2, finished_date,
-                                     end_date, efe)
-        return result_vec
+                add_period(2, finished_date, end_date, efe)
+
+        deltas = numpy.zeros((days + 1, 3), dtype=numpy.int64)
+        columns = numpy.array(columns, dtype=numpy.intp)
+        efes = numpy.array(efes, dtype=numpy.int64)
+        numpy.add.at(deltas, (numpy.array(firsts, dtype=numpy.intp),
+                              columns), efes)
+        numpy.subtract.at(deltas, (numpy.array(lasts, dtype=numpy.intp) + 1,
+                                   columns), efes)
+        return numpy.cumsum(deltas[:days], axis=0)
+
+    @staticmethod
+    def __get_shared_units(kind, rset, start_date, end_date,
+                           skip_requirement):
+        """Returns the (read only) result vector which is shared between
+        all callers with the same kind, requirement set and period."""
+        key = (kind, id(rset), start_date, end_date)
+        cached = Statistics.__units_cache.get(key)
+        # The requirement set is stored to detect a reused id.
+        if cached is None or cached[0] is not rset:
+            result_vec = Statistics.get_units_generic(
+                rset, start_date, end_date, skip_requirement)
+            result_vec.flags.writeable = False
+            cached = (rset, result_vec)
+            Statistics.__units_cache[key] = cached
+        return cached[1]
 
     @staticmethod
     def get_units(rset, start_date, end_date):
@@ -111,8 +135,8 @@ class Statistics(object):
         def _skip_never(_):
             return False
 
-        return Statistics.get_units_generic(rset, start_date,
-                                            end_date, _skip_never)
+        return Statistics.__get_shared_units("units", rset, start_date,
+                                             end_date, _skip_never)
 
     @staticmethod
     def get_units_sprint(rset, start_date, end_date):
@@ -121,8 +145,8 @@ class Statistics(object):
         def _skip_not_selected(req):
             return not isinstance(req.get_value("Class"), ClassTypeSelected)
 
-        return Statistics.get_units_generic(rset, start_date, end_date,
-                                            _skip_not_selected)
+        return Statistics.__get_shared_units("sprint", rset, start_date,
+                                             end_date, _skip_not_selected)
 
     @staticmethod
     def _output_stat_files_stats(filename, start_date, result_vec):
@@ -142,8 +166,8 @@ class Statistics(object):
         # x, y and d are completely sensible names here
         # pylint: disable=invalid-name
         with open(filename + ".est", "w") as eofile:
-            x = list(i for i in range(0, len(result_vec)))
-            y = list(x[0] + x[1] for x in result_vec)
+            x = numpy.arange(len(result_vec))
+            y = result_vec[:, 0] + result_vec[:, 1]
 
             gradient, intercept, _r_value, _p_value, _std_err \
                 = stats.linregress(x, y)
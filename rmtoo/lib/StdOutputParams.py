@@ -14,7 +14,9 @@ import datetime
 
 from rmtoo.lib.DateUtils import parse_date
 from rmtoo.lib.configuration.Cfg import Cfg
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
 
 
 # This is a base class - so no public methods
@@ -23,6 +25,10 @@ class StdOutputParams(object):
     '''Handles the standard output parameters and sets the values
        in the self object provided.'''
 
+    # Outputs whose content depends on the start and end date set this:
+    # the dates are then part of the digest in the build manifest.
+    uses_dates = False
+
     def __init__(self, config):
         '''Constructs the standard output parameters based on the
            provided config.'''
@@ -46,14 +52,21 @@ class StdOutputParams(object):
             return default_value
         return parse_date(name, pname)
 
-    def __parse_start_and_end_date(self):
-        '''Extracts the start and the end date from the params.'''
+    @staticmethod
+    def get_start_and_end_date(cfg):
+        '''Returns the start and the end date of the given output
+           configuration.  If not configured, the start date is
+           yesterday and the end date is today.'''
         today = datetime.date.today()
         yesterday = today - datetime.timedelta(1)
-        self._start_date = self.__parse_date(
-            self._config, 'start_date', yesterday)
+        return (StdOutputParams.__parse_date(cfg, 'start_date', yesterday),
+                StdOutputParams.__parse_date(cfg, 'end_date', today))
+
+    def __parse_start_and_end_date(self):
+        '''Extracts the start and the end date from the params.'''
+        self._start_date, self._end_date = \
+            self.get_start_and_end_date(self._config)
         tracer.debug("Start date [%s]", self._start_date)
-        self._end_date = self.__parse_date(self._config, 'end_date', today)
         tracer.debug("End date [%s]", self._end_date)
 
     def __parse(self):
@@ -10,7 +10,9 @@
 '''
 from six import iteritems
 
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 def collect(topic_set):
@@ -15,8 +15,10 @@ from rmtoo.lib.Encoding import Encoding
 from rmtoo.lib.storagebackend.txtfile.TxtRecord import TxtRecord
 from rmtoo.lib.digraph.Digraph import Digraph
 from rmtoo.lib.RMTException import RMTException
-from rmtoo.lib.logging import tracer
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.FuncCall import DispatchTable
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 class Topic(Digraph.Node):
@@ -87,37 +89,40 @@ class Topic(Digraph.Node):
 
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for TopicsContinuum.'''
+        dispatch = DispatchTable.get(executor, func_prefix)
         tracer.debug("Calling pre [%s]", self.name)
-        FuncCall.pcall(executor, func_prefix + "topic_pre", self)
+        if dispatch.topic_pre is not None:
+            dispatch.topic_pre(self)
         tracer.debug("Calling sub [%s]", self.name)
         for tag in self.__tags:
             rtag = tag.get_tag()
             if rtag == "Name":
-                FuncCall.pcall(executor, func_prefix + "topic_name",
-                               tag.get_content())
+                if dispatch.topic_name is not None:
+                    dispatch.topic_name(tag.get_content())
                 continue
             if rtag == "SubTopic":
                 subtopic = self.__digraph.find(tag.get_content())
                 assert subtopic is not None
-                FuncCall.pcall(executor, func_prefix + "topic_sub_pre",
-                               subtopic)
+                if dispatch.topic_sub_pre is not None:
+                    dispatch.topic_sub_pre(subtopic)
                 subtopic.execute(executor, func_prefix)
-                FuncCall.pcall(executor, func_prefix + "topic_sub_post",
-                               subtopic)
+                if dispatch.topic_sub_post is not None:
+                    dispatch.topic_sub_post(subtopic)
                 continue
             if rtag == "IncludeRequirements":
                 self.__requirements.execute(executor, func_prefix)
                 continue
             if rtag == "Text":
-                FuncCall.pcall(executor, func_prefix + "topic_text",
-                               tag.get_content())
+                if dispatch.topic_text is not None:
+                    dispatch.topic_text(tag.get_content())
                 continue
 
             raise RMTException(114, "Unknown tag in topic [%s]" % rtag,
                                self.name)
 
         tracer.debug("Calling post [%s]", self.name)
-        FuncCall.pcall(executor, func_prefix + "topic_post", self)
+        if dispatch.topic_post is not None:
+            dispatch.topic_post(self)
         tracer.debug("Finished [%s]", self.name)
 
     def get_requirement_set(self):
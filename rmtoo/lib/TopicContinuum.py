@@ -17,13 +17,19 @@
 '''
 from __future__ import unicode_literals
 
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.Profiler import profiler
+from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.UsableFlag import UsableFlag
 from rmtoo.lib.TopicSet import TopicSet
 from rmtoo.lib.vcs.Factory import Factory
 from rmtoo.lib.TopicSetWCI import TopicSetWCI
 from rmtoo.lib.vcs.CommitInfo import CommitInfo
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.vcs.CommitSampler import CommitSampler
+from rmtoo.lib.FuncCall import DispatchTable
+from rmtoo.lib.ExecutorMultiplexer import ExecutorMultiplexer
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
 
 
 class TopicContinuum(UsableFlag):
@@ -53,31 +59,73 @@ class TopicContinuum(UsableFlag):
         self.__ts_config = ts_config
         tracer.debug("Finished; topic set count [%d]", len(self.__topic_sets))
 
+    def __read_commit(self, input_handler, commit, previous=None):
+        '''Reads the TopicSet for the given commit.
+           Returns the commit info, the TopicSetWCI and the TopicSet.'''
+        tracer.debug("Handling commit [%s]", commit)
+        topic_set_vcs_id = \
+            input_handler.get_vcs_id_with_type(commit, "topics")
+        tracer.debug("Read topics with oid [%s]", topic_set_vcs_id)
+        # The topic set contains the requirements, constraints and test
+        # cases: each of them may change without a change of the topics.
+        cache_key = TopicSet.get_inputs_vcs_id(
+            input_handler, commit, TopicSet.input_dir_types)
+        topic_set = self.__object_cache.get("TopicSet", cache_key)
+
+        if topic_set is None:
+            tracer.debug("TopicSet with ID [%s] not in cache", cache_key)
+            with profiler.phase("commit:%s" % (
+                    "filesystem" if commit is None else commit)):
+                topic_set = TopicSet(self._config, input_handler, commit,
+                                     self.__object_cache,
+                                     self.__input_mods, previous)
+            self.__object_cache.add(cache_key, "TopicSet", topic_set)
+            self._adapt_usablility(topic_set)
+
+        commit_info = CommitInfo(input_handler, commit, topic_set_vcs_id)
+        tswci = TopicSetWCI(topic_set, commit_info)
+        return commit_info, tswci, topic_set
+
     def __read_commits(self, input_handler, commits):
         '''Creates a TopicSet for each commit with the help of
            the input_handler.'''
         tracer.debug("Called.")
         for commit in commits:
-            tracer.debug("Handling commit [%s]", commit)
-            topic_set_vcs_id = \
-                input_handler.get_vcs_id_with_type(commit, "topics")
-            tracer.debug("Read topics with oid [%s]", topic_set_vcs_id)
-            topic_set = self.__object_cache.get("TopicSet", topic_set_vcs_id)
-
-            if topic_set is None:
-                tracer.debug("TopicSet with ID [%s] not in cache",
-                             topic_set_vcs_id)
-                topic_set = TopicSet(self._config, input_handler, commit,
-                                     self.__object_cache, self.__input_mods)
-                self.__object_cache.add(topic_set_vcs_id,
-                                        "TopicSet", topic_set)
-                self._adapt_usablility(topic_set)
-
-            commit_info = CommitInfo(input_handler, commit, topic_set_vcs_id)
-            tswci = TopicSetWCI(topic_set, commit_info)
-            tracer.debug("Add topic set [%s]", topic_set_vcs_id)
+            commit_info, tswci, _ = self.__read_commit(input_handler, commit)
+            tracer.debug("Add topic set [%s]", commit_info.get_vcs_id())
             self.__continuum_add(commit_info, tswci)
-            tracer.debug("Finished.")
+        tracer.debug("Finished.")
+
+    def __read_commits_incremental(self, input_handler, commits):
+        '''Creates a TopicSet for each commit - starting with the
+           oldest one.  The requirements of each commit are read in
+           incrementally: only the files which changed since the previous
+           commit are parsed.
+           The result is the same as the one of __read_commits().'''
+        tracer.debug("Called.")
+        read_commits = []
+        previous_topic_set = None
+        # The commits are returned newest first.
+        for commit in reversed(list(commits)):
+            previous = None
+            if previous_topic_set is not None \
+               and previous_topic_set.get_complete_requirement_set() \
+               is not None:
+                # The previous topic set may come from the object cache
+                # and be read from an older commit: the changes are
+                # computed from the commit it was read from.
+                previous = (previous_topic_set,
+                            input_handler.get_changed_files(
+                                previous_topic_set.get_commit(), commit))
+            commit_info, tswci, topic_set = self.__read_commit(
+                input_handler, commit, previous)
+            read_commits.append((commit_info, tswci))
+            previous_topic_set = topic_set
+        # Add in the same order as __read_commits(): newest first.
+        for commit_info, tswci in reversed(read_commits):
+            tracer.debug("Add topic set [%s]", commit_info.get_vcs_id())
+            self.__continuum_add(commit_info, tswci)
+        tracer.debug("Finished.")
 
     def __read_topic_sets(self, ts_config):
         '''Reads in all the topic sets from the specified sources.'''
@@ -86,8 +134,15 @@ class TopicContinuum(UsableFlag):
             input_handler = Factory.create(source[0], source[1])
             if input_handler is None:
                 continue
+            source_cfg = Cfg(source[1])
             commits = input_handler.get_commits()
-            self.__read_commits(input_handler, commits)
+            sampler = CommitSampler.create_from_config(source_cfg)
+            if sampler is not None:
+                commits = sampler.sample(input_handler, commits)
+            if source_cfg.get_bool("incremental", False):
+                self.__read_commits_incremental(input_handler, commits)
+            else:
+                self.__read_commits(input_handler, commits)
         tracer.debug("Finished.")
 
     def __continuum_add(self, commit_info, topic_set_wci):
@@ -98,15 +153,28 @@ class TopicContinuum(UsableFlag):
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for TopicsContinuum.'''
         tracer.debug("Calling pre [%s]", self.__name)
-        FuncCall.pcall(executor, func_prefix + "topic_continuum_pre", self)
+        dispatch = DispatchTable.get(executor, func_prefix)
+        if dispatch.topic_continuum_pre is not None:
+            dispatch.topic_continuum_pre(self)
         tracer.debug("Calling sub [%s]", self.__name)
         for topic_set in executor.topic_continuum_sort(
                 self.__vcs_commit_ids, self.__topic_sets):
             topic_set.execute(executor, func_prefix)
         tracer.debug("Calling post [%s]", self.__name)
-        FuncCall.pcall(executor, func_prefix + "topic_continuum_post", self)
+        if dispatch.topic_continuum_post is not None:
+            dispatch.topic_continuum_post(self)
         tracer.debug("Finished [%s]", self.__name)
 
+    def execute_multiplexed(self, executors, func_prefix, names=None):
+        '''Execute the given executors: the executors which use the
+           same order are executed together with one walk.  The time
+           of each executor is recorded in the profiler phase with
+           the given name.'''
+        for multiplexer in ExecutorMultiplexer.create_groups(
+                executors, self.__vcs_commit_ids, self.__topic_sets,
+                names):
+            self.execute(multiplexer, func_prefix)
+
     def get_output_config(self):
         """Returns the configuration for the output."""
         return self.__ts_config["output"]
@@ -15,11 +15,14 @@ from __future__ import unicode_literals
 
 from six import iteritems
 
+from rmtoo.lib.CE3 import CE3
 from rmtoo.lib.TopicContinuum import TopicContinuum
 from rmtoo.lib.logging import tracer
+from rmtoo.lib.Profiler import profiler
 from rmtoo.lib.vcs.ObjectCache import ObjectCache
+from rmtoo.lib.vcs.PersistentCache import PersistentCache
 from rmtoo.lib.UsableFlag import UsableFlag
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.FuncCall import DispatchTable
 from rmtoo.lib.GenIterator import GenIterator
 
 
@@ -37,10 +40,13 @@ class TopicContinuumSet(UsableFlag):
         # available in the configured time period.
         self.__continuum = {}
         # Store objects with IDs also in the cache - so that they
-        # can be reused.
-        self.__object_cache = ObjectCache()
+        # can be reused.  If configured, the parsed objects are also
+        # stored on disk to be reused by later runs.
+        self.__object_cache = ObjectCache(
+            PersistentCache.create_from_config(self._config))
         self.__init_continuum_set()
         self.__object_cache.log_stats()
+        CE3.code_cache.log_stats()
         tracer.debug("Finished.")
 
     def __init_continuum_set(self):
@@ -50,8 +56,10 @@ class TopicContinuumSet(UsableFlag):
         tracer.debug("Called.")
         # Step through all the available topic sets.
         for ts_name, ts_config in iteritems(self._config.get_value("topics")):
-            topic_cont = TopicContinuum(ts_name, self._config, ts_config,
-                                        self.__object_cache, self.__input_mods)
+            with profiler.phase("continuum:" + ts_name):
+                topic_cont = TopicContinuum(
+                    ts_name, self._config, ts_config,
+                    self.__object_cache, self.__input_mods)
             self.__continuum[ts_name] = topic_cont
             self._adapt_usablility(topic_cont)
         tracer.debug("Finished; count [%d]", len(self.__continuum))
@@ -59,14 +67,16 @@ class TopicContinuumSet(UsableFlag):
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for TopicsContinuumSet.'''
         tracer.debug("Calling pre.")
-        FuncCall.pcall(executor, func_prefix + 'topic_continuum_set_pre', self)
+        dispatch = DispatchTable.get(executor, func_prefix)
+        if dispatch.topic_continuum_set_pre is not None:
+            dispatch.topic_continuum_set_pre(self)
         tracer.debug("Calling sub.")
         for continuum in executor.topic_continuum_set_sort(
                 self.__continuum.values()):
             continuum.execute(executor, func_prefix)
         tracer.debug("Calling Post")
-        FuncCall.pcall(executor, func_prefix + 'topic_continuum_set_post',
-                       self)
+        if dispatch.topic_continuum_set_post is not None:
+            dispatch.topic_continuum_set_post(self)
         tracer.debug("Finished.")
 
     def get_continuum_dict(self):
@@ -12,9 +12,14 @@
 '''
 from rmtoo.lib.Topic import Topic
 from rmtoo.lib.digraph.Digraph import Digraph
+from rmtoo.lib.digraph.Reachability import Reachability
 from rmtoo.lib.RequirementSet import RequirementSet
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.Profiler import profiler
 from rmtoo.lib.UsableFlag import UsableFlag
+from rmtoo.lib.vcs.ObjectCache import ObjectCache
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 # pylint: disable=too-many-instance-attributes
@@ -22,10 +27,32 @@ class TopicSet(Digraph, UsableFlag):
     '''A Collection of Topics.
        With other words: a hierarchy of requirements.'''
 
+    # The types of the directories the content is read from.
+    input_dir_types = ("requirements", "topics", "constraints", "testcases")
+    # The types of the directories the requirement set is read from.
+    requirement_set_dir_types = ("requirements", "constraints", "testcases")
+
+    @staticmethod
+    def get_inputs_vcs_id(input_handler, commit, dir_types):
+        '''Returns the VCS id of the content of the directories of the
+           given types.  Types without configured directories are
+           skipped.'''
+        vcs_ids = []
+        for dir_type in dir_types:
+            try:
+                vcs_ids.append(
+                    input_handler.get_vcs_id_with_type(commit, dir_type))
+            except KeyError:
+                tracer.debug("No directory configured for [%s]", dir_type)
+        return ObjectCache.create_hashable(vcs_ids)
+
     # pylint: disable=too-many-arguments
     def __init__(self, config, input_handler, commit, object_cache,
-                 input_mods):
-        '''Read in all the dependent topics and the requirements.'''
+                 input_mods, previous=None):
+        '''Read in all the dependent topics and the requirements.
+           previous is an optional tuple of the topic set of the
+           previous commit and the set of changed files: if given, the
+           requirements are read in incrementally.'''
         tracer.info("Called; commit timestamp [%s]",
                     input_handler.get_timestamp(commit))
         Digraph.__init__(self)
@@ -35,12 +62,15 @@ class TopicSet(Digraph, UsableFlag):
         self.__commit = commit
         self.__object_cache = object_cache
         self.__input_mods = input_mods
+        self.__previous = previous
 
         # Because it is possible that things are failing, there is the need to
         # have some defaults here:
         self.__complete_requirement_set = None
         self.__topic = None
         self.__requirement_set = None
+        self.__reachability = None
+        self.__content_digest = None
 
         # First: read in all the requirements.
         self.__read_requirement_set()
@@ -49,13 +79,15 @@ class TopicSet(Digraph, UsableFlag):
             return
         # Second: read in all the topics.
         # Stored here is the initial node of the topic digraph.
-        self.__topic = self.__read_topics()
+        with profiler.phase("topics"):
+            self.__topic = self.__read_topics()
         if not self.is_usable():
             tracer.error("Errors during reading the topics.")
             return
         # Third: restrict requirements to those which are
         #    needed in the topic.
-        self.__requirement_set = self.__restrict_requirements_set()
+        with profiler.phase("restrict"):
+            self.__requirement_set = self.__restrict_requirements_set()
         if not self.is_usable():
             tracer.error("Errors during restriction of the requirements.")
             return
@@ -63,15 +95,26 @@ class TopicSet(Digraph, UsableFlag):
 
     def __read_requirement_set(self):
         '''Reads in the requirement set.
-           First checks if this is already available in the object cache.'''
-        req_set_vcs_id = \
-            self.__input_handler.get_vcs_id_with_type(
-                self.__commit, "requirements")
+           First checks if this is already available in the object cache.
+           The requirement set also contains the constraints and the
+           test cases: they are part of the id.'''
+        req_set_vcs_id = TopicSet.get_inputs_vcs_id(
+            self.__input_handler, self.__commit,
+            TopicSet.requirement_set_dir_types)
         req_set = self.__object_cache.get("RequirementSet", req_set_vcs_id)
         if req_set is None:
             req_set = RequirementSet(self._config)
-            req_set.read_requirements(self.__input_handler, self.__commit,
-                                      self.__input_mods, self.__object_cache)
+            if self.__previous is None:
+                req_set.read_requirements(
+                    self.__input_handler, self.__commit,
+                    self.__input_mods, self.__object_cache)
+            else:
+                previous_topic_set, changed_files = self.__previous
+                req_set.read_requirements_incremental(
+                    self.__input_handler, self.__commit,
+                    self.__input_mods, self.__object_cache,
+                    previous_topic_set.get_complete_requirement_set(),
+                    changed_files)
             self.__object_cache.add(req_set_vcs_id,
                                     "RequirementSet", req_set)
             self._adapt_usablility(req_set)
@@ -109,12 +152,38 @@ class TopicSet(Digraph, UsableFlag):
         '''Return the main topic.'''
         return self.__topic
 
+    def get_reachability(self):
+        '''Returns the reachability index of the topics.
+           It is computed with the first call.'''
+        if self.__reachability is None:
+            self.__reachability = Reachability(self)
+        return self.__reachability
+
+    def get_complete_requirement_set(self):
+        '''Returns the requirement set with all the requirements.'''
+        return self.__complete_requirement_set
+
     # pylint: disable=invalid-name
     def get_complete_requirement_set_count(self):
         '''Return the number of requirements in this RequirementSet.  This
            is e.g. needed for statistics.'''
         return self.__complete_requirement_set.get_requirements_cnt()
 
+    def get_commit(self):
+        '''Returns the commit the topic set was read from.'''
+        return self.__commit
+
+    def get_content_digest(self):
+        '''Returns the digest of the content of all the files
+           (requirements, topics, constraints and test cases) which
+           were read in for this topic set.'''
+        if self.__content_digest is None:
+            self.__content_digest = ",".join(
+                self.__input_handler.get_content_digest(
+                    self.__commit, dir_type)
+                for dir_type in TopicSet.input_dir_types)
+        return self.__content_digest
+
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for TopicsSet.'''
         if self.__topic is not None:
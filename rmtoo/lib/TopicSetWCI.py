@@ -10,8 +10,10 @@
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.logging import tracer
-from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.FuncCall import DispatchTable
+
+tracer = get_tracer("output")  # pylint: disable=invalid-name
 
 
 class TopicSetWCI(object):
@@ -35,12 +37,15 @@ class TopicSetWCI(object):
 
     def execute(self, executor, func_prefix):
         '''Execute the parts which are needed for TopicsSet.'''
+        dispatch = DispatchTable.get(executor, func_prefix)
         tracer.debug("Calling pre.")
-        FuncCall.pcall(executor, func_prefix + "topic_set_pre", self)
+        if dispatch.topic_set_pre is not None:
+            dispatch.topic_set_pre(self)
         tracer.debug("Calling sub topic.")
         self.__topic_set.execute(executor, func_prefix)
         tracer.debug("Calling post.")
-        FuncCall.pcall(executor, func_prefix + "topic_set_post", self)
+        if dispatch.topic_set_post is not None:
+            dispatch.topic_set_post(self)
         tracer.debug("Finished.")
 
     def create_makefile_name(self, name, topicn):
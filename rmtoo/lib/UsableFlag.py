@@ -11,7 +11,9 @@
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("parse")  # pylint: disable=invalid-name
 
 
 # pylint: disable=too-few-public-methods
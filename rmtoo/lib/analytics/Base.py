@@ -22,6 +22,7 @@ class Base(Executor):
     def __init__(self):
         '''Constructs an Analytics Base.'''
         self.__success = True
+        self.__failed_cnt = 0
         self.__results = []
 
     def get_success(self):
@@ -31,11 +32,20 @@ class Base(Executor):
     def set_failed(self):
         '''Set the state to not successful.'''
         self.__success = False
+        self.__failed_cnt += 1
+
+    def get_failed_count(self):
+        '''Returns how often set_failed() was called.'''
+        return self.__failed_cnt
 
     def add_result(self, result):
         '''Add the given result to the result container.'''
         self.__results.append(result)
 
+    def get_results(self):
+        '''Returns all the results.'''
+        return self.__results
+
     def write_result(self, mfd):
         '''Write the result to the given file descriptor.'''
         for result in self.__results:
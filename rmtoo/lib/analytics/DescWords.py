@@ -16,8 +16,10 @@ from __future__ import unicode_literals
 import re
 
 from rmtoo.lib.Markup import Markup
+from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.analytics.Result import Result
 from rmtoo.lib.analytics.Base import Base
+from rmtoo.lib.analytics.WordMatcher import WordMatcher
 from rmtoo.lib.logging import tracer
 
 
@@ -73,23 +75,61 @@ class DescWords(Base):
     words = {"en_GB": words_en_GB,
              "de_DE": words_de_DE}
 
+    # The matchers for the word lists: created only once for each
+    # list of regular expressions.
+    matchers = {}
+
     def __init__(self, config):
         '''Sets up the DescWord object for use.'''
         Base.__init__(self)
         self.lwords = DescWords.get_lang(config)
         self.markup = Markup("txt")
+        self.__matcher = DescWords.get_matcher(self.lwords)
+
+    @staticmethod
+    def get_matcher(lwords):
+        '''Returns the matcher for all the regular expressions of the
+           word list.'''
+        key = tuple((wre.pattern, wre.flags) for wre, _, _ in lwords)
+        matcher = DescWords.matchers.get(key)
+        if matcher is None:
+            matcher = WordMatcher([wre for wre, _, _ in lwords])
+            DescWords.matchers[key] = matcher
+        return matcher
+
+    @staticmethod
+    def get_config_words(config, lang):
+        '''Returns the additional words for the language from the
+           configuration 'processing.analytics.descwords.words'.
+           Each entry is a list of the regular expression, the value
+           and the description.'''
+        config_words = config.get_value_default(
+            'processing.analytics.descwords.words.' + lang, [])
+        lwords = []
+        for entry in config_words:
+            if not isinstance(entry, list) or len(entry) != 3:
+                raise RMTException(117, "DescWords: configured word [%s] "
+                                   "for language [%s] must be a list of "
+                                   "regular expression, value and "
+                                   "description" % (entry, lang))
+            lwords.append([re.compile(entry[0]), int(entry[1]), entry[2]])
+        return lwords
 
     @staticmethod
     def get_lang(config):
         """Get the language from the config.
 
         If not present, return en_GB as default.
+        The words configured for the language are added.
         """
         def_lang = config.get_value_default(
             'requirements.input.default_language', 'en_GB')
+        config_words = DescWords.get_config_words(config, def_lang)
 
         if def_lang in DescWords.words:
-            return DescWords.words[def_lang]
+            return DescWords.words[def_lang] + config_words
+        if config_words:
+            return config_words
         tracer.warn("Language [%s] not supported, using en_GB", def_lang)
         return DescWords.words["en_GB"]
 
@@ -101,9 +141,9 @@ class DescWords(Base):
         """
         level = -10
         log = []
-        for wre, wlvl, wdsc in self.lwords:
-            plain_txt = self.markup.replace(text).strip()
-            fal = len(wre.findall(plain_txt))
+        plain_txt = self.markup.replace(text).strip()
+        counts = self.__matcher.count(plain_txt)
+        for (_, wlvl, wdsc), fal in zip(self.lwords, counts):
             if fal > 0:
                 level += fal * wlvl
                 log.append("%+4d:%d*%d: %s" % (fal * wlvl, fal, wlvl, wdsc))
@@ -123,6 +163,13 @@ class DescWords(Base):
         '''Sort by id.'''
         return sorted(list_to_sort, key=lambda r: r.get_id())
 
+    @staticmethod
+    def requirement_inputs(requirement):
+        '''Returns everything which is used to check the requirement.
+           (The word list is part of the configuration.)'''
+        return "%s\n%s" % (requirement.get_id(),
+                           requirement.get_value("Description").get_content())
+
     def requirement(self, requirement):
         '''Checks all the requirements.
            If the result is positive, it is good.'''
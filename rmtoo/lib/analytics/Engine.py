@@ -0,0 +1,190 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Analytics engine: walks the newest topic set of each topic continuum
+   once and calls all the enabled analytics modules.
+   Each module analyses only the topic continuums of its own
+   topic_continuum_set_sort() (e.g. DescWords only the last one).
+   Each module gets the requirements of a requirement set in the order
+   of its own requirement_set_sort() - therefore the results are the
+   same as when each module walks the topic set by itself.
+   When the persistent cache is configured, the results of the modules
+   which check one requirement at a time are stored in a result cache
+   - so that only changed requirements are analysed again.
+   The time of the callbacks of each module is recorded in the profiler
+   as phase with the name of the module.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
+from rmtoo.lib.FuncCall import FanOut, get_function, get_hook
+from rmtoo.lib.Profiler import profiler
+from rmtoo.lib.analytics.HotSpot import HotSpot
+from rmtoo.lib.analytics.DescWords import DescWords
+from rmtoo.lib.analytics.ReqTopicCohe import ReqTopicCohe
+from rmtoo.lib.analytics.ResultCache import ResultCache
+from rmtoo.lib.analytics.TopicCohe import TopicCohe
+from rmtoo.lib.logging import tracer
+from rmtoo.lib.vcs.PersistentCache import PersistentCache
+
+
+class Engine(FanOut):
+    '''Calls the callbacks of all the enabled analytics modules.'''
+
+    # The available analytics modules in the order in which the results
+    # are written.  The name is used in the configuration.
+    modules = [("descwords", DescWords), ("hotspot", HotSpot),
+               ("reqtopiccohe", ReqTopicCohe), ("topiccohe", TopicCohe)]
+
+    def __init__(self, config, result_cache=None):
+        '''Creates all the analytics modules which are enabled.
+           If no result cache is given and the persistent cache is
+           configured in 'processing.cache', a result cache which uses
+           it is created.'''
+        if result_cache is None:
+            persistent_cache = PersistentCache.create_from_config(config)
+            if persistent_cache is not None:
+                result_cache = ResultCache(persistent_cache)
+        self.__result_cache = result_cache
+        self.__analytics = Engine.create_modules(config)
+        FanOut.__init__(self, self.__analytics, self.__is_active)
+        # The names of the modules which analyse the current topic
+        # continuum (outside of a topic continuum: all).
+        self.__all_modules = frozenset(name for name, _ in self.__analytics)
+        self.__active_modules = self.__all_modules
+        # For each topic continuum (id) the names of the modules.
+        self.__continuum_modules = {}
+
+        # Modules which use the default order get each requirement
+        # when it is visited; the others at the end of the requirement
+        # set in their own order.
+        self.__requirement_hooks = []
+        self.__sorted_requirement_hooks = []
+        default_sort = get_function(
+            ExecutorTopicContinuum.requirement_set_sort)
+        for name, analytics in self.__analytics:
+            hook = get_hook(analytics, "requirement")
+            if hook is None:
+                continue
+            if self.__result_cache is not None \
+                    and hasattr(analytics, "requirement_inputs"):
+                hook = self.__cached_hook(name, analytics, hook)
+            hook = profiler.timed(name, hook)
+            if get_function(type(analytics).requirement_set_sort) \
+                    is default_sort:
+                self.__requirement_hooks.append((name, hook))
+            else:
+                self.__sorted_requirement_hooks.append(
+                    (name,
+                     profiler.timed(name, analytics.requirement_set_sort),
+                     hook))
+        self.__requirements = []
+        self.__topic_continuum_pre = self._create_fan_out(
+            "topic_continuum_pre")
+        self.__topic_continuum_post = self._create_fan_out(
+            "topic_continuum_post")
+        self.__requirement_set_post = self._create_fan_out(
+            "requirement_set_post")
+
+    @staticmethod
+    def create_modules(config):
+        '''Returns the list of the names and the analytics modules
+           which are enabled in 'processing.analytics.<name>.enabled'
+           (default: all).'''
+        analytics = []
+        for name, analytic_type in Engine.modules:
+            if not config.get_bool(
+                    "processing.analytics.%s.enabled" % name, True):
+                tracer.info("Analytics module [%s] disabled.", name)
+                continue
+            analytics.append((name, analytic_type(config)))
+        return analytics
+
+    def __cached_hook(self, name, analytics, hook):
+        '''Returns the requirement callback which uses the result
+           cache.'''
+        def cached_hook(requirement):
+            '''Replays the stored results or calls the module.'''
+            self.__result_cache.analyse(name, analytics, hook, requirement)
+        return cached_hook
+
+    def __is_active(self, name):
+        '''Returns True if the module with the given name analyses the
+           current topic continuum.'''
+        return name in self.__active_modules
+
+    def get_analytics(self):
+        '''Returns the list of the names and the analytics modules.'''
+        return self.__analytics
+
+    def get_result_cache(self):
+        '''Returns the result cache (or None).'''
+        return self.__result_cache
+
+    def topic_continuum_set_sort(self, list_to_sort):
+        '''Returns the topic continuums which are analysed by any of
+           the modules (in the given order) and stores which modules
+           analyse which topic continuum.'''
+        list_to_sort = list(list_to_sort)
+        self.__continuum_modules = {}
+        for name, analytics in self.__analytics:
+            for topic_continuum in analytics.topic_continuum_set_sort(
+                    list_to_sort):
+                self.__continuum_modules.setdefault(
+                    id(topic_continuum), set()).add(name)
+        return [topic_continuum for topic_continuum in list_to_sort
+                if id(topic_continuum) in self.__continuum_modules]
+
+    def topic_continuum_pre(self, topic_continuum):
+        '''Only the modules which analyse the topic continuum are
+           called until topic_continuum_post().'''
+        self.__active_modules = self.__continuum_modules.get(
+            id(topic_continuum), self.__all_modules)
+        if self.__topic_continuum_pre is not None:
+            self.__topic_continuum_pre(topic_continuum)
+
+    def topic_continuum_post(self, topic_continuum):
+        '''Calls the modules which analyse the topic continuum.'''
+        if self.__topic_continuum_post is not None:
+            self.__topic_continuum_post(topic_continuum)
+        self.__active_modules = self.__all_modules
+
+    @staticmethod
+    def topic_continuum_sort(vcs_commit_ids, topic_sets):
+        '''Only the newest topic set is analysed.'''
+        return [topic_sets[vcs_commit_ids[-1].get_commit()]]
+
+    @staticmethod
+    def topic_set_sort(list_to_sort):
+        '''None of the modules sorts the topic sets.'''
+        return list_to_sort
+
+    @staticmethod
+    def requirement_set_sort(list_to_sort):
+        '''The modules which sort get the requirements in
+           requirement_set_post().'''
+        return list_to_sort
+
+    def requirement(self, requirement):
+        '''Calls the modules which use the default order and stores
+           the requirement for the others.'''
+        for name, hook in self.__requirement_hooks:
+            if name in self.__active_modules:
+                hook(requirement)
+        if self.__sorted_requirement_hooks:
+            self.__requirements.append(requirement)
+
+    def requirement_set_post(self, requirement_set):
+        '''Calls the modules which use their own order.'''
+        requirements = self.__requirements
+        self.__requirements = []
+        for name, sort, hook in self.__sorted_requirement_hooks:
+            if name not in self.__active_modules:
+                continue
+            for requirement in sort(requirements):
+                hook(requirement)
+        if self.__requirement_set_post is not None:
+            self.__requirement_set_post(requirement_set)
@@ -20,21 +20,34 @@ class HotSpot(Base):
     outgoing links is too high.
     """
 
+    # Defaults: can be changed in 'processing.analytics.hotspot'.
     max_incoming = 7
     max_outgoing = 4
 
-    def __init__(self, _):
+    def __init__(self, config):
         Base.__init__(self)
+        self.__max_incoming = config.get_integer(
+            "processing.analytics.hotspot.max_incoming",
+            HotSpot.max_incoming)
+        self.__max_outgoing = config.get_integer(
+            "processing.analytics.hotspot.max_outgoing",
+            HotSpot.max_outgoing)
+
+    @staticmethod
+    def requirement_inputs(req):
+        '''Returns everything which is used to check the requirement.'''
+        return "%s\n%d\n%d" % (req.get_id(), len(req.incoming),
+                               len(req.outgoing))
 
     def requirement(self, req):
-        if len(req.incoming) > HotSpot.max_incoming:
+        if len(req.incoming) > self.__max_incoming:
             self.add_result(
                 Result("HotSpot", req.get_id(), -10,
                        ["Number of incoming links is too high: %d" %
                         len(req.incoming)]))
             self.set_failed()
 
-        if len(req.outgoing) > HotSpot.max_outgoing:
+        if len(req.outgoing) > self.__max_outgoing:
             self.add_result(
                 Result("HotSpot", req.get_id(), -10,
                        ["Number of outgoing links is too high: %d" %
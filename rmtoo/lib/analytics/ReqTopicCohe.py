@@ -31,6 +31,16 @@ class ReqTopicCohe(Base):
                 out_cnt += 1
         return in_cnt, out_cnt
 
+    @staticmethod
+    def requirement_inputs(requirement):
+        '''Returns everything which is used to check the requirement:
+           the topics of the requirement and of all the linked
+           requirements.'''
+        return "%s\n%s\n%s\n%s" % (
+            requirement.get_id(), requirement.get_value("Topic"),
+            sorted(req.get_value("Topic") for req in requirement.incoming),
+            sorted(req.get_value("Topic") for req in requirement.outgoing))
+
     def requirement(self, requirement):
         '''Check the topic coherence.'''
         it_in, it_out = ReqTopicCohe.count_in_out_topic(
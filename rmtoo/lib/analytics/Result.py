@@ -24,6 +24,12 @@ class Result(object):
         """Return the analytics value"""
         return self.__analytics_value
 
+    def get_state(self):
+        """Return the values from which the result can be created
+        again (e.g. when it is stored in a cache)"""
+        return (self.__analytics_name, self.__object_path_name,
+                self.__analytics_value, list(self.__message_list))
+
     def write_error(self, mfd):
         '''Write out an error - if the result is an error.'''
         if self.__analytics_value >= 0:
@@ -0,0 +1,82 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Cache for the results of the analytics modules which check one
+   requirement at a time.  The key is everything the module reads
+   from the requirement (see requirement_inputs() of the modules).
+   The results are held in memory - so that a requirement which did
+   not change between two commits is analysed only once - and, if
+   configured, in the persistent cache.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from rmtoo.lib.analytics.Result import Result
+from rmtoo.lib.logging import tracer
+
+
+class ResultCache(object):
+    '''Stores the results and the number of failures of each call of
+       the requirement callback of an analytics module.'''
+
+    def __init__(self, persistent_cache=None):
+        self.__persistent_cache = persistent_cache
+        self.__states = {}
+        # For each module: number of reused and analysed requirements.
+        self.__stats = {}
+
+    def analyse(self, name, analytics, hook, requirement):
+        '''Calls the hook of the analytics module with the given name
+           for the requirement - or replays the stored results if the
+           requirement was already analysed.
+           Returns the state: the list of the states of the new
+           results and the number of failures.'''
+        stats = self.__stats.setdefault(name, [0, 0])
+        memory_key = (name, analytics.requirement_inputs(requirement))
+        state = self.__states.get(memory_key)
+        key = None
+        if state is None and self.__persistent_cache is not None:
+            key = self.__persistent_cache.create_key(
+                "Analytics:" + name, memory_key[1], [])
+            state = self.__persistent_cache.get(key)
+        if state is not None:
+            results, failed_cnt = state
+            for result in results:
+                analytics.add_result(Result(*result))
+            for _ in range(failed_cnt):
+                analytics.set_failed()
+            stats[0] += 1
+        else:
+            results_cnt = len(analytics.get_results())
+            failed_cnt = analytics.get_failed_count()
+            hook(requirement)
+            state = ([result.get_state() for result
+                      in analytics.get_results()[results_cnt:]],
+                     analytics.get_failed_count() - failed_cnt)
+            if key is not None:
+                self.__persistent_cache.add(key, state)
+            stats[1] += 1
+        self.__states[memory_key] = state
+        return state
+
+    def get_stats(self):
+        '''Returns for each module name the number of reused and
+           analysed requirements.'''
+        return dict((name, tuple(stats))
+                    for name, stats in self.__stats.items())
+
+    def log_stats(self):
+        '''Prints out the usage statistics.'''
+        for name, (reused, analysed) in sorted(self.__stats.items()):
+            tracer.info("Analytics [%s]: requirements reused [%d] "
+                        "analysed [%d]", name, reused, analysed)
+        if self.__persistent_cache is not None:
+            hit, miss, added, evicted, size = \
+                self.__persistent_cache.get_stats()
+            tracer.info("Analytics persistent cache usage statistics: "
+                        "hit [%d] miss [%d] added [%d] evicted [%d] "
+                        "size [%d] cache hit ratio [%4.3f]",
+                        hit, miss, added, evicted, size,
+                        float(hit) / max(hit + miss, 1))
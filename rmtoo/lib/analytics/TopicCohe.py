@@ -43,8 +43,17 @@ class TopicCohe(Base):
            This is only used by the unit tests.'''
         return self.__tcnt
 
-    def _add_topic_relation(self, topic_a, topic_b):
+    @staticmethod
+    def __is_self_of_ancient(topic_a, topic_b, reachability):
+        '''Checks if topic_b is topic_a or one of its ancestors.'''
+        if reachability is None:
+            return topic_a.is_self_of_ancient(topic_b)
+        return reachability.is_self_of_ancient(topic_a, topic_b)
+
+    def _add_topic_relation(self, topic_a, topic_b, reachability=None):
         '''Add the relation between topic_a and topic_b.
+           If given, the reachability index is used to check if
+           topic_b is an ancestor of topic_a.
            (Here only one _ is used because this is used by the unit tests.)'''
         # If not there, add the initial count [0, 0]
         for topic in [topic_a.name, topic_b.name]:
@@ -57,14 +66,14 @@ class TopicCohe(Base):
         # Iff self: add a 3!
         if topic_a == topic_b:
             self.__tcnt[topic_a.name][0] += 3
-        elif topic_a.is_self_of_ancient(topic_b):
+        elif self.__is_self_of_ancient(topic_a, topic_b, reachability):
             # 2: because it is one incoming and one outgoing
             self.__tcnt[topic_b.name][0] += 2
         else:
             self.__tcnt[topic_a.name][1] += 1
             self.__tcnt[topic_b.name][1] += 1
 
-    def __eval_link(self, req_a, req_b):
+    def __eval_link(self, req_a, req_b, reachability):
         '''Add all the links between all topics of req_a and req_b.'''
         # If either one of the requirements is not in the topic,
         # skip this step
@@ -77,16 +86,17 @@ class TopicCohe(Base):
 
         for topic_a in self.__req2topics[req_a.get_id()]:
             for topic_b in self.__req2topics[req_b.get_id()]:
-                self._add_topic_relation(topic_a, topic_b)
+                self._add_topic_relation(topic_a, topic_b, reachability)
 
     def topic_set_post(self, topic_set):
         '''This is call in the TopicsSet post-phase.'''
+        reachability = topic_set.get_topic_set().get_reachability()
         # pylint: disable=consider-iterating-dictionary
         for req_id in self.__req2topics.keys():
             req_a = topic_set.get_topic_set().get_requirement_set().\
                        get_requirement(req_id)
             for req_b in req_a.incoming:
-                self.__eval_link(req_a, req_b)
+                self.__eval_link(req_a, req_b, reachability)
 
         for topic, cnt in iteritems(self.__tcnt):
             if cnt[0] <= cnt[1]:
@@ -0,0 +1,101 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Analytics trend: computes the score of each requirement for each
+   analytics module which checks one requirement at a time - for all
+   the topic sets (commits) of the topic continuums - and writes the
+   time series into one file.
+   The results are taken from the result cache: only requirements
+   which changed between two commits are analysed.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import time
+
+from rmtoo.lib.Executor import Executor
+from rmtoo.lib.FuncCall import get_hook
+from rmtoo.lib.analytics.Engine import Engine
+from rmtoo.lib.analytics.ResultCache import ResultCache
+from rmtoo.lib.logging import tracer
+
+
+class Trend(Executor):
+    '''Writes one line for each topic set, module and requirement:
+       the timestamp of the commit, the name of the topic continuum,
+       the name of the module, the requirement id and the score (the
+       sum of the values of the results).'''
+
+    def __init__(self, config, filename, result_cache=None):
+        tracer.debug("called: filename [%s]", filename)
+        self.__config = config
+        self.__filename = filename
+        if result_cache is None:
+            result_cache = ResultCache()
+        self.__result_cache = result_cache
+        self.__modules = [
+            (name, type(analytics)) for name, analytics
+            in Engine.create_modules(config)
+            if hasattr(analytics, "requirement_inputs")]
+        self.__ofile = None
+        self.__continuum_name = None
+        self.__analytics = []
+        self.__scores = []
+
+    @staticmethod
+    def create_from_config(config, result_cache=None):
+        '''Creates the trend if 'processing.analytics.trend' is
+           configured.  If not, None is returned.'''
+        filename = config.get_rvalue_default(
+            "processing.analytics.trend.output_filename", None)
+        if filename is None:
+            return None
+        return Trend(config, filename, result_cache)
+
+    def get_result_cache(self):
+        '''Returns the result cache.'''
+        return self.__result_cache
+
+    def topic_continuum_set_pre(self, _topic_continuum_set):
+        '''Opens the output file.'''
+        self.__ofile = io.open(self.__filename, "w", encoding="utf-8")
+
+    def topic_continuum_set_post(self, _topic_continuum_set):
+        '''Closes the output file.'''
+        self.__ofile.close()
+
+    def topic_continuum_pre(self, topic_continuum):
+        '''Stores the name of the topic continuum.'''
+        self.__continuum_name = topic_continuum.get_name()
+
+    def topic_set_pre(self, _topic_set):
+        '''Creates new analytics modules for the topic set.'''
+        self.__analytics = []
+        for name, analytic_type in self.__modules:
+            analytics = analytic_type(self.__config)
+            self.__analytics.append(
+                (name, analytics, get_hook(analytics, "requirement")))
+        self.__scores = []
+
+    def requirement(self, requirement):
+        '''Computes the scores of the requirement.'''
+        for name, analytics, hook in self.__analytics:
+            results, _ = self.__result_cache.analyse(
+                name, analytics, hook, requirement)
+            self.__scores.append(
+                (name, requirement.get_id(),
+                 sum(result[2] for result in results)))
+
+    def topic_set_post(self, topic_set):
+        '''Writes the scores of the topic set.'''
+        timestamp = time.strftime(
+            "%Y-%m-%d_%H:%M:%S",
+            time.localtime(topic_set.get_commit_info().get_timestamp()))
+        for name, rid, score in sorted(self.__scores):
+            self.__ofile.write("%s %s %s %s %s\n" % (
+                timestamp, self.__continuum_name, name, rid, score))
@@ -0,0 +1,155 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Matches a list of regular expressions against a text in one scan.
+   The result is the same as calling findall() for each regular
+   expression: the number of non overlapping matches of each one.
+   All the expressions which are plain strings (most of the words)
+   are combined into a trie, so that the time for one scan does not
+   depend on the number of words.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import re
+
+from rmtoo.lib.logging import tracer
+
+# Characters which have a special meaning in a regular expression.
+_SPECIAL_CHARS = set(".^$*+?{}[]|()")
+# Back references can not be used in the combined expression.
+_BACK_REFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _get_literal(regex):
+    '''Returns the string which is matched by the (compiled) regular
+       expression if it only matches this one string - else None.'''
+    if regex.flags & ~re.UNICODE:
+        return None
+    literal = []
+    chars = iter(regex.pattern)
+    for char in chars:
+        if char in _SPECIAL_CHARS:
+            return None
+        if char == "\\":
+            char = next(chars, "")
+            if not char or char.isalnum():
+                return None
+        literal.append(char)
+    return "".join(literal) or None
+
+
+def _trie_regex(node):
+    '''Creates the regular expression for the (sub-)trie.
+       Each word ends with an empty named group; longer words are
+       tried first.'''
+    alternatives = [re.escape(char) + _trie_regex(child)
+                    for char, child in sorted(
+                        (char, child) for char, child in node.items()
+                        if char is not None)]
+    if None in node:
+        alternatives.append("(?P<l%d>)" % node[None][0])
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+def _trie_matches(node, length, prefix_matches, result):
+    '''Stores for each word of the (sub-)trie the list of all the
+       words (index and length) which match together with it: the
+       same words and the words which are a prefix.'''
+    if None in node:
+        prefix_matches = prefix_matches + [
+            (idx, length) for idx in node[None]]
+        result[node[None][0]] = prefix_matches
+    for char, child in node.items():
+        if char is not None:
+            _trie_matches(child, length + 1, prefix_matches, result)
+
+
+class WordMatcher(object):
+    '''Counts the matches of a list of regular expressions.'''
+
+    def __init__(self, regexes):
+        '''Creates the matcher for the list of compiled regular
+           expressions.'''
+        self.__count = len(regexes)
+        trie = {}
+        # Regular expressions which are matched in the scan.
+        self.__scan_regexes = []
+        # Regular expressions which can not be combined (e.g. because
+        # they have flags, back references or match the empty string).
+        self.__findall_regexes = []
+        for idx, regex in enumerate(regexes):
+            literal = _get_literal(regex)
+            if literal is not None:
+                node = trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(idx)
+            elif regex.flags & ~re.UNICODE \
+                    or _BACK_REFERENCE.search(regex.pattern) \
+                    or regex.match("") is not None:
+                self.__findall_regexes.append((idx, regex))
+            else:
+                self.__scan_regexes.append((idx, regex))
+        # For each word which is reported by the scan: all the words
+        # which match at the same position.
+        self.__literal_matches = {}
+        _trie_matches(trie, 0, [], self.__literal_matches)
+
+        alternatives = []
+        if trie:
+            alternatives.append(_trie_regex(trie))
+        alternatives.extend("(?P<r%d>%s)" % (idx, regex.pattern)
+                            for idx, regex in self.__scan_regexes)
+        self.__scan = None
+        if alternatives:
+            self.__scan = re.compile(
+                "(?=" + "|".join(alternatives) + ")", re.UNICODE)
+        tracer.debug("WordMatcher: words [%d] scanned regexes [%d] "
+                     "other regexes [%d]",
+                     self.__count - len(self.__scan_regexes)
+                     - len(self.__findall_regexes),
+                     len(self.__scan_regexes), len(self.__findall_regexes))
+
+    def __matches_at(self, text, pos, match):
+        '''Returns the list of (index, end) of all the regular
+           expressions which match at the given position.
+           The scan only reports the first alternative which matches;
+           the other ones must be checked.'''
+        name = match.lastgroup
+        idx = int(name[1:])
+        if name[0] == "l":
+            matches = [(word_idx, pos + length) for word_idx, length
+                       in self.__literal_matches[idx]]
+            candidates = self.__scan_regexes
+        else:
+            matches = [(idx, match.end(name))]
+            candidates = [(ridx, regex) for ridx, regex
+                          in self.__scan_regexes if ridx > idx]
+        for ridx, regex in candidates:
+            rmatch = regex.match(text, pos)
+            if rmatch is not None:
+                matches.append((ridx, rmatch.end()))
+        return matches
+
+    def count(self, text):
+        '''Returns the list of the number of (non overlapping) matches
+           for each regular expression.'''
+        counts = [0] * self.__count
+        if self.__scan is not None:
+            next_pos = [0] * self.__count
+            for match in self.__scan.finditer(text):
+                pos = match.start()
+                for idx, end in self.__matches_at(text, pos, match):
+                    if pos >= next_pos[idx]:
+                        counts[idx] += 1
+                        next_pos[idx] = end
+        for idx, regex in self.__findall_regexes:
+            counts[idx] = len(regex.findall(text))
+        return counts
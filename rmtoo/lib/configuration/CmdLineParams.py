@@ -87,6 +87,14 @@ class CmdLineParams(object):
             help="YAML string or file which is merged into the "
             "existing configuration. Can be specified multiple "
             "times.")
+        parser.add_argument(
+            "--profile", dest="profile",
+            help="Write the wall and cpu times of the different "
+            "phases as JSON into the given file.")
+        parser.add_argument(
+            "--profile-cprofile-dir", dest="profile_cprofile_dir",
+            help="Write a cProfile dump of each top level phase into "
+            "the given directory.")
 
     @staticmethod
     def add_values(soptions, name):
@@ -103,6 +111,19 @@ class CmdLineParams(object):
                 opts.append(name + ":" + uopt)
         return {'configuration': {name: opts}}
 
+    @staticmethod
+    def add_profile_values(options):
+        '''Add the profiling parameters.'''
+        profile = {}
+        if options.profile is not None:
+            profile['filename'] = Encoding.to_unicode(options.profile)
+        if options.profile_cprofile_dir is not None:
+            profile['cprofile_directory'] = \
+                Encoding.to_unicode(options.profile_cprofile_dir)
+        if not profile:
+            return {}
+        return {'actions': {'profile': profile}}
+
     @staticmethod
     def add_args(args):
         '''Add the arguments to the configuration.'''
@@ -124,4 +145,5 @@ class CmdLineParams(object):
         lresult.append(CmdLineParams.add_deprecated_values(args))
         lresult.append(CmdLineParams.add_values(args.json, "json"))
         lresult.append(CmdLineParams.add_values(args.yaml, "yaml"))
+        lresult.append(CmdLineParams.add_profile_values(args))
         return lresult
@@ -4,6 +4,8 @@
 
   This function implements the digraph algorithm finding the connected
   components of a digraph.
+  The components are stored in a disjoint-set (union-find) data
+  structure with union by rank and path compression.
 
  (c) 2010-2012,2017 by flonatel GmbH & Co. KG
 
@@ -17,11 +19,18 @@ class ConnectedComponents(object):
     """Class that holds the connected components of a digraph"""
 
     def __init__(self):
-        self.__cs = []
+        # The parent of each node: a root is its own parent.
+        self.__parent = {}
+        # The upper bound of the height of the tree of each root.
+        self.__rank = {}
+        # The nodes in the order they were added.
+        self.__nodes = []
+        # The number of components.
+        self.__count = 0
 
     def get_length(self):
         """Return the number of components"""
-        return len(self.__cs)
+        return self.__count
 
     @staticmethod
     def set_as_string(node_set):
@@ -31,42 +40,63 @@ class ConnectedComponents(object):
             result.add(node.name)
         return result
 
+    def get_components(self):
+        """Return the list of components; each component is a set of
+        nodes.  The components are ordered by the first added node."""
+        components = {}
+        result = []
+        for node in self.__nodes:
+            root = self.find(node)
+            if root not in components:
+                components[root] = set()
+                result.append(components[root])
+            components[root].add(node)
+        return result
+
     def as_string(self):
         """Return the connected component set as list of sets"""
         result = []
-        for node in self.__cs:
-            result.append(self.set_as_string(node))
+        for node_set in self.get_components():
+            result.append(self.set_as_string(node_set))
         return result
 
     def add_component(self, node):
         """Add a component that contains only the single given node"""
-        self.__cs.append(set([node]))
+        self.__parent[node] = node
+        self.__rank[node] = 0
+        self.__nodes.append(node)
+        self.__count += 1
 
     def find(self, node):
-        """Search if the given node is in the connected component.
+        """Search the component of the given node.
 
-        If so return the set and the index of the set.
-        If not, raise an exeption."
+        Returns the representative node of the component.
+        If the node was not added, raise an exeption.
         """
-        set_idx = 0
-        for cc_set in self.__cs:
-            if node in cc_set:
-                return set_idx, cc_set
-            set_idx += 1
-        # Node not found
-        raise RMTException(68, "Node [%s] not found" % node)
+        if node not in self.__parent:
+            raise RMTException(68, "Node [%s] not found" % node)
+        root = node
+        while self.__parent[root] is not root:
+            root = self.__parent[root]
+        # Path compression
+        while node is not root:
+            self.__parent[node], node = root, self.__parent[node]
+        return root
 
     def contract(self, node_a, node_b):
         """Contract the sets which contain both given nodes"""
-        _, set_a = self.find(node_a)
-        set_b_idx, set_b = self.find(node_b)
-        if set_a == set_b:
+        root_a = self.find(node_a)
+        root_b = self.find(node_b)
+        if root_a is root_b:
             # Already in one component - nothing to do
             return
-        # Append elements from set_b to set_a
-        set_a |= set_b
-        # Remove h
-        del self.__cs[set_b_idx]
+        # Union by rank: the lower tree is put beneath the higher one.
+        if self.__rank[root_a] < self.__rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.__parent[root_b] = root_a
+        if self.__rank[root_a] == self.__rank[root_b]:
+            self.__rank[root_a] += 1
+        self.__count -= 1
 
 
 def connected_components(digraph):
@@ -88,3 +118,27 @@ def connected_components(digraph):
             components.contract(node, connected_node)
 
     return components
+
+
+def is_connected(digraph):
+    """Checks if the given digraph has exactly one connected component.
+
+    This does not compute the components: a search (ignoring the
+    direction of the edges) is started at the first node and stops
+    when all nodes are found.
+    """
+    if not digraph.nodes:
+        return False
+    nodes = set(digraph.nodes)
+    start = digraph.nodes[0]
+    visited = set([start])
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for connected_node in node.outgoing + node.incoming:
+            if connected_node in nodes and connected_node not in visited:
+                visited.add(connected_node)
+                if len(visited) == len(nodes):
+                    return True
+                stack.append(connected_node)
+    return len(visited) == len(nodes)
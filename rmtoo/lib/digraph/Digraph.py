@@ -82,6 +82,16 @@ class Digraph(object):
     def __init__(self, d=None, node_gen_func=Node):
         self.nodes = []
         self.named_nodes = None
+        # Index of the nodes by name: makes add_node() and find()
+        # constant time.  Nodes which are appended directly to the
+        # 'nodes' list are indexed with the next lookup.
+        # Note: the name of a node must not be changed after it was
+        # added (like the hash of the node, the index depends on it).
+        # When the 'nodes' list is replaced or shortened, the index is
+        # rebuilt.
+        self.__node_index = {}
+        self.__node_index_nodes = self.nodes
+        self.__node_index_cnt = 0
         if d is not None:
             self.create_from_dict(d, node_gen_func)
 
@@ -91,14 +101,39 @@ class Digraph(object):
         node_a.outgoing.append(node_b)
         node_b.incoming.append(node_a)
 
+    def __index_node(self, node):
+        """Adds the node to the index: the first node with a name
+        is the one which is found."""
+        if node.name not in self.__node_index:
+            self.__node_index[node.name] = node
+
+    def __update_node_index(self):
+        """Indexes all nodes which are not yet in the index."""
+        if self.__node_index_nodes is not self.nodes \
+                or self.__node_index_cnt > len(self.nodes):
+            self.__node_index = {}
+            self.__node_index_nodes = self.nodes
+            self.__node_index_cnt = 0
+        for node in self.nodes[self.__node_index_cnt:]:
+            self.__index_node(node)
+        self.__node_index_cnt = len(self.nodes)
+
+    def __lookup(self, name):
+        """Returns the first node with the given name or None."""
+        self.__update_node_index()
+        return self.__node_index.get(name)
+
     def add_node(self, node_a):
         """Adds a new node to the graph"""
         # Check if the node with the same name already exists.
-        for node_idx in self.nodes:
-            if node_idx.name == node_a.name:
-                raise RMTException(39, "Node with name '%s' already exists"
-                                   % node_a.name)
+        if self.__lookup(node_a.name) is not None:
+            raise RMTException(39, "Node with name '%s' already exists"
+                               % node_a.name)
         self.nodes.append(node_a)
+        self.__index_node(node_a)
+        self.__node_index_cnt += 1
+        if self.named_nodes is not None:
+            self.named_nodes[node_a.name] = node_a
 
     def create_from_dict(self, digraph_as_dict, node_gen_func=Node):
         """Low level creation method, which really does the job of
@@ -134,10 +169,7 @@ class Digraph(object):
 
     def find(self, name):
         """Find a node with a given name"""
-        for node in self.nodes:
-            if name == node.name:
-                return node
-        return None
+        return self.__lookup(name)
 
     def build_named_nodes(self):
         """Build up a dictionary with name:node pairs.
@@ -0,0 +1,85 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Reachability index for a digraph.
+   For each node the set of its ancestors (the node itself, the
+   nodes of the incoming edges, their incoming nodes, ...) is
+   computed once and stored as a bitset (a python integer).
+   Afterwards ancestor / descendant queries are answered in constant
+   time (for graphs up to some thousands of nodes).
+   The ancestors are computed on the condensation (strongly connected
+   components) of the graph, so this also works for graphs with
+   circles.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from rmtoo.lib.digraph.Digraph import Digraph
+from rmtoo.lib.digraph.StronglyConnectedComponents \
+    import strongly_connected_components
+
+
+class Reachability(object):
+    '''Answers the question if one node is an ancestor of another.
+       Note: the index reflects the digraph at construction time.'''
+
+    def __init__(self, digraph):
+        nodes = self.__collect_nodes(digraph.nodes)
+        # The bit of each node.
+        self.__bits = {}
+        for idx, node in enumerate(nodes):
+            self.__bits[node] = 1 << idx
+        # The bitset of the ancestors of each node.
+        self.__ancestors = {}
+        self.__compute_ancestors(nodes)
+
+    @staticmethod
+    def __collect_nodes(start_nodes):
+        '''Returns all nodes which are connected to one of the start
+           nodes.  (Some digraphs, e.g. the TopicSet, do not contain
+           all the connected nodes in the nodes list.)'''
+        nodes = list(start_nodes)
+        found = set(nodes)
+        idx = 0
+        while idx < len(nodes):
+            for node in nodes[idx].incoming + nodes[idx].outgoing:
+                if node not in found:
+                    found.add(node)
+                    nodes.append(node)
+            idx += 1
+        return nodes
+
+    def __compute_ancestors(self, nodes):
+        '''Computes the ancestors of all nodes.
+           The strongly connected components are returned with the
+           descendants first - therefore they are handled in reversed
+           order.'''
+        graph = Digraph()
+        graph.nodes = nodes
+        for scc in reversed(strongly_connected_components(graph)):
+            ancestors = 0
+            for node in scc:
+                ancestors |= self.__bits[node]
+                for inc_node in node.incoming:
+                    # The ancestors of nodes of the same component are
+                    # not yet computed - but they are part of the
+                    # component anyway.
+                    ancestors |= self.__ancestors.get(inc_node, 0)
+            for node in scc:
+                self.__ancestors[node] = ancestors
+
+    def is_self_of_ancient(self, node, onode):
+        '''Checks if onode is the node itself or in the ancient (parent,
+           parent of parent, ...) of the node.
+           Same as node.is_self_of_ancient(onode).'''
+        if node not in self.__ancestors or onode not in self.__bits:
+            # Not part of the index.
+            return node.is_self_of_ancient(onode)
+        return self.__ancestors[node] & self.__bits[onode] != 0
+
+    def is_self_of_descendant(self, node, onode):
+        '''Checks if onode is the node itself or a descendant (child,
+           child of child, ...) of the node.'''
+        return self.is_self_of_ancient(onode, node)
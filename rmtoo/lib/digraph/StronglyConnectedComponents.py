@@ -18,12 +18,15 @@
 def strongly_connected_components(digraph):
     """This algorithm is based upon a depth first search.  It assigns a
     number to each visited node.
+    The depth first search is done iteratively (with an explicit stack)
+    so that also very deep graphs can be handled.
     """
-    # This is the number the next node is assigned. (There is no other
-    # way to access local variables?)
+    # This is the number the next node is assigned.
     index = [0]
-    # The stack (list) of nodes - initially empty.
+    # The stack (list) of nodes - initially empty - and the set of
+    # the nodes which are currently on this stack.
     stack_of_nodes = []
+    on_stack = set()
     # Two maps for storing algorithm-local data.
     indizes = {}
     lowlinks = {}
@@ -31,34 +34,47 @@ def strongly_connected_components(digraph):
     # strongly connected component
     scc = []
 
-    def trajan(v):
-        """Trajan algorithm"""
-        # Mark the current node
+    def visit(v):
+        """Mark the node and put it on the stack."""
         indizes[v] = index[0]
         lowlinks[v] = index[0]
         # Increase the all time DFS counter
         index[0] += 1
-        # Append current node to stack
         stack_of_nodes.append(v)
+        on_stack.add(v)
 
-        # For all successors of v:
-        for vl in v.outgoing:
-            # Only check it, if it is not visited already.
-            if vl not in indizes:
-                trajan(vl)
-                lowlinks[v] = min(lowlinks[v], lowlinks[vl])
-            elif vl in stack_of_nodes:
-                lowlinks[v] = min(lowlinks[v], lowlinks[vl])
-
-        # Is this a SCC?
-        if lowlinks[v] == indizes[v]:
-            new_scc = []
-            while stack_of_nodes:
-                vv = stack_of_nodes.pop()
-                new_scc.append(vv)
-                if vv == v:
+    def trajan(start):
+        """Trajan algorithm"""
+        visit(start)
+        # The DFS stack holds the nodes and the iterators over their
+        # not yet handled successors.
+        dfs_stack = [(start, iter(start.outgoing))]
+        while dfs_stack:
+            v, successors = dfs_stack[-1]
+            for vl in successors:
+                # Only descend, if it is not visited already.
+                if vl not in indizes:
+                    visit(vl)
+                    dfs_stack.append((vl, iter(vl.outgoing)))
                     break
-            scc.append(new_scc)
+                elif vl in on_stack:
+                    lowlinks[v] = min(lowlinks[v], lowlinks[vl])
+            else:
+                # All successors of v are handled.
+                dfs_stack.pop()
+                # Is this a SCC?
+                if lowlinks[v] == indizes[v]:
+                    new_scc = []
+                    while stack_of_nodes:
+                        vv = stack_of_nodes.pop()
+                        on_stack.remove(vv)
+                        new_scc.append(vv)
+                        if vv == v:
+                            break
+                    scc.append(new_scc)
+                if dfs_stack:
+                    parent = dfs_stack[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[v])
 
     # The 'main' of the algorithm: for every node (which is not yet)
     # already indexed, call the trajan() function.
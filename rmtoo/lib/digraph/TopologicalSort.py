@@ -27,24 +27,38 @@ def node_list_no_sort(lst_of_nodes):
 def topological_sort(digraph, nodes_sort=node_list_sort):
     '''This algorithm is based upon a depth first search with 'making' some
        special nodes.
-       The result is the topological sorted list of nodes.'''
+       The result is the topological sorted list of nodes.
+       The depth first search is done iteratively (with an explicit
+       stack) so that also very deep graphs can be sorted.'''
     # List of topological sorted nodes
     tsort = []
-    # List of nodes already visited.
+    # Set of nodes already visited.
     # (This is held here - local to the algorithm - to not modify the
     # nodes themselves.)
-    visited = []
+    visited = set()
 
-    def visit(node):
-        """Recursive deep first search function"""
-        if node not in visited:
-            visited.append(node)
-            for out_node in nodes_sort(node.outgoing):
-                visit(out_node)
-            tsort.append(node)
+    def visit(start_node):
+        """Deep first search function"""
+        visited.add(start_node)
+        # The stack holds the nodes and the iterators over their
+        # not yet handled outgoing nodes.
+        stack = [(start_node, iter(nodes_sort(start_node.outgoing)))]
+        while stack:
+            node, out_nodes = stack[-1]
+            for out_node in out_nodes:
+                if out_node not in visited:
+                    visited.add(out_node)
+                    stack.append(
+                        (out_node, iter(nodes_sort(out_node.outgoing))))
+                    break
+            else:
+                # All outgoing nodes are handled.
+                stack.pop()
+                tsort.append(node)
 
     # The 'main' function of the topological sort
     for node in nodes_sort(digraph.nodes):
-        visit(node)
+        if node not in visited:
+            visit(node)
 
     return tsort
@@ -6,79 +6,165 @@
    This is used to get information about the events / tasks
    done in the rmtoo itself.
 
+   Tracing is switched off by default: the tracer only passes
+   warnings and errors to stderr.  When there is a
+   'global.logging.tracer' configuration, the trace is written to
+   the configured file - optionally asynchronous by the help of a
+   queue and a background thread.  The trace level can be set per
+   subsystem (see TRACER_SUBSYSTEMS).
+
  (c) 2010-2012,2017 by flonatel GmbH & Co. KG
 
  For licensing details see COPYING
 '''
 from __future__ import unicode_literals
 
+import atexit
 import sys
 import logging
 
+try:
+    from logging.handlers import QueueHandler, QueueListener
+    from queue import Queue
+except ImportError:
+    # Python 2: there is no support for asynchronous tracing.
+    QueueHandler = None
+
+DEBUG = logging.DEBUG
+
+# The subsystems which have their own trace level.
+TRACER_SUBSYSTEMS = ("vcs", "parse", "digraph", "output")
 
 LOGGING_CONFIG = {
     "stdout": {
         "loglevel": logging.WARN,
     },
     "tracer": {
+        "enabled": False,
         "loglevel": logging.DEBUG,
-        "filename": "/tmp/rmtoo.log"
+        "filename": "/tmp/rmtoo.log",
+        "async": False,
+        "subsystems": {}
     },
     "handler": [],
+    "listener": [],
     "log_handler": []
 }
 
 
+class SubsystemFilter(logging.Filter):
+    '''Passes only the records which have at least the trace level
+       of the subsystem they are coming from.'''
+
+    def __init__(self, loglevel, subsystems):
+        logging.Filter.__init__(self)
+        self.__loglevel = loglevel
+        self.__subsystems = subsystems
+
+    def filter(self, record):
+        subsystem = record.name.rpartition(".")[2] \
+            if record.name.startswith("rmtoo-trace.") else None
+        return record.levelno >= self.__subsystems.get(
+            subsystem, self.__loglevel)
+
+
+def get_tracer(subsystem):
+    '''Returns the tracer of the given subsystem.'''
+    assert subsystem in TRACER_SUBSYSTEMS
+    return logging.getLogger("rmtoo-trace." + subsystem)
+
+
 def tear_down_trace_handler():
     """Remove the (possible) old handlers"""
+    for listener in LOGGING_CONFIG["listener"]:
+        listener.stop()
+    LOGGING_CONFIG["listener"] = []
     for handler in LOGGING_CONFIG["handler"]:
         tracer.removeHandler(handler)
         handler.close()
     LOGGING_CONFIG["handler"] = []
 
 
-def __setup_trace_handler(ltracer):
-    '''Based on the configuration, establish a new set of log handlers.'''
+def __create_formatter():
+    '''Creates the formatter used by all handlers.'''
+    return logging.Formatter(
+        '%(asctime)s;%(name)s;%(levelname)s;%(module)s;'
+        '%(funcName)s;%(lineno)d;%(message)s')
 
-    tear_down_trace_handler()
 
-    # Create a file handle
-    ltracer_fh = logging.FileHandler(LOGGING_CONFIG["tracer"]["filename"])
-    ltracer_fh.setLevel(LOGGING_CONFIG["tracer"]["loglevel"])
+def __add_trace_handler(ltracer, handler):
+    '''Adds the handler to the tracer.'''
+    ltracer.addHandler(handler)
+    LOGGING_CONFIG["handler"].append(handler)
 
-    # create console handler and set level to debug
-    ltracer_ch = logging.StreamHandler()
-    ltracer_ch.setLevel(LOGGING_CONFIG["stdout"]["loglevel"])
 
-    # create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s;%(name)s;%(levelname)s;%(module)s;'
-        '%(funcName)s;%(lineno)d;%(message)s')
+def __create_trace_file_handler():
+    '''Creates the handler which writes into the trace file.'''
+    tconfig = LOGGING_CONFIG["tracer"]
+    ltracer_fh = logging.FileHandler(tconfig["filename"])
+    ltracer_fh.addFilter(SubsystemFilter(tconfig["loglevel"],
+                                         tconfig["subsystems"]))
+    ltracer_fh.setFormatter(__create_formatter())
+    return ltracer_fh
 
-    # add formatter to ch
-    ltracer_ch.setFormatter(formatter)
-    ltracer_fh.setFormatter(formatter)
 
-    # add ch to logger
-    ltracer.addHandler(ltracer_fh)
-    ltracer.addHandler(ltracer_ch)
+def __setup_trace_file_handler(ltracer):
+    '''Establish the handler for the trace file.'''
+    tconfig = LOGGING_CONFIG["tracer"]
+    ltracer_fh = __create_trace_file_handler()
 
-    LOGGING_CONFIG["handler"].append(ltracer_fh)
-    LOGGING_CONFIG["handler"].append(ltracer_ch)
+    if not tconfig["async"]:
+        __add_trace_handler(ltracer, ltracer_fh)
+        return
 
+    # The listener's thread formats and writes the records;
+    # the file handler is closed when the listener is stopped.
+    queue = Queue(-1)
+    listener = QueueListener(queue, ltracer_fh)
+    listener.start()
+    LOGGING_CONFIG["listener"].append(listener)
+    __add_trace_handler(ltracer, QueueHandler(queue))
 
-def __setup_log_handler(mstderr=sys.stderr):
-    '''Set up logger.'''
-    # create console handler and set level to debug
+
+def __setup_trace_handler(ltracer):
+    '''Based on the configuration, establish a new set of log handlers.'''
+
+    tear_down_trace_handler()
+    tconfig = LOGGING_CONFIG["tracer"]
+    stdout_loglevel = LOGGING_CONFIG["stdout"]["loglevel"]
+
+    # create console handler
+    ltracer_ch = logging.StreamHandler()
+    ltracer_ch.setLevel(stdout_loglevel)
+    ltracer_ch.setFormatter(__create_formatter())
+    __add_trace_handler(ltracer, ltracer_ch)
+
+    # The level of the tracers is the first (cheap) check which is
+    # done for each trace call.
+    for subsystem in TRACER_SUBSYSTEMS:
+        get_tracer(subsystem).setLevel(logging.NOTSET)
+    if not tconfig["enabled"]:
+        ltracer.setLevel(stdout_loglevel)
+        return
+
+    ltracer.setLevel(min(tconfig["loglevel"], stdout_loglevel))
+    for subsystem, loglevel in tconfig["subsystems"].items():
+        get_tracer(subsystem).setLevel(min(loglevel, stdout_loglevel))
+    __setup_trace_file_handler(ltracer)
+
+
+def create_log_handler(mstderr):
+    '''Creates the handler which writes the log messages into the
+       given stream.'''
     logger_ch = logging.StreamHandler(mstderr)
     logger_ch.setLevel(logging.INFO)
-    # create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s;%(name)s;%(levelname)s;%(module)s;'
-        '%(funcName)s;%(lineno)d;%(message)s')
-    # add formatter to ch
-    logger_ch.setFormatter(formatter)
-    # add ch to logger
+    logger_ch.setFormatter(__create_formatter())
+    return logger_ch
+
+
+def __setup_log_handler(mstderr=sys.stderr):
+    '''Set up logger.'''
+    logger_ch = create_log_handler(mstderr)
     logger.addHandler(logger_ch)
     LOGGING_CONFIG["log_handler"].append(logger_ch)
 
@@ -91,6 +177,24 @@ def tear_down_log_handler():
     LOGGING_CONFIG["log_handler"] = []
 
 
+def init_worker_logging(log_handler):
+    '''Sets up the logging in a forked worker process: the handlers
+       of the logger which were inherited from the main process are
+       replaced by the given handler.
+       The thread of an asynchronous tracer is not running in the
+       worker: the worker writes directly into the trace file.'''
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(log_handler)
+    # The listeners belong to the main process.
+    LOGGING_CONFIG["listener"] = []
+    for handler in list(LOGGING_CONFIG["handler"]):
+        if QueueHandler is not None and isinstance(handler, QueueHandler):
+            tracer.removeHandler(handler)
+            LOGGING_CONFIG["handler"].remove(handler)
+            __add_trace_handler(tracer, __create_trace_file_handler())
+
+
 def __init_logger_object():
     '''This function sets up the global logger variable.'''
     tracer.debug("rmtoo init logger.")
@@ -116,7 +220,6 @@ def init_tracer():
     function.'''
 
     ltracer = logging.getLogger("rmtoo-trace")
-    ltracer.setLevel(logging.DEBUG)
     ltracer.propagate = False
     __setup_trace_handler(ltracer)
     ltracer.debug("rmtoo tracer system enabled.")
@@ -136,13 +239,30 @@ def configure_logging(cfg, mstderr):
     if cfg.is_available("global.logging.stdout.loglevel"):
         LOGGING_CONFIG["stdout"]["loglevel"] = \
             llmap[cfg.get_value("global.logging.stdout.loglevel")]
+    tconfig = LOGGING_CONFIG["tracer"]
+    tconfig["enabled"] = cfg.is_available("global.logging.tracer")
     if cfg.is_available("global.logging.tracer.loglevel"):
-        LOGGING_CONFIG["tracer"]["loglevel"] = \
+        tconfig["loglevel"] = \
             llmap[cfg.get_value("global.logging.tracer.loglevel")]
     if cfg.is_available("global.logging.tracer.filename"):
-        LOGGING_CONFIG["tracer"]["filename"] = \
+        tconfig["filename"] = \
             cfg.get_value("global.logging.tracer.filename")
-
+    tconfig["async"] = cfg.get_bool("global.logging.tracer.async", False)
+    if tconfig["async"] and QueueHandler is None:
+        tracer.warning("Asynchronous tracing is not supported by this "
+                       "Python version - using synchronous tracing.")
+        tconfig["async"] = False
+    tconfig["subsystems"] = {}
+    if cfg.is_available("global.logging.tracer.subsystems"):
+        for subsystem, loglevel in cfg.get_value(
+                "global.logging.tracer.subsystems").items():
+            if subsystem not in TRACER_SUBSYSTEMS:
+                tracer.warning("Unknown tracer subsystem [%s] - ignored.",
+                               subsystem)
+                continue
+            tconfig["subsystems"][subsystem] = llmap[loglevel]
+
+    __setup_trace_handler(tracer)
     init_logger(mstderr)
 
     tracer.debug("rmtoo logging system configured.")
@@ -152,6 +272,9 @@ def configure_logging(cfg, mstderr):
 # should be lower case.
 # pylint: disable=invalid-name
 tracer = init_tracer()
+# Make sure that the queue of an asynchronous tracer is flushed at
+# the end.
+atexit.register(tear_down_trace_handler)
 # Only the logger object must be created here:
 # Looks that this is in another global space when calling this from this
 # init or from somewhere else.
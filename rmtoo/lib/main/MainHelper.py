@@ -13,6 +13,7 @@ from __future__ import unicode_literals
 from rmtoo.lib.InputModules import InputModules
 from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.configuration.DefaultValues import DefaultValues
+from rmtoo.lib.Profiler import profiler
 
 
 class MainHelper(object):
@@ -34,6 +35,8 @@ class MainHelper(object):
     @staticmethod
     def main_setup(args, _mstdout, _mstderr):
         """Create the config and input modules for the main()"""
-        config = MainHelper.main_setup_config(args)
-        mods = InputModules(config)
+        with profiler.phase("config"):
+            config = MainHelper.main_setup_config(args)
+        with profiler.phase("modules"):
+            mods = InputModules(config)
         return config, mods
@@ -51,15 +51,15 @@ class TxtParser(object):
         "rmtoo-req-format(5) or rmtoo-topic-format(5)"
 
     @staticmethod
-    def split_next_record(split_lines, rid, lineno, _mls):
-        '''Splits off the first record from the given string list.
-        The record is returned and the string list is shortened.
-        Precondition: it can be assumed that len(sl)>0
+    def split_next_record(split_lines, start, rid, lineno, _mls):
+        '''Splits off the record which starts at index 'start' of the
+        given string list.
+        The record and the index of the first line after the record
+        are returned; the string list itself is not modified.
+        Precondition: it can be assumed that start < len(sl)
         '''
-        i = 0
-        sl_len = len(split_lines)
         # The first line must contain the tag.
-        retl = TxtParser.re_tag_line.match(split_lines[i])
+        retl = TxtParser.re_tag_line.match(split_lines[start])
         if not retl:
             raise RMTException(79, "Expected tag line not found",
                                rid, lineno)
@@ -72,26 +72,28 @@ class TxtParser(object):
         tag = retl.group(1)
         content.append(retl.group(2))
 
-        i += 1
+        i = start + 1
+        sl_len = len(split_lines)
         # This is what is needed - to be compatible with the old
         # specification.
         while i < sl_len:
-            if TxtParser.re_tag_line.match(split_lines[i]):
-                break
-            elif split_lines[i] and split_lines[i][0] == " ":
-                content.append(split_lines[i])
+            line = split_lines[i]
+            # Only lines starting with a letter can be tag lines:
+            # check the first character before running the regex.
+            if not line or line[0] == '#':
+                comment.append(line)
+            elif line[0] == " ":
+                content.append(line)
                 if comment:
                     # This is the possible problematic case where
                     # continuation lines are intermixed with comments.
                     logger.info(LogFormatter.format(
                         80, TxtParser.comment_in_req,
-                        rid, lineno+i))
-            elif TxtParser.is_comment_or_empty(split_lines[i]):
-                comment.append(split_lines[i])
+                        rid, lineno + i - start))
+            elif TxtParser.re_tag_line.match(line):
+                break
             i += 1
-        rec = [tag, content, comment]
-        del split_lines[0:i]
-        return rec
+        return [tag, content, comment], i
 
     @staticmethod
     def split_entries(split_lines, rid, mls, lineno_offset):
@@ -99,23 +101,27 @@ class TxtParser(object):
         represent a entry record each.
         The lineno offset is the line number of the first line given in
         the sl array.
+        The string list is walked through once with the help of an index;
+        it is not modified.
         '''
         doc = []
         lineno = lineno_offset
         success = True
-        while split_lines:
+        index = 0
+        sl_len = len(split_lines)
+        while index < sl_len:
             try:
-                next_record \
+                next_record, index \
                     = TxtParser.split_next_record(
-                        split_lines, rid, lineno, mls)
+                        split_lines, index, rid, lineno, mls)
                 doc.append(next_record)
                 lineno += len(next_record[1]) + len(next_record[2])
             except RMTException as rmte:
                 # This is a hint that the tag line could not correctly
                 # parsed.
                 logger.error(LogFormatter.rmte(rmte))
-                # Remove the errornous line
-                del split_lines[0]
+                # Skip the errornous line
+                index += 1
                 lineno += 1
                 success = False
         return success, doc
@@ -0,0 +1,86 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Version Control System.
+   Sampling of the commits of a source.
+   History based outputs (e.g. statistics) typically need only one
+   data point per day or week.  The sampler reduces the list of
+   commits before any TopicSet is created.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import datetime
+import time
+
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.RMTException import RMTException
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
+
+class CommitSampler(object):
+    '''Selects a subset of the commits.
+       The supported policies are:
+       'day', 'week', 'month': the last commit of each time bucket
+       (using the local time like the outputs do),
+       'nth': every n-th commit - starting with the newest one.
+       The newest commit is always part of the result.'''
+
+    policies = ["day", "week", "month", "nth"]
+
+    def __init__(self, policy, count=1):
+        tracer.debug("called: policy [%s] count [%d]", policy, count)
+        if policy not in CommitSampler.policies:
+            raise RMTException(118, "Unknown sampling policy [%s]; "
+                               "must be one of %s"
+                               % (policy, CommitSampler.policies))
+        if count < 1:
+            raise RMTException(119, "Sampling count must be positive; "
+                               "is [%d]" % count)
+        self.__policy = policy
+        self.__count = count
+
+    @staticmethod
+    def create_from_config(cfg):
+        '''Creates a commit sampler if 'sampling' is configured for the
+           source.  If not, None is returned.'''
+        policy = cfg.get_rvalue_default("sampling.policy", None)
+        if policy is None:
+            return None
+        return CommitSampler(policy, cfg.get_integer("sampling.count", 1))
+
+    def __bucket(self, timestamp):
+        '''Returns the time bucket of the given timestamp.'''
+        ltime = time.localtime(timestamp)
+        if self.__policy == "day":
+            return (ltime.tm_year, ltime.tm_yday)
+        if self.__policy == "week":
+            # ISO week: the year of the week can differ from the year
+            # of the day.
+            return datetime.date(ltime.tm_year, ltime.tm_mon,
+                                 ltime.tm_mday).isocalendar()[:2]
+        return (ltime.tm_year, ltime.tm_mon)
+
+    def sample(self, input_handler, commits):
+        '''Returns the list of sampled commits.
+           The commits must be given newest first (like returned by
+           get_commits()); the result has the same order.'''
+        if self.__policy == "nth":
+            result = [commit for idx, commit in enumerate(commits)
+                      if idx % self.__count == 0]
+        else:
+            result = []
+            buckets = set()
+            for commit in commits:
+                bucket = self.__bucket(input_handler.get_timestamp(commit))
+                if bucket not in buckets:
+                    result.append(commit)
+                    buckets.add(bucket)
+        tracer.info("Sampled [%d] commits using policy [%s]",
+                    len(result), self.__policy)
+        return result
@@ -10,7 +10,9 @@
 '''
 from rmtoo.lib.vcs.Git import Git
 from rmtoo.lib.vcs.FileSystem import FileSystem
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
 
 
 # pylint: disable=too-few-public-methods
@@ -15,7 +15,9 @@ from __future__ import unicode_literals
 from six import iteritems
 
 from rmtoo.lib.vcs.Interface import Interface
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
 
 
 # This is a partial implementation only.
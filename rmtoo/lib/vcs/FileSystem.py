@@ -18,10 +18,12 @@ import time
 from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.vcs.Interface import Interface
 from rmtoo.lib.vcs.FileInterface import FileInterface
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.vcs.ObjectCache import ObjectCache
 from rmtoo.lib.RMTException import RMTException
 
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
 
 class FileSystem(FileInterface):
     '''Implementation of the input interface for files in the file system.
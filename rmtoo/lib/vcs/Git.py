@@ -11,7 +11,6 @@
 '''
 from __future__ import unicode_literals
 
-import copy
 import os
 
 import git
@@ -20,9 +19,12 @@ from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.vcs.Interface import Interface
 from rmtoo.lib.vcs.FileInterface import FileInterface
 from rmtoo.lib.vcs.ObjectCache import ObjectCache
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.vcs.GitBatchAccess import GitBatchAccess
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.RMTException import RMTException
 
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
 
 class Git(FileInterface):
     '''Handles a git repository.'''
@@ -87,10 +89,16 @@ class Git(FileInterface):
         self.__start_vers = cfg.get_rvalue("start_vers")
         self.__end_vers = cfg.get_rvalue("end_vers")
         self.__topic_root_node = cfg.get_rvalue("topic_root_node")
+        # Only iterate the commits which change one of the directories.
+        self.__path_filter = cfg.get_bool("path_filter", False)
+        # Only follow the first parent of merge commits.
+        self.__first_parent = cfg.get_bool("first_parent", False)
         tracer.debug("start version [%s] end version [%s] "
-                     "topic root node [%s]",
+                     "topic root node [%s] path filter [%s] "
+                     "first parent [%s]",
                      self.__start_vers, self.__end_vers,
-                     self.__topic_root_node)
+                     self.__topic_root_node, self.__path_filter,
+                     self.__first_parent)
 
         # When the directory is not absolute, convert it to an
         # absolute path that it can be compared to the outcome of the
@@ -99,25 +107,48 @@ class Git(FileInterface):
         self.__repo_base_dir = None
         self.__repo = None
         self.__dirs = self._setup_directories(cfg)
+        # All the directories of all types are listed at once.
+        self.__all_dirs = sorted(set(
+            directory for directories in self.__dirs.values()
+            for directory in directories))
+        self.__git_access = GitBatchAccess(self.__repo, self.__all_dirs)
 
     def get_commits(self):
-        '''Return an iterator for all the commits.'''
+        '''Return an iterator for all the commits.
+           If configured, only the commits which change files in one of
+           the configured directories and / or only the first parents
+           are returned.'''
+        kwargs = {}
+        if self.__path_filter:
+            kwargs["paths"] = self.__all_dirs
+        if self.__first_parent:
+            kwargs["first_parent"] = True
         return self.__repo.iter_commits(
-            self.__start_vers + ".." + self.__end_vers)
+            self.__start_vers + ".." + self.__end_vers, **kwargs)
 
     def get_timestamp(self, commit):
         '''Return the commit time.'''
         return commit.authored_date
 
+    def get_changed_files(self, old_commit, new_commit):
+        '''Returns the set of the filenames which differ between the
+           two commits.'''
+        tracer.debug("called: old commit [%s] new commit [%s]",
+                     old_commit, new_commit)
+        return self.__git_access.get_changed_files(old_commit, new_commit)
+
     class FileInfo(Interface.FileInfo):
         '''Holds information about a file in a repository.
            Typical information are filename, vcs_id.'''
 
-        def __init__(self, base_dir, sub_dir, blob):
+        # pylint: disable=too-many-arguments
+        def __init__(self, base_dir, sub_dir, name, hexsha, git_access):
             Interface.FileInfo.__init__(self)
             self.__base_dir = base_dir
-            self.__blob = blob
             self.__sub_dir = sub_dir
+            self.__name = name
+            self.__hexsha = hexsha
+            self.__git_access = git_access
 
             self.__base_dirname = os.path.join(*self.__base_dir)
             self.__sub_dirname = ""
@@ -125,14 +156,12 @@ class Git(FileInterface):
                 self.__sub_dirname = os.path.join(*self.__sub_dir)
             tracer.debug(self)
             self.__filename = os.path.join(
-                self.__base_dirname, self.__sub_dirname,
-                self.__blob.name)
+                self.__base_dirname, self.__sub_dirname, self.__name)
 
         def __str__(self):
             '''Returns the string representation.'''
             return "base [%s] sub [%s] name [%s]" % \
-                (self.__base_dirname, self.__sub_dirname,
-                 self.__blob.name)
+                (self.__base_dirname, self.__sub_dirname, self.__name)
 
         def get_filename(self):
             '''Returns the filename.'''
@@ -140,65 +169,40 @@ class Git(FileInterface):
 
         def get_vcs_id(self):
             '''Returns the vcs id of this file.'''
-            return self.__blob.hexsha
+            return self.__hexsha
 
         def get_filename_sub_part(self):
             '''Return the part of the filename which is beneath the
                base directory.'''
-            return os.path.join(self.__sub_dirname, self.__blob.name)
+            return os.path.join(self.__sub_dirname, self.__name)
 
         def get_content(self):
             '''Returns the file content.'''
-            return self.__blob.data_stream.read().decode("utf-8")
-
-    def __get_tree_direct(self, base_tree, directory):
-        '''Return the tree of the given directory.
-           This does not walk down the directory structure.
-           It just checks the current hierarchy.'''
-        for tree in base_tree.trees:
-            if tree.name == directory:
-                return tree
-        raise RMTException(108, "directory entry [%s] not found in tree "
-                           "[%s]." % (directory, base_tree.name))
-
-    def __get_tree(self, base_tree, dir_split):
-        '''Returns the tree starting from the base_tree walking down
-           the path of dir_split.'''
-        tree = self.__get_tree_direct(base_tree, dir_split[0])
-        if len(dir_split) > 1:
-            return self.__get_tree(tree, dir_split[1:])
-        return tree
-
-    def __get_file_infos_from_tree_rec(self, tree, base_dir, sub_dir):
-        '''Returns recursively all file infos.'''
-        tracer.info("called: base [%s] sub [%s]", base_dir, sub_dir)
-        result = []
-        for blob in tree.blobs:
-            result.append(Git.FileInfo(base_dir, sub_dir, blob))
-        for stree in tree.trees:
-            sub_sub_dir = copy.deepcopy(sub_dir)
-            sub_sub_dir.append(stree.name)
-            result.extend(self.__get_file_infos_from_tree_rec(
-                stree, base_dir, sub_sub_dir))
-        return result
+            return self.__git_access.read_blob(self.__hexsha).decode("utf-8")
+
+        def get_content_digest(self):
+            '''The blob id is already the digest of the content.'''
+            return self.__hexsha
 
-    def __get_file_infos_from_tree(self, tree, base_dir):
+    def __get_file_infos_from_tree(self, commit, base_dir):
         '''Returns all the file infos recursive starting with
            the given directory.'''
         tracer.info("called: base [%s]", base_dir)
         base_dir_split = base_dir.split("/")
-        ltree = self.__get_tree(tree, base_dir_split)
-        return self.__get_file_infos_from_tree_rec(ltree, base_dir_split, [])
+        return [Git.FileInfo(base_dir_split, sub_dir, name, hexsha,
+                             self.__git_access)
+                for sub_dir, name, hexsha
+                in self.__git_access.get_listing(commit).get_blobs_rec(
+                    base_dir)]
 
     def get_vcs_id_with_type(self, commit, dir_type):
         '''Return the vcs id from the base dir of the given dir_type.'''
         tracer.debug("called: commit [%s] directory type [%s]",
                      commit, dir_type)
+        listing = self.__git_access.get_listing(commit)
         result = []
         for directory in self.__dirs[dir_type]:
-            dir_split = directory.split("/")
-            ltree = self.__get_tree(commit.tree, dir_split)
-            result.append(ltree.hexsha)
+            result.append(listing.get_tree_hexsha(directory))
         return ObjectCache.create_hashable(result)
 
     def get_file_infos(self, commit, dir_type):
@@ -212,21 +216,12 @@ class Git(FileInterface):
 
         result = []
         for directory in self.__dirs[dir_type]:
-            result.extend(self.__get_file_infos_from_tree(
-                commit.tree, directory))
+            result.extend(self.__get_file_infos_from_tree(commit, directory))
         return result
 
-    def __get_blob_direct(self, base_tree, filename):
-        '''Return the tree of the given file (blob).
-           This does not walk down the directory structure.
-           It just checks the current hierarchy.'''
-        for blob in base_tree.blobs:
-            if blob.name == filename:
-                return blob
-        return None
-
-    def __get_blob(self, commit, base_dir, sub_path):
-        '''Returns the blob from the give base directory and path.
+    def __get_blob_hexsha(self, commit, base_dir, sub_path):
+        '''Returns the hexsha of the blob from the give base directory
+           and path.
            If the file (blob) is not available, a None is returned.
            If the directory is not available / accessable an exception
            is thrown.'''
@@ -235,8 +230,8 @@ class Git(FileInterface):
         sub_path_split = sub_path.split("/")
         if len(sub_path_split) > 1:
             full_path.extend(sub_path_split[:-1])
-        ltree = self.__get_tree(commit.tree, full_path)
-        return self.__get_blob_direct(ltree, sub_path_split[-1])
+        return self.__git_access.get_listing(commit).get_blob_hexsha(
+            "/".join(full_path), sub_path_split[-1])
 
     def get_file_info_with_type(self, commit, file_type, filename):
         '''Returns the FileInfo object for the given filename.'''
@@ -244,10 +239,12 @@ class Git(FileInterface):
                      commit, file_type, filename)
         for directory in self.__dirs[file_type]:
             tracer.debug("searching in directory [%s]", directory)
-            blob = self.__get_blob(commit, directory, filename)
-            if blob is not None:
+            hexsha = self.__get_blob_hexsha(commit, directory, filename)
+            if hexsha is not None:
                 dir_split = directory.split("/")
                 sub_split = os.path.dirname(filename).split("/")
-                return Git.FileInfo(dir_split, sub_split, blob)
+                return Git.FileInfo(dir_split, sub_split,
+                                    os.path.basename(filename), hexsha,
+                                    self.__git_access)
         raise RMTException(111, "file [%s] in [%s] base file not found"
                            % (filename, file_type))
@@ -0,0 +1,126 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Version Control System.
+   Batched access to the trees and blobs of a git repository.
+   All configured directories of a commit are listed with one
+   recursive 'git ls-tree' call; blob contents are read using the
+   persistent 'git cat-file --batch' process of GitPython.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+from rmtoo.lib.logging import get_tracer
+from rmtoo.lib.RMTException import RMTException
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
+
+class GitTreeListing(object):
+    '''The listing of all configured directories of one commit.'''
+
+    def __init__(self, ls_tree_output):
+        # Key is the path, value is the tuple (type, hexsha).
+        self.__entries = {}
+        # Key is the path of a directory, value the list of
+        # (name, type, hexsha) in git order.
+        self.__children = {}
+        for line in ls_tree_output.split("\0"):
+            if not line:
+                continue
+            meta, path = line.split("\t", 1)
+            _, otype, hexsha = meta.split(" ")
+            self.__entries[path] = (otype, hexsha)
+            dirname, _, name = path.rpartition("/")
+            self.__children.setdefault(dirname, []).append(
+                (name, otype, hexsha))
+
+    def __check_tree(self, directory):
+        '''Raises an exception if the directory is not in the listing.
+           The same error is raised like the one if the tree is walked
+           down step by step.'''
+        if directory in self.__entries \
+           and self.__entries[directory][0] == "tree":
+            return
+        parent = ""
+        for name in directory.split("/"):
+            path = parent + "/" + name if parent else name
+            if path not in self.__entries:
+                raise RMTException(108, "directory entry [%s] not found in "
+                                   "tree [%s]." % (name,
+                                                   parent.split("/")[-1]))
+            parent = path
+
+    def get_tree_hexsha(self, directory):
+        '''Returns the hexsha of the tree of the given directory.'''
+        self.__check_tree(directory)
+        return self.__entries[directory][1]
+
+    def get_blob_hexsha(self, directory, filename):
+        '''Returns the hexsha of the blob of the file in the given
+           directory or None if there is no such file.'''
+        self.__check_tree(directory)
+        entry = self.__entries.get(directory + "/" + filename)
+        if entry is None or entry[0] != "blob":
+            return None
+        return entry[1]
+
+    def get_blobs_rec(self, directory):
+        '''Returns all the blobs beneath the given directory as a list
+           of (sub directory list, name, hexsha).
+           The blobs of a directory come first, then the blobs of the
+           sub-directories.'''
+        self.__check_tree(directory)
+        result = []
+        self.__get_blobs_rec(directory, [], result)
+        return result
+
+    def __get_blobs_rec(self, directory, sub_dir, result):
+        '''Collects the blobs of the directory recursively.'''
+        children = self.__children.get(directory, [])
+        for name, otype, hexsha in children:
+            if otype == "blob":
+                result.append((sub_dir, name, hexsha))
+        for name, otype, _ in children:
+            if otype == "tree":
+                self.__get_blobs_rec(directory + "/" + name,
+                                     sub_dir + [name], result)
+
+
+class GitBatchAccess(object):
+    '''Reads the listings of commits and the contents of blobs.
+       The listing of the last used commit is kept: all the calls for
+       one commit (vcs ids, file infos, topic files) are served from
+       one 'git ls-tree' call.'''
+
+    def __init__(self, repo, directories):
+        self.__repo = repo
+        self.__directories = directories
+        self.__listing_hexsha = None
+        self.__listing = None
+
+    def get_listing(self, commit):
+        '''Returns the listing of all directories for the commit.'''
+        if self.__listing_hexsha != commit.hexsha:
+            tracer.debug("Listing commit [%s]", commit.hexsha)
+            self.__listing = GitTreeListing(self.__repo.git.ls_tree(
+                "-r", "-t", "-z", "--full-tree", commit.hexsha, "--",
+                *self.__directories))
+            self.__listing_hexsha = commit.hexsha
+        return self.__listing
+
+    def get_changed_files(self, old_commit, new_commit):
+        '''Returns the set of paths of all the files in the configured
+           directories which differ between the two commits.'''
+        return set(path for path in self.__repo.git.diff_tree(
+            "-r", "--name-only", "--no-renames", "-z", old_commit.hexsha,
+            new_commit.hexsha, "--", *self.__directories).split("\0")
+                   if path)
+
+    def read_blob(self, hexsha):
+        '''Returns the content of the blob as bytes.'''
+        return self.__repo.git.get_object_data(hexsha)[3]
@@ -12,11 +12,14 @@
 from __future__ import unicode_literals
 
 import abc
+import hashlib
 
 from rmtoo.lib.Encoding import Encoding
 from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.storagebackend.txtfile.TxtIOConfig import TxtIOConfig
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
 
 
 class Interface(object):
@@ -59,6 +62,14 @@ class Interface(object):
         assert commit
         assert False
 
+    # pylint: disable=no-self-use,unused-argument
+    def get_changed_files(self, old_commit, new_commit):
+        '''Returns the set of the filenames (as returned by
+           FileInfo.get_filename()) which differ between the two
+           commits.  None means that this is not known: all files must
+           be handled as changed.'''
+        return None
+
     # pylint: disable=no-init
     class FileInfo:
         '''Holds information about a file in a repository.
@@ -88,6 +99,11 @@ class Interface(object):
             '''Returns the file content.'''
             assert False
 
+        def get_content_digest(self):
+            '''Returns the digest of the file content.'''
+            return hashlib.sha256(
+                self.get_content().encode("utf-8")).hexdigest()
+
         @abc.abstractmethod
         def __str__(self):
             '''Returns the string representation.'''
@@ -106,6 +122,19 @@ class Interface(object):
         '''Returns the FileInfo object for the given filename.'''
         assert False
 
+    def get_content_digest(self, commit, dir_type):
+        '''Returns the digest of the names and the contents of all
+           the files of the given commit and directory type.'''
+        tracer.debug("called: commit [%s] directory type [%s]",
+                     commit, dir_type)
+        content_hash = hashlib.sha256()
+        for filename, digest in sorted(
+                (file_info.get_filename(), file_info.get_content_digest())
+                for file_info in self.get_file_infos(commit, dir_type)):
+            content_hash.update(("%s\n%s\n" % (filename, digest))
+                                .encode("utf-8"))
+        return content_hash.hexdigest()
+
     # Common helper methods
     @staticmethod
     def _check_list_of_strings(name, tbc):
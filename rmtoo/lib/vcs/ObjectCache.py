@@ -4,23 +4,28 @@
 
   Caches objects.
    This class caches objects.  The ID is the unique VCS id.
+   Optionally a PersistentCache can be given which stores the parsed
+   state of objects between different runs.
 
  (c) 2010-2011,2017 by flonatel GmbH & Co. KG
 
  For licensing details see COPYING
 '''
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.RMTException import RMTException
 
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
 
 class ObjectCache(object):
     '''Stores objects from different types under a unique id.
        Each class has a separate store: it is possible to
        have the same id for multiple objects of different types.'''
 
-    def __init__(self):
+    def __init__(self, persistent_cache=None):
         '''Creates a cache for the given object_type.'''
         self.__objects = {}
+        self.__persistent_cache = persistent_cache
         self.__stats_cnt_objects = 0
         self.__stats_cnt_object_types = 0
         self.__stats_cnt_get = 0
@@ -35,6 +40,14 @@ class ObjectCache(object):
                     self.__stats_cnt_get, self.__stats_cnt_get_found,
                     float(self.__stats_cnt_get_found) /
                     self.__stats_cnt_get)
+        if self.__persistent_cache is not None:
+            hit, miss, added, evicted, size = \
+                self.__persistent_cache.get_stats()
+            tracer.info("Persistent cache usage statistics: hit [%d] "
+                        "miss [%d] added [%d] evicted [%d] size [%d] "
+                        "cache hit ratio [%4.3f]",
+                        hit, miss, added, evicted, size,
+                        float(hit) / max(hit + miss, 1))
 
     @staticmethod
     def create_hashable(oid):
@@ -59,6 +72,12 @@ class ObjectCache(object):
             return self.__objects[object_type][oid]
         return None
 
+    def contains(self, object_type, oid):
+        '''Returns True if an object with the given id is in the cache.
+           In contrast to get() this is not counted in the statistics.'''
+        return object_type in self.__objects \
+            and oid in self.__objects[object_type]
+
     def add(self, oid, object_type, obj):
         '''Adds the given object to the cache using the given object id.
            Checks of the object is of the correct type and if
@@ -76,3 +95,25 @@ class ObjectCache(object):
                                % oid)
         self.__stats_cnt_objects += 1
         self.__objects[object_type][oid] = obj
+
+    def is_persistent(self):
+        '''Returns True if there is a persistent cache.'''
+        return self.__persistent_cache is not None
+
+    def create_persistent_key(self, object_type, content, module_names):
+        '''Returns the key under which the parsed state of an object
+           with the given type and content is stored in the persistent
+           cache.'''
+        return self.__persistent_cache.create_key(
+            object_type, content, module_names)
+
+    def get_persistent(self, pkey):
+        '''Returns the parsed state from the persistent cache or None
+           if not available.'''
+        tracer.debug("called: key [%s]", pkey)
+        return self.__persistent_cache.get(pkey)
+
+    def add_persistent(self, pkey, state):
+        '''Stores the parsed state in the persistent cache.'''
+        tracer.debug("adding state with key [%s]", pkey)
+        self.__persistent_cache.add(pkey, state)
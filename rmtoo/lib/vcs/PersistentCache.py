@@ -0,0 +1,219 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Persistent (on disk) cache for parsed objects.
+   The ObjectCache only lives as long as the process.  This cache
+   stores the parsed state of requirements, constraints and test cases
+   in a directory, so that it can be reused by later runs.
+   The key of an entry is computed from the content of the file,
+   the rmtoo version and source code, the set of active input modules
+   and the configuration.
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import hashlib
+import json
+import os
+import tempfile
+
+from six.moves import cPickle as pickle
+
+from rmtoo.lib.logging import get_tracer
+
+tracer = get_tracer("vcs")  # pylint: disable=invalid-name
+
+
+def get_rmtoo_version():
+    '''Returns the version of the installed rmtoo package.
+    If rmtoo is not installed (e.g. running from the source tree),
+    'unknown' is returned.'''
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return version("rmtoo")
+        except PackageNotFoundError:
+            return "unknown"
+    except ImportError:
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution("rmtoo").version
+        except pkg_resources.DistributionNotFound:
+            return "unknown"
+
+
+def compute_code_digest(package_dir):
+    '''Returns the digest of all the python source files in the given
+    package directory (without the tests).'''
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        if dirpath == package_dir and "tests" in dirnames:
+            dirnames.remove("tests")
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, package_dir)
+                          .replace(os.sep, "/").encode("utf-8") + b"\0")
+            with open(path, "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+# The code version is computed only once for each process.
+_CODE_VERSION = []
+
+
+def get_rmtoo_code_version():
+    '''Returns the version and the digest of the source code of rmtoo.
+    When running from the source tree, the version is always 'unknown':
+    the digest ensures that results stored by a different code are
+    not used.'''
+    if not _CODE_VERSION:
+        package_dir = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        _CODE_VERSION.append("%s %s" % (get_rmtoo_version(),
+                                        compute_code_digest(package_dir)))
+    return _CODE_VERSION[0]
+
+
+class PersistentCache(object):
+    '''Stores picklable states under a key which is computed from the
+       content and the environment.
+       Each entry is one file in the cache directory.  When the size
+       of all entries exceeds the configured maximum, the least
+       recently used entries are removed.'''
+
+    # Default maximum size of the cache directory in bytes.
+    default_max_size = 64 * 1024 * 1024
+
+    def __init__(self, directory, max_size, config_digest):
+        '''Creates a persistent cache in the given directory.'''
+        tracer.debug("called: directory [%s] max size [%d]",
+                     directory, max_size)
+        self.__directory = directory
+        self.__max_size = max_size
+        self.__env_digest = hashlib.sha256(
+            ("%s\n%s" % (get_rmtoo_code_version(), config_digest))
+            .encode("utf-8")).hexdigest()
+        if not os.path.isdir(self.__directory):
+            os.makedirs(self.__directory)
+        self.__size = self.__compute_size()
+        self.__stats_cnt_hit = 0
+        self.__stats_cnt_miss = 0
+        self.__stats_cnt_add = 0
+        self.__stats_cnt_evicted = 0
+
+    @staticmethod
+    def create_from_config(config):
+        '''Creates a persistent cache if it is configured in
+           'processing.cache'.  If not, None is returned.'''
+        directory = config.get_rvalue_default(
+            "processing.cache.directory", None)
+        if directory is None:
+            tracer.debug("No persistent cache configured.")
+            return None
+        max_size = config.get_integer(
+            "processing.cache.max_size", PersistentCache.default_max_size)
+        # The topics contain only the sources and the outputs which
+        # have no influence on the parsing.
+        config_digest = json.dumps(
+            dict((key, value) for key, value in config.items()
+                 if key != "topics"), sort_keys=True, default=str)
+        return PersistentCache(directory, max_size, config_digest)
+
+    def __entry_files(self):
+        '''Returns the file names of all the cache entries.'''
+        return [os.path.join(self.__directory, filename)
+                for filename in os.listdir(self.__directory)
+                if filename.endswith(".pickle")]
+
+    def __compute_size(self):
+        '''Computes the size of all cache entries.'''
+        return sum(os.path.getsize(filename)
+                   for filename in self.__entry_files())
+
+    def create_key(self, object_type, content, module_names):
+        '''Computes the key for an object of the given type, the given
+           (file) content and the list of names of the input modules.'''
+        key_hash = hashlib.sha256()
+        key_hash.update(self.__env_digest.encode("utf-8"))
+        key_hash.update(("\n%s\n%s\n" % (
+            object_type, ",".join(sorted(module_names)))).encode("utf-8"))
+        key_hash.update(content.encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def __filename(self, key):
+        '''Returns the file name of the cache entry with the given key.'''
+        return os.path.join(self.__directory, key + ".pickle")
+
+    def get(self, key):
+        '''Returns the state stored under the given key or None if
+           there is no (usable) entry.'''
+        filename = self.__filename(key)
+        try:
+            with open(filename, "rb") as cache_fd:
+                state = pickle.load(cache_fd)
+        except (IOError, OSError):
+            self.__stats_cnt_miss += 1
+            return None
+        # pylint: disable=broad-except
+        except Exception as excp:
+            # A broken entry (e.g. from an incompatible python version)
+            # is handled like a missing one.
+            tracer.info("Removing unusable cache entry [%s]: [%s]",
+                        filename, excp)
+            self.__remove(filename)
+            self.__stats_cnt_miss += 1
+            return None
+        # Mark as recently used
+        os.utime(filename, None)
+        self.__stats_cnt_hit += 1
+        return state
+
+    def add(self, key, state):
+        '''Stores the state under the given key.'''
+        filename = self.__filename(key)
+        if os.path.exists(filename):
+            return
+        tmp_fd, tmp_filename = tempfile.mkstemp(
+            dir=self.__directory, suffix=".tmp")
+        with os.fdopen(tmp_fd, "wb") as cache_fd:
+            pickle.dump(state, cache_fd, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_filename, filename)
+        self.__stats_cnt_add += 1
+        self.__size += os.path.getsize(filename)
+        if self.__size > self.__max_size:
+            self.__evict()
+
+    def __remove(self, filename):
+        '''Removes one entry from the cache.'''
+        try:
+            size = os.path.getsize(filename)
+            os.remove(filename)
+        except OSError:
+            return
+        self.__size -= size
+
+    def __evict(self):
+        '''Removes the least recently used entries until the size of
+           the cache is below the maximum size.'''
+        tracer.debug("Evicting entries: size [%d] max size [%d]",
+                     self.__size, self.__max_size)
+        for filename in sorted(self.__entry_files(), key=os.path.getmtime):
+            if self.__size <= self.__max_size:
+                break
+            self.__remove(filename)
+            self.__stats_cnt_evicted += 1
+
+    def get_stats(self):
+        '''Returns the usage statistics as a tuple:
+           hit, miss, added, evicted, size.'''
+        return (self.__stats_cnt_hit, self.__stats_cnt_miss,
+                self.__stats_cnt_add, self.__stats_cnt_evicted,
+                self.__size)
@@ -18,9 +18,11 @@ from rmtoo.lib.Constraints import Constraints
 from rmtoo.lib.TestCases import collect
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class LatexJinja2(StdOutputParams, ExecutorTopicContinuum,
                   CreateMakeDependencies):
@@ -83,7 +85,7 @@ class LatexJinja2(StdOutputParams, ExecutorTopicContinuum,
     def __output_latex_one_constraint(self, cname, cnstrt):
         '''Output one constraint.'''
         cname = LatexJinja2.__strescape(cname)
-        tracer.debug("Output constraint [%s]." % cname)
+        tracer.debug("Output constraint [%s].", cname)
         self.__fd.write(u"%% CONSTRAINT '%s'\n" % cname)
 
         self.__fd.write(u"\%s{%s}\label{CONSTRAINT%s}\n"
@@ -128,7 +130,7 @@ class LatexJinja2(StdOutputParams, ExecutorTopicContinuum,
     def __output_latex_one_testcase(self, cname, cnstrt):
         '''Output one testcase.'''
         cname = LatexJinja2.__strescape(cname)
-        tracer.debug("Output testcase [%s]." % cname)
+        tracer.debug("Output testcase [%s].", cname)
         self.__fd.write(u"%% TEST-CASE '%s'\n" % cname)
 
         self.__fd.write(u"\%s{%s}\label{TESTCASE%s}\n"
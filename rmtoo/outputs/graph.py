@@ -17,10 +17,12 @@ from rmtoo.lib.ClassType import ClassTypeImplementable, \
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.Requirement import RequirementType
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class graph(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
     default_config = Cfg.new_by_json_str(
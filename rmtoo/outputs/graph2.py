@@ -13,11 +13,13 @@
 '''
 
 from rmtoo.outputs.graph import graph
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class graph2(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
     '''The output class handling graph2.
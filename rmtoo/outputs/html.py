@@ -16,9 +16,11 @@ import os
 from rmtoo.lib.Markup import Markup
 from rmtoo.lib.configuration.Cfg import Cfg
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
 class Html(ExecutorTopicContinuum, CreateMakeDependencies):
@@ -30,6 +32,8 @@ class Html(ExecutorTopicContinuum, CreateMakeDependencies):
         self._config = Cfg(oconfig)
         CreateMakeDependencies.__init__(self)
         self.__fd_stack = []
+        self.__filename_stack = []
+        self.__build_manifest_record = None
         self.__topic_name_set = []
         # Take care about the openess of the ul.
         self.__ul_open_stack = []
@@ -41,6 +45,10 @@ class Html(ExecutorTopicContinuum, CreateMakeDependencies):
         self.html_footer_filename = self._config.get_rvalue('footer')
         self.read_html_arts()
 
+    def init_build_manifest(self, record):
+        '''Pages which did not change are not written again.'''
+        self.__build_manifest_record = record
+
     def __ouput_html_topic_mkdirs(self):
         '''If not already there, create the directory.'''
         try:
@@ -67,18 +75,30 @@ class Html(ExecutorTopicContinuum, CreateMakeDependencies):
            This method is called once for each topic and subtopic.'''
         tracer.debug("Called: topic name [%s]", topic.name)
         filename = os.path.join(self.__output_directory, topic.name + ".html")
-        out_fd = io.open(filename, "w", encoding="utf-8")
+        # The page is written when it is complete: with a build
+        # manifest unchanged pages are not written at all.
+        out_fd = io.StringIO()
         self.__output_html_topic_write_header(out_fd)
         self.__fd_stack.append(out_fd)
+        self.__filename_stack.append(filename)
         self.__ul_open_stack.append(False)
         # self.output_html_topic_output_content(fd, topic)
 
     def topic_post(self, topic):
         '''Write out the footer and do clean ups.'''
         out_fd = self.__fd_stack.pop()
+        filename = self.__filename_stack.pop()
         self.__ul_open_stack.pop()
         self.output_html_topic_write_footer(out_fd)
+        content = out_fd.getvalue()
         out_fd.close()
+        if self.__build_manifest_record is not None \
+                and self.__build_manifest_record.is_page_unchanged(
+                    filename, content):
+            tracer.debug("Page [%s] unchanged - not written.", filename)
+        else:
+            with io.open(filename, "w", encoding="utf-8") as page_fd:
+                page_fd.write(content)
         tracer.debug("Finished: topic name [%s]", topic.name)
 
     def topic_name(self, name):
@@ -18,9 +18,11 @@ from rmtoo.lib.TestCases import collect
 from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class latex2(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
     default_config = {"req_attributes":
@@ -70,7 +72,7 @@ class latex2(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
     def __output_latex_one_constraint(self, cname, cnstrt):
         '''Output one constraint.'''
         cname = latex2.__strescape(cname)
-        tracer.debug("Output constraint [%s]." % cname)
+        tracer.debug("Output constraint [%s].", cname)
         self.__fd.write(u"%% CONSTRAINT '%s'\n" % cname)
 
         self.__fd.write(u"\%s{%s}\label{CONSTRAINT%s}\n"
@@ -115,7 +117,7 @@ class latex2(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
     def __output_latex_one_testcase(self, cname, cnstrt):
         '''Output one testcase.'''
         cname = latex2.__strescape(cname)
-        tracer.debug("Output testcase [%s]." % cname)
+        tracer.debug("Output testcase [%s].", cname)
         self.__fd.write(u"%% TEST-CASE '%s'\n" % cname)
 
         self.__fd.write(u"\%s{%s}\label{TESTCASE%s}\n"
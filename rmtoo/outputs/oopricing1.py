@@ -14,7 +14,7 @@ from six import iteritems
 from rmtoo.lib.digraph.TopologicalSort import topological_sort
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
 # imports from python-odf
@@ -28,6 +28,8 @@ import odf.draw
 import odf.number
 import odf.dc
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 DEPS_HEADER_LEN = 6
 
 
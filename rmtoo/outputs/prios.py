@@ -14,7 +14,7 @@
 #  the different lists.
 #
 
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
 
 import datetime
@@ -30,9 +30,14 @@ from rmtoo.lib.Statistics import Statistics
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class prios(StdOutputParams, ExecutorTopicContinuum, CreateMakeDependencies):
 
+    # The content depends on the start and end date.
+    uses_dates = True
+
     def __init__(self, oconfig):
         '''Create a prios output object.'''
         tracer.info("Called.")
@@ -11,14 +11,19 @@
 
 from rmtoo.lib.Statistics import Statistics
 from rmtoo.lib.StdOutputParams import StdOutputParams
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class stats_sprint_burndown1(StdOutputParams, ExecutorTopicContinuum,
                              CreateMakeDependencies):
 
+    # The content depends on the start and end date.
+    uses_dates = True
+
     def __init__(self, oconfig):
         '''Create a graph output object.'''
         tracer.info("Called.")
@@ -9,11 +9,13 @@
  For licensing details see COPYING
 '''
 
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class Tlp1(StdOutputParams, ExecutorTopicContinuum,
            CreateMakeDependencies):
@@ -29,9 +29,11 @@ from rmtoo.lib.RequirementStatus import \
     RequirementStatusAssigned, RequirementStatusFinished
 from rmtoo.lib.StdOutputParams import StdOutputParams
 from rmtoo.lib.ExecutorTopicContinuum import ExecutorTopicContinuum
-from rmtoo.lib.logging import tracer
+from rmtoo.lib.logging import get_tracer
 from rmtoo.lib.CreateMakeDependencies import CreateMakeDependencies
 
+tracer = get_tracer("output")  # pylint: disable=invalid-name
+
 
 class xml_ganttproject_2(StdOutputParams, ExecutorTopicContinuum,
                          CreateMakeDependencies):
@@ -100,7 +102,7 @@ class xml_ganttproject_2(StdOutputParams, ExecutorTopicContinuum,
         xml_task.setAttribute("id", str(self.get_req_id(
                     "TOPIC-" + topic.name)))
         self.__xml_obj_stack.append(xml_task)
-        tracer.debug("Finished; xml document stack length [%s]" %
+        tracer.debug("Finished; xml document stack length [%s]",
                      len(self.__xml_obj_stack))
 
     def topic_post(self, _topic):
@@ -108,7 +110,7 @@ class xml_ganttproject_2(StdOutputParams, ExecutorTopicContinuum,
         # Add the xml_task to the current document
         xml_task = self.__xml_obj_stack.pop()
         self.__xml_obj_stack[-1].appendChild(xml_task)
-        tracer.debug("Finished; xml document stack length [%s]" %
+        tracer.debug("Finished; xml document stack length [%s]",
                      len(self.__xml_obj_stack))
 
     def requirement_set_sort(self, list_to_sort):
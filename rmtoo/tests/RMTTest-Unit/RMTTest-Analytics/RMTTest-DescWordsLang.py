@@ -19,6 +19,7 @@ except ImportError:
 
 from rmtoo.lib.analytics.DescWords import DescWords
 from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.RMTException import RMTException
 
 
 class TestConfig1(Cfg):
@@ -63,3 +64,62 @@ class RMTTestDescWords(unittest.TestCase):
         tc = TestConfig2()
         lang = DescWords.get_lang(tc)
         self.assertEqual(lang, DescWords.words_en_GB)
+
+    def rmttest_pos_02(self):
+        "DescWords: markup is removed once and all words are counted."
+
+        desc_words = DescWords(TestConfig1())
+        res = desc_words.analyse(
+            "lname", "The system \\textbf{must} write the output "
+            "and it may be, e.g. some data. Done")
+        self.assertEqual(-80, res.get_value())
+
+        fd = StringIO()
+        res.write_error(fd)
+        prefix = "+++ Error:Analytics:DescWords:lname:"
+        self.assertEqual(
+            "".join(prefix + line + "\n" for line in [
+                "result is '-80'",
+                " -30:2*-15: Additional fullstop (not only at the end "
+                "of the desctiption)",
+                " -10:1*-10: Usage of the word 'and'",
+                " -40:1*-40: Usage of the word 'e.g.'",
+                " +10:1*10: Usage of the word 'may'",
+                " +25:1*25: Usage of the word 'must'",
+                " -25:1*-25: Usage of the word 'some'"]),
+            fd.getvalue())
+
+    def rmttest_pos_03(self):
+        "DescWords: additional words from the configuration."
+
+        config = TestConfig1()
+        config.set_value(
+            'processing.analytics.descwords.words.en_GB',
+            [[" data ", -20, "Usage of the word 'data'"]])
+        desc_words = DescWords(config)
+        self.assertEqual(len(DescWords.words_en_GB) + 1,
+                         len(desc_words.lwords))
+        res = desc_words.analyse("lname", "Me must write data and data")
+        # The data at the end is not surrounded by blanks.
+        self.assertEqual(-15, res.get_value())
+
+    def rmttest_pos_04(self):
+        "DescWords: words for a language which is not built in."
+
+        config = TestConfig2()
+        config.set_value(
+            'processing.analytics.descwords.words.kl_EL',
+            [[" Qapla' ", 50, "Usage of the word 'Qapla''"]])
+        res = DescWords(config).analyse("lname", "Heghlu'meH QaQ jajvam "
+                                        "Qapla' batlh")
+        self.assertEqual(40, res.get_value())
+
+    def rmttest_neg_03(self):
+        "DescWords: invalid configured word."
+
+        config = TestConfig1()
+        config.set_value(
+            'processing.analytics.descwords.words.en_GB', [" data "])
+        with self.assertRaises(RMTException) as rmte:
+            DescWords(config)
+        self.assertEqual(117, rmte.exception.get_id())
@@ -0,0 +1,191 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the analytics engine
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from rmtoo.lib.analytics.Engine import Engine
+from rmtoo.lib.analytics.HotSpot import HotSpot
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.Profiler import profiler
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+
+class RequirementMock(object):
+    '''Requirement with id, description, topic and links.'''
+
+    class ValueMock(object):
+        '''The description value.'''
+
+        def __init__(self, content):
+            self.__content = content
+
+        def get_content(self):
+            return self.__content
+
+    # Number of calls of get_value("Description")
+    description_calls = 0
+
+    def __init__(self, rid, description, incoming=0, outgoing=0):
+        self.__rid = rid
+        self.__description = description
+        self.incoming = [self] * incoming
+        self.outgoing = [self] * outgoing
+
+    def get_id(self):
+        return self.__rid
+
+    def get_value(self, key):
+        if key == "Description":
+            RequirementMock.description_calls += 1
+            return RequirementMock.ValueMock(self.__description)
+        assert key == "Topic"
+        return "T"
+
+
+class RMTTestEngine(unittest.TestCase):
+
+    @staticmethod
+    def __walk(engine, requirements):
+        '''Calls the engine like a walk over one requirement set.'''
+        for requirement in engine.requirement_set_sort(requirements):
+            engine.requirement(requirement)
+        engine.requirement_set_post(None)
+
+    @staticmethod
+    def __result_ids(analytics):
+        '''Returns the ids of the requirements with results.'''
+        mstderr = StringIO()
+        analytics.write_result(mstderr)
+        return [line.split(":")[3] for line in mstderr.getvalue().split("\n")
+                if "result is" in line]
+
+    def rmttest_pos_01(self):
+        "Engine: all modules are enabled by default"
+        self.assertEqual(
+            ["descwords", "hotspot", "reqtopiccohe", "topiccohe"],
+            [name for name, _ in Engine(Cfg()).get_analytics()])
+
+    def rmttest_pos_02(self):
+        "Engine: modules can be disabled"
+        config = Cfg()
+        config.set_value("processing.analytics.hotspot.enabled", False)
+        config.set_value("processing.analytics.topiccohe.enabled", "no")
+        self.assertEqual(
+            ["descwords", "reqtopiccohe"],
+            [name for name, _ in Engine(config).get_analytics()])
+
+    def rmttest_pos_03(self):
+        "Engine: each module gets the requirements in its own order"
+        config = Cfg()
+        config.set_value("processing.analytics.hotspot.max_incoming", 0)
+        engine = Engine(config)
+        self.__walk(engine, [RequirementMock("B", "B and B", 1),
+                             RequirementMock("A", "A and A", 1)])
+        analytics = dict(engine.get_analytics())
+        # DescWords sorts by id, HotSpot uses the order of the walk.
+        self.assertEqual(["A", "B"],
+                         self.__result_ids(analytics["descwords"]))
+        self.assertEqual(["B", "A"],
+                         self.__result_ids(analytics["hotspot"]))
+
+    def rmttest_pos_04(self):
+        "Engine: HotSpot thresholds from the configuration"
+        requirement = RequirementMock("A", "", 8, 5)
+        hot_spot = HotSpot(Cfg())
+        hot_spot.requirement(requirement)
+        self.assertFalse(hot_spot.get_success())
+
+        config = Cfg()
+        config.set_value("processing.analytics.hotspot.max_incoming", 8)
+        config.set_value("processing.analytics.hotspot.max_outgoing", 5)
+        hot_spot = HotSpot(config)
+        hot_spot.requirement(requirement)
+        self.assertTrue(hot_spot.get_success())
+
+    def rmttest_pos_05(self):
+        "Engine: results of unchanged requirements are reused"
+        tmpdir = create_tmp_dir()
+        try:
+            config = Cfg()
+            config.set_value("processing.cache.directory", tmpdir)
+
+            def walk_results(requirements):
+                '''Walks with a new engine; returns the output and the
+                success of each module.'''
+                engine = Engine(config)
+                self.__walk(engine, requirements)
+                results = []
+                for _, analytics in engine.get_analytics():
+                    mstderr = StringIO()
+                    analytics.write_result(mstderr)
+                    results.append((mstderr.getvalue(),
+                                    analytics.get_success()))
+                return results, engine
+
+            requirements = [RequirementMock("A", "A must be and be", 8),
+                            RequirementMock("B", "B shall do things")]
+            expected, engine = walk_results(requirements)
+            engine.get_result_cache().log_stats()
+            RequirementMock.description_calls = 0
+            results, _ = walk_results(requirements)
+            self.assertEqual(expected, results)
+            # Only the keys are computed: descwords reads each
+            # description once.
+            self.assertEqual(2, RequirementMock.description_calls)
+
+            # A changed description is analysed again.
+            requirements[1] = RequirementMock("B", "B and B")
+            results, _ = walk_results(requirements)
+            self.assertNotEqual(expected[0], results[0])
+            self.assertEqual(expected[1:], results[1:])
+        finally:
+            delete_tmp_dir(tmpdir)
+
+    def rmttest_pos_06(self):
+        "Engine: time of each module is recorded"
+        config = Cfg()
+        config.set_value("processing.analytics.topiccohe.enabled", False)
+        profiler.reset()
+        profiler.set_enabled(True)
+        engine = Engine(config)
+        with profiler.phase("walk"):
+            self.__walk(engine, [RequirementMock("A", "A must be"),
+                                 RequirementMock("B", "B must be")])
+        report = profiler.get_report()
+        profiler.reset()
+        self.assertEqual([(["walk"], 1), (["walk", "hotspot"], 2),
+                          (["walk", "reqtopiccohe"], 2),
+                          (["walk", "descwords"], 3)],
+                         [(phase["path"], phase["count"])
+                          for phase in report["phases"]])
+
+    def rmttest_pos_07(self):
+        "Engine: DescWords analyses only the last topic continuum"
+        config = Cfg()
+        config.set_value("processing.analytics.hotspot.max_incoming", 0)
+        engine = Engine(config)
+        continuums = ["TC1", "TC2"]
+        self.assertEqual(continuums,
+                         engine.topic_continuum_set_sort(iter(continuums)))
+        for topic_continuum, rid in zip(continuums, ["A", "B"]):
+            engine.topic_continuum_pre(topic_continuum)
+            self.__walk(engine, [RequirementMock(rid, "X and X", 1)])
+            engine.topic_continuum_post(topic_continuum)
+        analytics = dict(engine.get_analytics())
+        self.assertEqual(["B"], self.__result_ids(analytics["descwords"]))
+        self.assertEqual(["A", "B"],
+                         self.__result_ids(analytics["hotspot"]))
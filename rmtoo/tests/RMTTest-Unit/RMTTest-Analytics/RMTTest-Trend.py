@@ -0,0 +1,136 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the analytics trend
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import time
+import unittest
+
+from rmtoo.lib.analytics.Trend import Trend
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+
+class RequirementMock(object):
+    '''Requirement with id, description and incoming links.'''
+
+    class ValueMock(object):
+        '''The description value.'''
+
+        def __init__(self, content):
+            self.__content = content
+
+        def get_content(self):
+            return self.__content
+
+    def __init__(self, rid, description, incoming=0):
+        self.__rid = rid
+        self.__description = description
+        self.incoming = [self] * incoming
+        self.outgoing = []
+
+    def get_id(self):
+        return self.__rid
+
+    def get_value(self, key):
+        if key == "Description":
+            return RequirementMock.ValueMock(self.__description)
+        assert key == "Topic"
+        return "T"
+
+
+class TopicSetMock(object):
+    '''Topic set with the commit info.'''
+
+    def __init__(self, timestamp):
+        self.__timestamp = timestamp
+
+    def get_commit_info(self):
+        return self
+
+    def get_timestamp(self):
+        return self.__timestamp
+
+
+class TopicContinuumMock(object):
+    '''Topic continuum with a name.'''
+
+    @staticmethod
+    def get_name():
+        return "TC"
+
+
+class RMTTestTrend(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = create_tmp_dir()
+        self.__filename = os.path.join(self.__tmpdir, "trend.csv")
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    def __walk(self, config, commits):
+        '''Calls the trend like a walk over the topic sets of one
+           topic continuum.  Returns the trend and the written lines.'''
+        trend = Trend.create_from_config(config)
+        trend.topic_continuum_set_pre(None)
+        trend.topic_continuum_pre(TopicContinuumMock())
+        for timestamp, requirements in commits:
+            topic_set = TopicSetMock(timestamp)
+            trend.topic_set_pre(topic_set)
+            for requirement in requirements:
+                trend.requirement(requirement)
+            trend.topic_set_post(topic_set)
+        trend.topic_continuum_set_post(None)
+        with io.open(self.__filename, encoding="utf-8") as trend_fd:
+            return trend, [line.split(" ")[1:]
+                           for line in trend_fd.read().split("\n") if line]
+
+    def __create_config(self):
+        config = Cfg()
+        config.set_value("processing.analytics.trend.output_filename",
+                         self.__filename)
+        return config
+
+    def rmttest_pos_01(self):
+        "Trend: not configured"
+        self.assertIsNone(Trend.create_from_config(Cfg()))
+
+    def rmttest_pos_02(self):
+        "Trend: scores of each requirement for each commit"
+        req_a = RequirementMock("A", "A must be and be", 8)
+        req_b = RequirementMock("B", "B shall do things")
+        trend, lines = self.__walk(self.__create_config(), [
+            (time.time() - 100, [req_a, req_b]),
+            (time.time(), [req_a, RequirementMock("B", "B and B")])])
+        self.assertEqual(
+            [["TC", "descwords", "A", "5"], ["TC", "descwords", "B", "5"],
+             ["TC", "hotspot", "A", "-10"], ["TC", "hotspot", "B", "0"],
+             ["TC", "reqtopiccohe", "A", "0"],
+             ["TC", "reqtopiccohe", "B", "0"],
+             ["TC", "descwords", "A", "5"], ["TC", "descwords", "B", "-20"],
+             ["TC", "hotspot", "A", "-10"], ["TC", "hotspot", "B", "0"],
+             ["TC", "reqtopiccohe", "A", "0"],
+             ["TC", "reqtopiccohe", "B", "0"]], lines)
+        # Only the changed description is analysed again.
+        self.assertEqual({"descwords": (1, 3), "hotspot": (2, 2),
+                          "reqtopiccohe": (2, 2)},
+                         trend.get_result_cache().get_stats())
+
+    def rmttest_pos_03(self):
+        "Trend: only enabled modules which check single requirements"
+        config = self.__create_config()
+        config.set_value("processing.analytics.hotspot.enabled", False)
+        _, lines = self.__walk(config, [
+            (time.time(), [RequirementMock("A", "A must be")])])
+        self.assertEqual([["TC", "descwords", "A", "15"],
+                          ["TC", "reqtopiccohe", "A", "0"]], lines)
@@ -0,0 +1,67 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the WordMatcher
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import random
+import re
+import unittest
+
+from rmtoo.lib.analytics.DescWords import DescWords
+from rmtoo.lib.analytics.WordMatcher import WordMatcher
+
+REGEXES = [" must ", " must not ", " must", " and ", " and ", r"\. ",
+           r" etc\.? ", r"\w+ing", "(a|b)nd", r" (\w+) \1 ", " a*",
+           r"(?i) AND "]
+
+VOCABULARY = ["and", "AND", "or", "must", "must not", "mustnot", "etc",
+              "etc.", "e.g.", "bnd", "thing", "x", ".", " "]
+
+
+def count_findall(regexes, text):
+    '''Counts the matches with findall() for each regular expression.'''
+    return [len(regex.findall(text)) for regex in regexes]
+
+
+class RMTTestWordMatcher(unittest.TestCase):
+
+    def rmttest_pos_01(self):
+        "WordMatcher: overlapping words are counted like findall"
+        regexes = [re.compile(" and "), re.compile(" or ")]
+        matcher = WordMatcher(regexes)
+        # The blank between the words is shared.
+        self.assertEqual([1, 1], matcher.count("x and or y"))
+        self.assertEqual([1, 0], matcher.count("x and and y"))
+        self.assertEqual([2, 0], matcher.count("x and y and z"))
+
+    def rmttest_pos_02(self):
+        "WordMatcher: words which are a prefix of other words"
+        regexes = [re.compile(" must "), re.compile(" must not "),
+                   re.compile(" must "), re.compile(" mus")]
+        matcher = WordMatcher(regexes)
+        self.assertEqual([1, 1, 1, 1], matcher.count("x must not y"))
+        self.assertEqual([0, 0, 0, 1], matcher.count("x mustnot y"))
+
+    def rmttest_pos_03(self):
+        "WordMatcher: same counts as findall for random texts"
+        rand = random.Random(1)
+        for regexes in [[re.compile(regex) for regex in REGEXES],
+                        [wre for wre, _, _ in DescWords.words_en_GB],
+                        [wre for wre, _, _ in DescWords.words_de_DE]]:
+            matcher = WordMatcher(regexes)
+            for _ in range(2000):
+                text = " ".join(rand.choice(VOCABULARY)
+                                for _ in range(rand.randint(0, 12)))
+                self.assertEqual(count_findall(regexes, text),
+                                 matcher.count(text), text)
+
+    def rmttest_pos_04(self):
+        "WordMatcher: empty list"
+        self.assertEqual([], WordMatcher([]).count("x and y"))
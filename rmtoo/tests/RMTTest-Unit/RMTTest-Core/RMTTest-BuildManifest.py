@@ -0,0 +1,181 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the build manifest
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import datetime
+import io
+import os
+import unittest
+
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.BuildManifest import BuildManifest, OutputRecord, \
+    digest_content, digest_path
+from rmtoo.lib.StdOutputParams import StdOutputParams
+from rmtoo.lib.vcs.FileSystem import FileSystem
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+
+def write_file(filename, content):
+    '''Writes the content into the file.'''
+    with io.open(filename, "w", encoding="utf-8") as fd:
+        fd.write(content)
+
+
+class TopicContinuumMock(object):
+    '''Topic continuum without topic sets.'''
+
+    @staticmethod
+    def get_vcs_commit_ids():
+        return []
+
+
+class RMTTestBuildManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = create_tmp_dir()
+        self.__manifest_filename = os.path.join(self.__tmpdir,
+                                                "manifest.json")
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    def __create(self, requirements=None):
+        '''Creates the build manifest.'''
+        config = Cfg()
+        config.set_value("processing.manifest.filename",
+                         self.__manifest_filename)
+        if requirements is not None:
+            config.set_value("requirements", requirements)
+        return BuildManifest.create_from_config(config)
+
+    def __path(self, name):
+        '''Returns the path of the file in the temp directory.'''
+        return os.path.join(self.__tmpdir, name)
+
+    def rmttest_pos_01(self):
+        "BuildManifest: not configured"
+        self.assertIsNone(BuildManifest.create_from_config(Cfg()))
+
+    def rmttest_pos_02(self):
+        "BuildManifest: record is up to date after write and read"
+        write_file(self.__path("out.txt"), "Output")
+        manifest = self.__create()
+        record = OutputRecord.create(
+            "D1", {"output_filename": self.__path("out.txt")})
+        manifest.set_record("tc:out:0", record)
+        manifest.write()
+
+        record = self.__create().get_record("tc:out:0")
+        self.assertTrue(record.is_up_to_date("D1"))
+        self.assertFalse(record.is_up_to_date("D2"))
+        # Output file was removed
+        os.remove(self.__path("out.txt"))
+        self.assertFalse(record.is_up_to_date("D1"))
+
+    def rmttest_pos_03(self):
+        "BuildManifest: output files with extension are found"
+        write_file(self.__path("out.ods"), "Output")
+        manifest = self.__create()
+        manifest.set_record("tc:out:0", OutputRecord.create(
+            "D1", {"output_filename": self.__path("out")}))
+        self.assertEqual({"inputs": "D1", "files": [self.__path("out.ods")],
+                          "pages": {}},
+                         manifest.get_record("tc:out:0").to_dict())
+
+    def rmttest_pos_04(self):
+        "BuildManifest: unchanged pages are detected"
+        old_record = OutputRecord.create("D1", {})
+        self.assertFalse(old_record.is_page_unchanged(
+            self.__path("p1.html"), "Page 1"))
+        write_file(self.__path("p1.html"), "Page 1")
+        self.assertFalse(old_record.is_page_unchanged(
+            self.__path("p2.html"), "Page 2"))
+        write_file(self.__path("p2.html"), "Page 2")
+
+        record = OutputRecord.create("D2", {}, old_record)
+        self.assertTrue(record.is_page_unchanged(
+            self.__path("p1.html"), "Page 1"))
+        self.assertFalse(record.is_page_unchanged(
+            self.__path("p2.html"), "Page 2 changed"))
+        self.assertEqual(
+            {self.__path("p1.html"): digest_content("Page 1"),
+             self.__path("p2.html"): digest_content("Page 2 changed")},
+            record.get_pages())
+
+    def rmttest_pos_05(self):
+        "BuildManifest: configuration is part of the inputs"
+        manifest = self.__create()
+        manifest.set_record("tc:out:0", OutputRecord.create("D1", {}))
+        manifest.write()
+        self.assertIsNotNone(self.__create().get_record("tc:out:0"))
+
+        digest = self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", {"option": 1})
+        self.assertEqual(digest, self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", {"option": 1}))
+        self.assertNotEqual(digest, self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", {"option": 2}))
+        self.assertNotEqual(digest, self.__create(
+            {"inventors": ["me"]}).compute_inputs_digest(
+                TopicContinuumMock(), "out", {"option": 1}))
+        # A template file named in the configuration.
+        ocfg = {"template": self.__path("template")}
+        write_file(self.__path("template"), "T1")
+        digest = self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", ocfg)
+        write_file(self.__path("template"), "T2")
+        self.assertNotEqual(digest, self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", ocfg))
+
+    def rmttest_pos_06(self):
+        "BuildManifest: content digest of the input files"
+        os.makedirs(self.__path("reqs/sub"))
+        write_file(self.__path("reqs/A.req"), "Name: A\n")
+        write_file(self.__path("reqs/sub/B.req"), "Name: B\n")
+        input_handler = FileSystem(
+            {"requirements_dirs": [self.__path("reqs")],
+             "topic_root_node": "Root"})
+        digest = input_handler.get_content_digest(None, "requirements")
+        self.assertEqual(digest, input_handler.get_content_digest(
+            None, "requirements"))
+        self.assertEqual(digest_path(self.__path("reqs/A.req")),
+                         digest_content("Name: A\n"))
+        write_file(self.__path("reqs/sub/B.req"), "Name: C\n")
+        self.assertNotEqual(digest, input_handler.get_content_digest(
+            None, "requirements"))
+
+    def rmttest_pos_07(self):
+        "BuildManifest: default dates are part of the inputs"
+        today = datetime.date.today()
+        yesterday = today - datetime.timedelta(1)
+        self.assertEqual((yesterday, today),
+                         StdOutputParams.get_start_and_end_date(Cfg({})))
+        self.assertEqual(
+            (datetime.date(2011, 4, 25), datetime.date(2011, 5, 25)),
+            StdOutputParams.get_start_and_end_date(Cfg(
+                {"start_date": "2011-04-25", "end_date": "2011-05-25"})))
+        # Only the day of the run changes.
+        ocfg = {"output_filename": self.__path("stats.csv")}
+        digest = self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", ocfg, (yesterday, today))
+        self.assertEqual(digest, self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", ocfg, (yesterday, today)))
+        self.assertNotEqual(digest, self.__create().compute_inputs_digest(
+            TopicContinuumMock(), "out", ocfg,
+            (today, today + datetime.timedelta(1))))
+
+    def rmttest_neg_01(self):
+        "BuildManifest: unusable manifest is ignored"
+        write_file(self.__manifest_filename, "{ no json")
+        self.assertIsNone(self.__create().get_record("tc:out:0"))
+        write_file(self.__manifest_filename,
+                   '{"version": 0, "outputs": {"tc:out:0": {}}}')
+        self.assertIsNone(self.__create().get_record("tc:out:0"))
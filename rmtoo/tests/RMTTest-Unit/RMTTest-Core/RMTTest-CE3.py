@@ -0,0 +1,93 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the Constraint Execution and Evaluation Environment
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import unittest
+
+from rmtoo.lib.CE3 import CE3, CE3CodeCache
+from rmtoo.lib.RMTException import RMTException
+
+CE3_CODE = [
+    " class MinValue:\n",
+    "    def __init__(self, v):\n",
+    "      self.value = v\n",
+    "    def unite(self, mobj, loa):\n",
+    "      ma = max(l.value for l in loa)\n",
+    "      if mobj is None:\n",
+    "        return self.mclass(ma)\n",
+    "      ce3assert(mobj.value >= ma, 'MinValue too small')\n",
+    "      return None\n",
+    " MinValue.mclass = MinValue\n"]
+
+
+class ConstraintValue(object):
+    '''The CE3 value of a constraint.'''
+
+    def __init__(self, lines):
+        self.__lines = lines
+
+    def get_content_with_nl(self):
+        return self.__lines
+
+
+class ConstraintMock(object):
+    '''Constraint which contains only the CE3 value.'''
+
+    def __init__(self, lines):
+        self.__value = ConstraintValue(lines)
+
+    def get_value(self, key):
+        assert key == "CE3"
+        return self.__value
+
+
+class RMTTestCE3(unittest.TestCase):
+
+    def setUp(self):
+        self.__orig_code_cache = CE3.code_cache
+        CE3.code_cache = CE3CodeCache()
+
+    def tearDown(self):
+        CE3.code_cache = self.__orig_code_cache
+
+    def rmttest_pos_01(self):
+        "CE3: code is compiled only once"
+        ce3s = []
+        for idx in range(10):
+            ce3 = CE3()
+            ce3.eval(ConstraintMock(CE3_CODE), "MinValue",
+                     "MinValue(%d)" % (idx % 2))
+            ce3s.append(ce3)
+        # One body and two distinct call expressions.
+        self.assertEqual((3, 20), CE3.code_cache.get_stats())
+        self.assertEqual([idx % 2 for idx in range(10)],
+                         [ce3["MinValue"].value for ce3 in ce3s])
+        # Each evaluation has its own class.
+        self.assertIsNot(type(ce3s[0]["MinValue"]),
+                         type(ce3s[2]["MinValue"]))
+
+    def rmttest_pos_02(self):
+        "CE3: unite"
+        parent = CE3()
+        parent.eval(ConstraintMock(CE3_CODE), "MinValue", "MinValue(7)")
+        child = CE3()
+        child.unite([parent])
+        self.assertEqual(7, child["MinValue"].value)
+
+    def rmttest_neg_01(self):
+        "CE3: unite with failing assert"
+        parent = CE3()
+        parent.eval(ConstraintMock(CE3_CODE), "MinValue", "MinValue(7)")
+        child = CE3()
+        child.eval(ConstraintMock(CE3_CODE), "MinValue", "MinValue(3)")
+        with self.assertRaises(RMTException) as rmte:
+            child.unite([parent])
+        self.assertEqual(90, rmte.exception.get_id())
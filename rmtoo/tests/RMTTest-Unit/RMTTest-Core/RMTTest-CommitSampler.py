@@ -0,0 +1,88 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for sampling the commits of a source
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import time
+import unittest
+
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.RMTException import RMTException
+from rmtoo.lib.vcs.CommitSampler import CommitSampler
+
+
+class TimestampHandler(object):
+    '''The commits are the timestamps themselves.'''
+
+    @staticmethod
+    def get_timestamp(commit):
+        return commit
+
+
+def local_ts(year, month, day, hour):
+    return time.mktime((year, month, day, hour, 0, 0, 0, 0, -1))
+
+
+# Newest first - like returned from the input handlers.
+# Other tests may change the time zone: the timestamps are computed
+# in each test.
+DATES = [(2017, 1, 9, 10), (2017, 1, 9, 8), (2017, 1, 3, 18),
+         (2017, 1, 2, 9), (2017, 1, 1, 23), (2017, 1, 1, 12),
+         (2016, 12, 31, 12)]
+
+
+class RMTTestCommitSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.commits = [local_ts(*date) for date in DATES]
+
+    def __commits(self, *indices):
+        return [self.commits[idx] for idx in indices]
+
+    def __sample(self, policy, count=1):
+        return CommitSampler(policy, count).sample(TimestampHandler(),
+                                                   self.commits)
+
+    def rmttest_pos_01(self):
+        "CommitSampler: last commit per day"
+        self.assertEqual(self.__commits(0, 2, 3, 4, 6), self.__sample("day"))
+
+    def rmttest_pos_02(self):
+        "CommitSampler: last commit per (ISO) week"
+        # 2017-01-01 is a Sunday: it belongs to the last week of 2016.
+        self.assertEqual(self.__commits(0, 2, 4),
+                         self.__sample("week"))
+
+    def rmttest_pos_03(self):
+        "CommitSampler: last commit per month"
+        self.assertEqual(self.__commits(0, 6), self.__sample("month"))
+
+    def rmttest_pos_04(self):
+        "CommitSampler: every n-th commit"
+        self.assertEqual(self.__commits(0, 3, 6),
+                         self.__sample("nth", 3))
+        self.assertEqual(self.commits, self.__sample("nth"))
+
+    def rmttest_pos_05(self):
+        "CommitSampler: creation from the source configuration"
+        self.assertIsNone(CommitSampler.create_from_config(Cfg({})))
+        sampler = CommitSampler.create_from_config(
+            Cfg({"sampling": {"policy": "nth", "count": 2}}))
+        self.assertEqual(self.__commits(0, 2, 4, 6),
+                         sampler.sample(TimestampHandler(), self.commits))
+
+    def rmttest_neg_01(self):
+        "CommitSampler: invalid configuration"
+        with self.assertRaises(RMTException) as rmte:
+            CommitSampler("year")
+        self.assertEqual(118, rmte.exception.get_id())
+        with self.assertRaises(RMTException) as rmte:
+            CommitSampler("nth", 0)
+        self.assertEqual(119, rmte.exception.get_id())
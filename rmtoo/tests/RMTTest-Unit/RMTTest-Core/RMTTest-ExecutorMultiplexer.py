@@ -0,0 +1,133 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the executor multiplexer
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import unittest
+
+from rmtoo.lib.Executor import Executor
+from rmtoo.lib.ExecutorMultiplexer import ExecutorMultiplexer
+from rmtoo.lib.FuncCall import FuncCall
+from rmtoo.lib.Profiler import profiler
+
+
+class VcsId(object):
+    '''Commit info mock.'''
+
+    def __init__(self, commit):
+        self.__commit = commit
+
+    def get_commit(self):
+        '''Returns the commit.'''
+        return self.__commit
+
+
+class RecordingExecutor(Executor):
+    '''Records all the calls.'''
+
+    def __init__(self, name, calls):
+        self.__name = name
+        self.__calls = calls
+        self.sort_calls = 0
+
+    def topic_continuum_sort(self, vcs_commit_ids, topic_sets):
+        '''All topic sets.'''
+        self.sort_calls += 1
+        return Executor.topic_continuum_sort(self, vcs_commit_ids,
+                                             topic_sets)
+
+    def topic_pre(self, topic):
+        '''Records the call.'''
+        self.__calls.append((self.__name, "topic_pre", topic))
+
+    def requirement(self, requirement):
+        '''Records the call.'''
+        self.__calls.append((self.__name, "requirement", requirement))
+
+
+class LatestExecutor(RecordingExecutor):
+    '''Uses only the latest topic set and sorts the requirements.'''
+
+    def topic_continuum_sort(self, vcs_commit_ids, topic_sets):
+        '''Only the latest.'''
+        self.sort_calls += 1
+        return [topic_sets[vcs_commit_ids[-1].get_commit()]]
+
+    def requirement_set_sort(self, list_to_sort):
+        '''Sorted.'''
+        return sorted(list_to_sort)
+
+
+class RMTTestExecutorMultiplexer(unittest.TestCase):
+
+    def rmttest_pos_01(self):
+        "ExecutorMultiplexer: grouping by order"
+        calls = []
+        executors = [RecordingExecutor("A", calls),
+                     LatestExecutor("B", calls),
+                     RecordingExecutor("C", calls),
+                     LatestExecutor("D", calls)]
+        vcs_ids = [VcsId("c1"), VcsId("c2")]
+        topic_sets = {"c1": "TS1", "c2": "TS2"}
+        groups = ExecutorMultiplexer.create_groups(executors, vcs_ids,
+                                                   topic_sets)
+        self.assertEqual([[executors[0], executors[2]],
+                          [executors[1], executors[3]]],
+                         [group.get_executors() for group in groups])
+        self.assertEqual([1, 1, 1, 1],
+                         [executor.sort_calls for executor in executors])
+        self.assertEqual(["TS1", "TS2"],
+                         groups[0].topic_continuum_sort(vcs_ids, topic_sets))
+        self.assertEqual(["TS2"],
+                         groups[1].topic_continuum_sort(vcs_ids, topic_sets))
+        self.assertEqual([2, 1], groups[0].requirement_set_sort([2, 1]))
+        self.assertEqual([1, 2], groups[1].requirement_set_sort([2, 1]))
+
+    def rmttest_pos_02(self):
+        "ExecutorMultiplexer: callbacks are called for all executors"
+        calls = []
+        executors = [RecordingExecutor("A", calls),
+                     RecordingExecutor("B", calls)]
+        group = ExecutorMultiplexer.create_groups(
+            executors, [VcsId("c1")], {"c1": "TS1"})[0]
+        FuncCall.pcall(group, "topic_pre", "T1")
+        FuncCall.pcall(group, "requirement", "R1")
+        FuncCall.pcall(group, "requirement", "R2")
+        # Not available in the executors
+        FuncCall.pcall(group, "cmad_requirement", "R3")
+        # Default implementation of the Executor
+        FuncCall.pcall(group, "topic_set_pre", "TS1")
+        self.assertEqual([("A", "topic_pre", "T1"), ("B", "topic_pre", "T1"),
+                          ("A", "requirement", "R1"),
+                          ("B", "requirement", "R1"),
+                          ("A", "requirement", "R2"),
+                          ("B", "requirement", "R2")], calls)
+
+    def rmttest_pos_03(self):
+        "ExecutorMultiplexer: time of each executor is recorded"
+        calls = []
+        executors = [RecordingExecutor("A", calls),
+                     LatestExecutor("B", calls),
+                     RecordingExecutor("C", calls)]
+        profiler.reset()
+        profiler.set_enabled(True)
+        groups = ExecutorMultiplexer.create_groups(
+            executors, [VcsId("c1")], {"c1": "TS1"}, ["a", "b", "c"])
+        with profiler.phase("walk"):
+            for group in groups:
+                FuncCall.pcall(group, "requirement", "R1")
+                FuncCall.pcall(group, "requirement", "R2")
+        report = profiler.get_report()
+        profiler.reset()
+        self.assertEqual([(["walk"], 1), (["walk", "a"], 2),
+                          (["walk", "c"], 2), (["walk", "b"], 2)],
+                         [(phase["path"], phase["count"])
+                          for phase in report["phases"]])
+        self.assertEqual(6, len(calls))
@@ -0,0 +1,68 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the executor dispatch table
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import unittest
+
+from rmtoo.lib.Executor import Executor
+from rmtoo.lib.FuncCall import DispatchTable
+
+
+class TopicExecutor(Executor):
+    '''Implements some of the hooks.'''
+
+    def __init__(self):
+        self.calls = []
+
+    def topic_pre(self, topic):
+        '''Records the call.'''
+        self.calls.append(("topic_pre", topic))
+
+    def cmad_requirement(self, requirement):
+        '''Records the call.'''
+        self.calls.append(("cmad_requirement", requirement))
+
+
+class PlainExecutor(object):
+    '''Executor which is not derived from the Executor.'''
+
+    def requirement(self, requirement):
+        '''Nothing to do.'''
+        pass
+
+
+class RMTTestFuncCall(unittest.TestCase):
+
+    def rmttest_pos_01(self):
+        "DispatchTable: implemented hooks only"
+        executor = TopicExecutor()
+        dispatch = DispatchTable.get(executor, "")
+        dispatch.topic_pre("T")
+        self.assertEqual([("topic_pre", "T")], executor.calls)
+        # Default implementation of the base classes: nothing to call.
+        self.assertIsNone(dispatch.topic_post)
+        self.assertIsNone(dispatch.requirement)
+        self.assertIs(dispatch, DispatchTable.get(executor, ""))
+
+    def rmttest_pos_02(self):
+        "DispatchTable: prefix"
+        executor = TopicExecutor()
+        dispatch = DispatchTable.get(executor, "cmad_")
+        self.assertIsNone(dispatch.topic_pre)
+        dispatch.requirement("R")
+        self.assertEqual([("cmad_requirement", "R")], executor.calls)
+        self.assertIsNot(dispatch, DispatchTable.get(executor, ""))
+
+    def rmttest_pos_03(self):
+        "DispatchTable: executor without base class"
+        dispatch = DispatchTable.get(PlainExecutor(), "")
+        self.assertIsNotNone(dispatch.requirement)
+        self.assertIsNone(dispatch.topic_pre)
@@ -0,0 +1,150 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the git input handler
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import unittest
+
+import git
+
+from rmtoo.lib.RMTException import RMTException
+from rmtoo.lib.vcs.Git import Git
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+
+class RMTTestGit(unittest.TestCase):
+
+    def __write(self, filename, content):
+        '''Write a file into the repository and add it.'''
+        path = os.path.join(self.__tmpdir, filename)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with io.open(path, "w", encoding="utf-8") as out_fd:
+            out_fd.write(content)
+        self.__repo.index.add([filename])
+
+    def setUp(self):
+        self.__tmpdir = os.path.realpath(create_tmp_dir())
+        self.__repo = git.Repo.init(self.__tmpdir)
+        self.__write("reqs/B.req", "Name: B\n")
+        self.__write("reqs/A.req", "Name: A\n")
+        self.__write("reqs/sub/C.req", "Name: C\n")
+        self.__write("reqs/sub/sub2/D.req", "Name: D\n")
+        self.__write("topics/Root.tic", "Name: Root\n")
+        self.__write("other/E.req", "Name: E\n")
+        self.__repo.index.commit("first")
+        self.__repo.create_tag("v1")
+        self.__write("reqs/A.req", "Name: A2\n")
+        self.__repo.index.commit("second")
+        self.__repo.create_tag("v2")
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    def __create_git(self, end_vers="v2", **kwargs):
+        config = {"start_vers": "v1", "end_vers": end_vers,
+                  "topic_root_node": "Root",
+                  "requirements_dirs": [
+                      os.path.join(self.__tmpdir, "reqs")],
+                  "topics_dirs": [os.path.join(self.__tmpdir, "topics")]}
+        config.update(kwargs)
+        return Git(config)
+
+    def rmttest_pos_01(self):
+        "Git: file infos of a commit"
+        git_if = self.__create_git()
+        commits = list(git_if.get_commits())
+        self.assertEqual(1, len(commits))
+        commit = commits[0]
+
+        fileinfos = git_if.get_file_infos(commit, "requirements")
+        self.assertEqual(
+            ["reqs/A.req", "reqs/B.req", "reqs/sub/C.req",
+             "reqs/sub/sub2/D.req"],
+            [fileinfo.get_filename() for fileinfo in fileinfos])
+        self.assertEqual(
+            ["A.req", "B.req", "sub/C.req", "sub/sub2/D.req"],
+            [fileinfo.get_filename_sub_part() for fileinfo in fileinfos])
+        self.assertEqual("Name: A2\n", fileinfos[0].get_content())
+        self.assertEqual("Name: D\n", fileinfos[3].get_content())
+        self.assertEqual(
+            self.__repo.commit("v2").tree["reqs/sub/C.req"].hexsha,
+            fileinfos[2].get_vcs_id())
+        self.assertEqual([], git_if.get_file_infos(commit, "testcases"))
+
+    def rmttest_pos_02(self):
+        "Git: vcs ids and topic file"
+        git_if = self.__create_git()
+        commit = self.__repo.commit("v2")
+        self.assertEqual(self.__repo.commit("v2").tree["reqs"].hexsha,
+                         git_if.get_vcs_id_with_type(commit, "requirements"))
+        self.assertEqual(self.__repo.commit("v1").tree["topics"].hexsha,
+                         git_if.get_vcs_id_with_type(commit, "topics"))
+        self.assertNotEqual(
+            git_if.get_vcs_id_with_type(commit, "requirements"),
+            git_if.get_vcs_id_with_type(self.__repo.commit("v1"),
+                                        "requirements"))
+
+        fileinfo = git_if.get_topic_base_file_info(commit)
+        self.assertEqual("topics/Root.tic", fileinfo.get_filename())
+        self.assertEqual("Name: Root\n", fileinfo.get_content())
+
+    def rmttest_neg_01(self):
+        "Git: file not found"
+        git_if = self.__create_git()
+        commit = self.__repo.commit("v2")
+        with self.assertRaises(RMTException) as rmte:
+            git_if.get_file_info_with_type(commit, "topics", "Other.tic")
+        self.assertEqual(111, rmte.exception.get_id())
+        with self.assertRaises(RMTException) as rmte:
+            git_if.get_file_info_with_type(commit, "topics", "x/Other.tic")
+        self.assertEqual(108, rmte.exception.get_id())
+
+    def rmttest_pos_03(self):
+        "Git: path filtered and first parent commit iteration"
+        main = self.__repo.head.commit
+        self.__write("other/E.req", "Name: E2\n")
+        self.__repo.index.commit("unrelated")
+        branch = self.__repo.create_head("branch", main)
+        self.__repo.head.reference = branch
+        self.__repo.head.reset(index=True, working_tree=True)
+        self.__write("reqs/B.req", "Name: B2\n")
+        branch_commit = self.__repo.index.commit("on branch")
+        master = self.__repo.heads.master
+        self.__repo.head.reference = master
+        self.__repo.head.reset(index=True, working_tree=True)
+        self.__repo.index.merge_tree(branch_commit)
+        self.__repo.index.commit(
+            "merge", parent_commits=(master.commit, branch_commit))
+        self.__repo.head.reset(index=True, working_tree=True)
+
+        def messages(git_if):
+            # The order of commits with the same timestamp is not
+            # defined.
+            return sorted(commit.message
+                          for commit in git_if.get_commits())
+
+        self.assertEqual(
+            ["merge", "on branch", "second", "unrelated"],
+            messages(self.__create_git("master")))
+        # The merge does not change the directories compared to the
+        # branch.
+        self.assertEqual(
+            ["on branch", "second"],
+            messages(self.__create_git("master", path_filter=True)))
+        self.assertEqual(
+            ["merge", "second", "unrelated"],
+            messages(self.__create_git("master", first_parent=True)))
+        self.assertEqual(
+            ["merge", "second"],
+            messages(self.__create_git("master", path_filter=True,
+                                       first_parent=True)))
@@ -0,0 +1,256 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for incremental reading of the requirements of commits
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import unittest
+
+import git
+
+from rmtoo.lib.InputModules import InputModules
+from rmtoo.lib.RequirementSet import RequirementSet
+from rmtoo.lib.TopicContinuum import TopicContinuum
+from rmtoo.lib.vcs.Git import Git
+from rmtoo.lib.vcs.ObjectCache import ObjectCache
+from rmtoo.tests.lib.TestConfig import TestConfig
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+REQ_TEMPLATE = """Name: %s
+Type: requirement
+Invented on: 2010-08-05
+Invented by: flonatel
+Description: %s
+Rationale: Something else.
+Owner: development
+Status: not done
+Priority: development:%d
+Effort estimation: 5
+Topic: Basics
+"""
+
+
+class RMTTestIncrementalRead(unittest.TestCase):
+
+    def __write(self, rid, description, prio, solved_by=None):
+        '''Write a requirement into the repository and add it.'''
+        filename = "reqs/%s.req" % rid
+        path = os.path.join(self.__tmpdir, filename)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with io.open(path, "w", encoding="utf-8") as out_fd:
+            out_fd.write(REQ_TEMPLATE % (rid, description, prio))
+            if solved_by:
+                out_fd.write("Solved by: %s\n" % solved_by)
+        self.__repo.index.add([filename])
+
+    def setUp(self):
+        self.__tmpdir = os.path.realpath(create_tmp_dir())
+        self.__repo = git.Repo.init(self.__tmpdir)
+        self.__write("R1", "The root.", 10, "R2 R3")
+        self.__write("R2", "Second.", 5, "R4")
+        self.__write("R3", "Third.", 7)
+        self.__write("R4", "Fourth.", 3)
+        self.__repo.index.commit("first")
+        self.__repo.create_tag("v1")
+        # Change of a leaf: priorities change.
+        self.__write("R4", "Fourth changed.", 8)
+        self.__repo.index.commit("second")
+        # Change of the dependencies.
+        self.__write("R1", "The root.", 10, "R2 R3 R5")
+        self.__write("R5", "Fifth.", 4)
+        self.__repo.index.commit("third")
+        self.__repo.create_tag("v3")
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    @staticmethod
+    def __create_config():
+        config = TestConfig()
+        config.set_solved_by()
+        config.set_value("requirements.inventors", ["flonatel"])
+        config.set_value("requirements.stakeholders", ["development"])
+        return config
+
+    def __create_git(self):
+        return Git({"start_vers": "v1", "end_vers": "v3",
+                    "topic_root_node": "Root",
+                    "requirements_dirs": [
+                        os.path.join(self.__tmpdir, "reqs")],
+                    "topics_dirs": [os.path.join(self.__tmpdir, "reqs")]})
+
+    @staticmethod
+    def __summary(req_set):
+        '''Returns the interesting parts of the requirement set.'''
+        result = {}
+        for rid, req in req_set.get_requirements_iteritems():
+            result[rid] = (
+                req.get_value("Description").get_content(),
+                req.get_value("Priority"),
+                sorted(node.get_id() for node in req.outgoing),
+                sorted(node.get_id() for node in req.incoming))
+        return result
+
+    def rmttest_pos_01(self):
+        "Incremental: changed files between two commits"
+        git_if = self.__create_git()
+        commits = list(git_if.get_commits())
+        self.assertEqual(2, len(commits))
+        self.assertEqual(set(["reqs/R4.req"]),
+                         git_if.get_changed_files(commits[1].parents[0],
+                                                  commits[1]))
+        self.assertEqual(set(["reqs/R1.req", "reqs/R5.req"]),
+                         git_if.get_changed_files(commits[1], commits[0]))
+
+    def rmttest_pos_02(self):
+        "Incremental: results are the same as a complete read"
+        config = self.__create_config()
+        mods = InputModules(config)
+        git_if = self.__create_git()
+        commits = [self.__repo.commit("v1")] \
+            + list(reversed(list(git_if.get_commits())))
+
+        object_cache = ObjectCache()
+        previous_set = None
+        previous_commit = None
+        for commit in commits:
+            full_set = RequirementSet(config)
+            full_set.read_requirements(git_if, commit, mods, ObjectCache())
+            changed = None
+            if previous_commit is not None:
+                changed = git_if.get_changed_files(previous_commit, commit)
+            inc_set = RequirementSet(config)
+            inc_set.read_requirements_incremental(
+                git_if, commit, mods, object_cache, previous_set, changed)
+
+            self.assertTrue(full_set.is_usable())
+            self.assertTrue(inc_set.is_usable())
+            self.assertEqual(self.__summary(full_set),
+                             self.__summary(inc_set))
+            previous_set = inc_set
+            previous_commit = commit
+
+    def rmttest_pos_03(self):
+        "Incremental: unchanged requirements are not parsed again"
+        config = self.__create_config()
+        mods = InputModules(config)
+        git_if = self.__create_git()
+        first = self.__repo.commit("v1")
+        second = list(git_if.get_commits())[1]
+
+        first_set = RequirementSet(config)
+        first_set.read_requirements_incremental(
+            git_if, first, mods, ObjectCache(), None, None)
+        self.assertIsNotNone(
+            first_set.get_parsed_state_snapshot("reqs/R3.req"))
+
+        parsed = []
+        orig_get_content = Git.FileInfo.get_content
+
+        def get_content(fileinfo):
+            parsed.append(fileinfo.get_filename())
+            return orig_get_content(fileinfo)
+
+        Git.FileInfo.get_content = get_content
+        try:
+            second_set = RequirementSet(config)
+            second_set.read_requirements_incremental(
+                git_if, second, mods, ObjectCache(), first_set,
+                git_if.get_changed_files(first, second))
+        finally:
+            Git.FileInfo.get_content = orig_get_content
+        self.assertEqual(["reqs/R4.req"], parsed)
+        self.assertIsNot(first_set.get_requirement("R3"),
+                         second_set.get_requirement("R3"))
+
+    def __write_topics(self, text):
+        '''Write the topics into the repository and add them.'''
+        for name, content in [
+                ("Root", "Name: Root\nSubTopic: Basics\nText: %s\n" % text),
+                ("Basics", "Name: Basics\nIncludeRequirements: full\n")]:
+            filename = "topics/%s.tic" % name
+            path = os.path.join(self.__tmpdir, filename)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with io.open(path, "w", encoding="utf-8") as out_fd:
+                out_fd.write(content)
+            self.__repo.index.add([filename])
+
+    def __write_testcase(self, description):
+        '''Write a test case into the repository and add it.'''
+        filename = "testcases/T1.tec"
+        path = os.path.join(self.__tmpdir, filename)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with io.open(path, "w", encoding="utf-8") as out_fd:
+            out_fd.write("Name: T1\nOwner: development\n"
+                         "Invented by: flonatel\nInvented on: 2010-08-05\n"
+                         "Description: %s\nExpected Result: Ok.\n"
+                         % description)
+        self.__repo.index.add([filename])
+
+    def rmttest_pos_04(self):
+        "Incremental: topic set from the object cache of an older commit"
+        self.__write_topics("Zero.")
+        self.__write("R1", "The root.", 10, "R2 R3 R5 A B")
+        self.__write("A", "A one.", 5)
+        self.__write("B", "B one.", 5)
+        self.__write_testcase("T one.")
+        self.__repo.index.commit("c0")
+        self.__repo.create_tag("c0")
+        self.__write("B", "B two.", 5)
+        self.__repo.index.commit("c1")
+        self.__write_topics("Two.")
+        self.__write("B", "B three.", 5)
+        self.__repo.index.commit("c2")
+        # Only the requirements change.
+        self.__write("A", "A two.", 5)
+        self.__repo.index.commit("c3")
+        self.__write_topics("Four.")
+        self.__write("B", "B four.", 5)
+        self.__repo.index.commit("c4")
+        # Only a test case changes.
+        self.__write_testcase("T five.")
+        self.__repo.index.commit("c5")
+        self.__repo.create_tag("c5")
+
+        config = self.__create_config()
+        continuum = TopicContinuum(
+            "ts", config,
+            {"sources": [["git", {
+                "start_vers": "c0", "end_vers": "c5", "incremental": True,
+                "topic_root_node": "Root",
+                "requirements_dirs": [os.path.join(self.__tmpdir, "reqs")],
+                "topics_dirs": [os.path.join(self.__tmpdir, "topics")],
+                "testcases_dirs": [
+                    os.path.join(self.__tmpdir, "testcases")]}]],
+             "output": {}},
+            ObjectCache(), InputModules(config))
+        commit_ids = continuum.get_vcs_commit_ids()
+        self.assertEqual(5, len(commit_ids))
+        req_sets = [continuum.get_topic_set(commit_id.get_commit())
+                    .get_topic_set().get_complete_requirement_set()
+                    for commit_id in commit_ids]
+        self.assertEqual(
+            [("A one.", "B two."), ("A one.", "B three."),
+             ("A two.", "B three."), ("A two.", "B four."),
+             ("A two.", "B four.")],
+            [tuple(req_set.get_requirement(rid).get_value("Description")
+                   .get_content() for rid in ["A", "B"])
+             for req_set in req_sets])
+        self.assertEqual(
+            ["T one."] * 4 + ["T five."],
+            [req_set.get_testcases()["T1"].get_value("Description")
+             .get_content() for req_set in req_sets])
+        # The VCS id of the topic set are the topics.
+        self.assertEqual(commit_ids[1].get_vcs_id(),
+                         commit_ids[2].get_vcs_id())
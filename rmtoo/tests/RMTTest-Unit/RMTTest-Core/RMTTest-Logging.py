@@ -0,0 +1,116 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the tracer configuration
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from rmtoo.lib.ParallelParser import get_fork_context
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.logging import LOGGING_CONFIG, configure_logging, \
+    get_tracer, init_tracer, init_worker_logging, tear_down_log_handler, \
+    tracer
+
+
+def trace_in_worker():
+    '''Traces in a forked worker process.'''
+    init_worker_logging(logging.NullHandler())
+    get_tracer("parse").debug("debug worker")
+
+
+class RMTTestLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = tempfile.mkdtemp()
+        self.__filename = os.path.join(self.__tmpdir, "rmtoo.log")
+
+    def tearDown(self):
+        tear_down_log_handler()
+        # Back to the defaults: tracing switched off.
+        LOGGING_CONFIG["tracer"]["enabled"] = False
+        init_tracer()
+        shutil.rmtree(self.__tmpdir)
+
+    def __configure(self, tracer_config):
+        '''Configures the logging with the given tracer configuration.'''
+        cfg = Cfg()
+        if tracer_config is not None:
+            tracer_config["filename"] = self.__filename
+            cfg.set_value("global.logging.tracer", tracer_config)
+        configure_logging(cfg, io.StringIO())
+
+    def __write_traces(self):
+        '''Writes a debug and an info trace for each subsystem.'''
+        for subsystem in ("vcs", "parse"):
+            get_tracer(subsystem).debug("debug %s", subsystem)
+            get_tracer(subsystem).info("info %s", subsystem)
+        tracer.debug("debug main")
+
+    def __read_traces(self):
+        '''Returns the messages of the trace file.'''
+        with io.open(self.__filename, encoding="utf-8") as fd:
+            return [line.rstrip("\n").split(";")[-1] for line in fd]
+
+    def rmttest_pos_01(self):
+        "Logging: tracing is switched off by default"
+        self.__configure(None)
+        self.assertFalse(tracer.isEnabledFor(logging.DEBUG))
+        self.assertFalse(get_tracer("vcs").isEnabledFor(logging.DEBUG))
+        self.assertTrue(tracer.isEnabledFor(logging.WARN))
+        self.__write_traces()
+        self.assertFalse(os.path.exists(self.__filename))
+
+    def rmttest_pos_02(self):
+        "Logging: trace level per subsystem"
+        self.__configure({"loglevel": "info",
+                          "subsystems": {"vcs": "debug"}})
+        self.assertFalse(get_tracer("parse").isEnabledFor(logging.DEBUG))
+        self.__write_traces()
+        tear_down_log_handler()
+        init_tracer()
+        self.assertEqual(["debug vcs", "info vcs", "info parse"],
+                         self.__read_traces())
+
+    @unittest.skipIf(not hasattr(logging, "handlers")
+                     or not hasattr(logging.handlers, "QueueHandler"),
+                     "asynchronous tracing not supported")
+    def rmttest_pos_03(self):
+        "Logging: asynchronous tracing"
+        self.__configure({"loglevel": "debug", "async": True})
+        self.__write_traces()
+        # Stops the listener: all queued records are written.
+        LOGGING_CONFIG["tracer"]["enabled"] = False
+        init_tracer()
+        self.assertEqual(["debug vcs", "info vcs", "debug parse",
+                          "info parse", "debug main"],
+                         self.__read_traces()[-5:])
+
+    @unittest.skipIf(not hasattr(logging, "handlers")
+                     or not hasattr(logging.handlers, "QueueHandler")
+                     or get_fork_context() is None,
+                     "asynchronous tracing or forking not supported")
+    def rmttest_pos_04(self):
+        "Logging: asynchronous tracing in a worker process"
+        self.__configure({"loglevel": "debug", "async": True})
+        worker = get_fork_context().Process(target=trace_in_worker)
+        worker.start()
+        worker.join()
+        self.assertEqual(0, worker.exitcode)
+        tracer.debug("debug main")
+        LOGGING_CONFIG["tracer"]["enabled"] = False
+        init_tracer()
+        traces = self.__read_traces()
+        self.assertIn("debug worker", traces)
+        self.assertIn("debug main", traces)
@@ -0,0 +1,86 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the parallel execution of outputs
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+import unittest
+
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.ParallelOutput import ParallelOutput
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+
+def write_output(directory, name, content):
+    '''Writes the content into a file with the given name.
+       Fails for the content 'fail'.'''
+    sys.stderr.write("Output [%s]\n" % name)
+    if content == "fail":
+        raise ValueError("Output [%s] failed" % name)
+    with io.open(os.path.join(directory, name), "w",
+                 encoding="utf-8") as fd:
+        fd.write(content)
+    # The parent process is not changed.
+    os.environ["RMTOO_PARALLEL_OUTPUT_TEST"] = name
+
+
+class RMTTestParallelOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = create_tmp_dir()
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    @staticmethod
+    def __create(workers):
+        '''Creates the parallel output.'''
+        config = Cfg()
+        config.set_value("processing.parallel.output_workers", workers)
+        return ParallelOutput.create_from_config(config)
+
+    def __run(self, contents):
+        '''Runs one output for each content.'''
+        parallel_output = self.__create(2)
+        for idx, content in enumerate(contents):
+            parallel_output.add(self.__tmpdir, "out%d" % idx, content)
+        mstderr = io.StringIO()
+        return parallel_output.run(write_output, mstderr), \
+            mstderr.getvalue()
+
+    def rmttest_pos_01(self):
+        "ParallelOutput: not configured"
+        self.assertIsNone(self.__create(1))
+
+    def rmttest_pos_02(self):
+        "ParallelOutput: all outputs are written"
+        success, stderr = self.__run(["A", "B", "C", "D", "E"])
+        self.assertTrue(success)
+        self.assertEqual("".join("Output [out%d]\n" % idx
+                                 for idx in range(5)), stderr)
+        for idx, content in enumerate(["A", "B", "C", "D", "E"]):
+            with io.open(os.path.join(self.__tmpdir, "out%d" % idx),
+                         encoding="utf-8") as fd:
+                self.assertEqual(content, fd.read())
+        self.assertNotIn("RMTOO_PARALLEL_OUTPUT_TEST", os.environ)
+
+    def rmttest_neg_01(self):
+        "ParallelOutput: errors are collected"
+        success, stderr = self.__run(["A", "fail", "C"])
+        self.assertFalse(success)
+        self.assertTrue(stderr.startswith(
+            "Output [out0]\nOutput [out1]\n+++ ERROR: output [out1] "
+            "failed:\nTraceback"))
+        self.assertIn("ValueError: Output [out1] failed\n", stderr)
+        self.assertTrue(stderr.endswith("Output [out2]\n"))
+        self.assertTrue(os.path.exists(os.path.join(self.__tmpdir,
+                                                    "out2")))
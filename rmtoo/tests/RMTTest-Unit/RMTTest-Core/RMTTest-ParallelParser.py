@@ -0,0 +1,114 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for parallel parsing of requirements
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.InputModules import InputModules
+from rmtoo.lib.ParallelParser import ParallelParser
+from rmtoo.lib.Requirement import Requirement
+from rmtoo.lib.RequirementSet import RequirementSet
+from rmtoo.lib.vcs.FileSystem import FileSystem
+from rmtoo.lib.vcs.ObjectCache import ObjectCache
+from rmtoo.lib.logging import init_logger, tear_down_log_handler
+from rmtoo.tests.lib.TestConfig import TestConfig
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir, \
+    hide_volatile
+
+REQ_TEMPLATE = """Name: %s
+Type: requirement
+Invented on: 2010-08-05
+Invented by: %s
+Description: Something.
+Rationale: Something else.
+Owner: development
+Status: not done
+Priority: development:10
+Effort estimation: 5
+Topic: Basics
+"""
+
+
+class RMTTestParallelParser(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = create_tmp_dir()
+        # Every fifth requirement has an unknown inventor; all others
+        # are solved by R01.
+        valid = ["R%02d" % idx for idx in range(2, 20) if idx % 5]
+        for idx in range(20):
+            inventor = "flonatel" if idx % 5 else "unknown"
+            with io.open(os.path.join(self.__tmpdir, "R%02d.req" % idx),
+                         "w", encoding="utf-8") as req_fd:
+                req_fd.write(REQ_TEMPLATE % ("R%02d" % idx, inventor))
+                if idx == 1:
+                    req_fd.write("Solved by: %s\n" % " ".join(valid))
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    @staticmethod
+    def __create_config(workers):
+        config = TestConfig()
+        config.set_solved_by()
+        config.set_value("requirements.inventors", ["flonatel"])
+        config.set_value("requirements.stakeholders", ["development"])
+        config.set_value("processing.parallel.workers", workers)
+        return config
+
+    def __read(self, workers):
+        '''Reads the requirements; returns the set and the log.'''
+        config = self.__create_config(workers)
+        mods = InputModules(config)
+        file_system = FileSystem(Cfg(
+            {"requirements_dirs": [self.__tmpdir],
+             "topic_root_node": "ReqsDocument"}))
+
+        mstderr = StringIO()
+        init_logger(mstderr)
+        req_set = RequirementSet(config)
+        req_set.read_requirements(file_system, None, mods, ObjectCache())
+        tear_down_log_handler()
+        return req_set, hide_volatile(mstderr.getvalue())
+
+    def rmttest_pos_01(self):
+        "ParallelParser: same requirements and logs as sequential"
+        seq_req_set, seq_log = self.__read(1)
+        par_req_set, par_log = self.__read(3)
+
+        self.assertEqual(16, seq_req_set.get_requirements_cnt())
+        self.assertEqual(sorted(seq_req_set.get_all_requirement_ids()),
+                         sorted(par_req_set.get_all_requirement_ids()))
+        self.assertIn(" 45:R05:could not be parsed", par_log)
+        self.assertEqual(seq_log, par_log)
+
+    def rmttest_pos_02(self):
+        "ParallelParser: few jobs are not parsed in the pool"
+        config = self.__create_config(3)
+        parser = ParallelParser.create_from_config(
+            config, InputModules(config))
+        jobs = [(REQ_TEMPLATE % ("R%02d" % idx, "flonatel"),
+                 "R%02d" % idx, "R%02d.req" % idx) for idx in range(6)]
+        try:
+            self.assertIsNone(parser.parse(Requirement, jobs[:5]))
+            results = parser.parse(Requirement, jobs)
+        finally:
+            parser.close()
+        self.assertEqual(6, len(results))
+        # The last element of the parsed state is the usable flag.
+        self.assertTrue(all(state[-1] for state, _ in results))
@@ -0,0 +1,146 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the persistent cache
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import os
+import unittest
+
+from rmtoo.lib.configuration.Cfg import Cfg
+from rmtoo.lib.InputModules import InputModules
+from rmtoo.lib.RequirementSet import RequirementSet
+from rmtoo.lib.vcs.FileSystem import FileSystem
+from rmtoo.lib.vcs.ObjectCache import ObjectCache
+from rmtoo.lib.vcs.PersistentCache import PersistentCache, \
+    compute_code_digest
+from rmtoo.tests.lib.TestConfig import TestConfig
+from rmtoo.tests.lib.Utils import create_tmp_dir, delete_tmp_dir
+
+REQ_TEMPLATE = """Name: %s
+Type: requirement
+Invented on: 2010-08-05
+Invented by: flonatel
+Description: Something.
+Rationale: Something else.
+Owner: development
+Status: not done
+Priority: development:10
+Effort estimation: 5
+Topic: Basics
+"""
+
+
+class RMTTestPersistentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = create_tmp_dir()
+
+    def tearDown(self):
+        delete_tmp_dir(self.__tmpdir)
+
+    def rmttest_pos_01(self):
+        "PersistentCache: store and retrieve a state"
+        pcache = PersistentCache(self.__tmpdir, 1024 * 1024, "{}")
+        pkey = pcache.create_key("Requirement", "Name: t\n", ["ReqName"])
+        self.assertIsNone(pcache.get(pkey))
+        pcache.add(pkey, {"Name": "t"})
+        self.assertEqual({"Name": "t"}, pcache.get(pkey))
+        self.assertEqual((1, 1, 1, 0), pcache.get_stats()[:4])
+
+    def rmttest_pos_02(self):
+        "PersistentCache: key depends on content and modules"
+        pcache = PersistentCache(self.__tmpdir, 1024 * 1024, "{}")
+        pkey = pcache.create_key("Requirement", "Name: t\n", ["ReqName"])
+        self.assertNotEqual(
+            pkey, pcache.create_key("Requirement", "Name: u\n", ["ReqName"]))
+        self.assertNotEqual(
+            pkey, pcache.create_key("Requirement", "Name: t\n", []))
+        self.assertNotEqual(
+            pkey, pcache.create_key("Constraint", "Name: t\n", ["ReqName"]))
+        self.assertNotEqual(
+            pkey, PersistentCache(self.__tmpdir, 1024 * 1024, "{1}")
+            .create_key("Requirement", "Name: t\n", ["ReqName"]))
+
+    def rmttest_pos_03(self):
+        "PersistentCache: least recently used entries are evicted"
+        pcache = PersistentCache(self.__tmpdir, 1024 * 1024, "{}")
+        pcache.add("first", "x" * 1000)
+        entry_size = pcache.get_stats()[4]
+        pcache = PersistentCache(self.__tmpdir, entry_size * 2, "{}")
+        os.utime(os.path.join(self.__tmpdir, "first.pickle"), (0, 0))
+        pcache.add("second", "y" * 1000)
+        pcache.add("third", "z" * 1000)
+        self.assertIsNone(pcache.get("first"))
+        self.assertEqual("y" * 1000, pcache.get("second"))
+        self.assertEqual("z" * 1000, pcache.get("third"))
+        self.assertEqual(1, pcache.get_stats()[3])
+
+    def rmttest_pos_04(self):
+        "PersistentCache: not configured"
+        self.assertIsNone(PersistentCache.create_from_config(TestConfig()))
+
+    def rmttest_pos_05(self):
+        "PersistentCache: requirements are read from the cache"
+        config = TestConfig()
+        config.set_solved_by()
+        config.set_value("requirements.inventors", ["flonatel"])
+        config.set_value("requirements.stakeholders", ["development"])
+        config.set_value("processing.cache.directory",
+                         os.path.join(self.__tmpdir, "cache"))
+        mods = InputModules(config)
+        req_dir = os.path.join(self.__tmpdir, "reqs")
+        os.mkdir(req_dir)
+        for rid, solved_by in [("Master", "Child"), ("Child", None)]:
+            with io.open(os.path.join(req_dir, rid + ".req"), "w",
+                         encoding="utf-8") as req_fd:
+                req_fd.write(REQ_TEMPLATE % rid)
+                if solved_by is not None:
+                    req_fd.write("Solved by: %s\n" % solved_by)
+        file_system = FileSystem(Cfg(
+            {"requirements_dirs": [req_dir],
+             "topic_root_node": "ReqsDocument"}))
+
+        req_sets = []
+        for _ in range(2):
+            pcache = PersistentCache.create_from_config(config)
+            req_set = RequirementSet(config)
+            req_set.read_requirements(file_system, None, mods,
+                                      ObjectCache(pcache))
+            self.assertTrue(req_set.is_usable())
+            req_sets.append(req_set)
+
+        self.assertEqual((2, 0, 0), pcache.get_stats()[:3])
+        self.assertEqual(req_sets[0].get_requirements_cnt(),
+                         req_sets[1].get_requirements_cnt())
+        for rid, req in req_sets[0].get_requirements_iteritems():
+            self.assertEqual(
+                req.get_value("Name").get_content(),
+                req_sets[1].get_requirement(rid).get_value(
+                    "Name").get_content())
+
+    def rmttest_pos_06(self):
+        "PersistentCache: code digest depends on the source files"
+        package_dir = os.path.join(self.__tmpdir, "package")
+        for subdir in ("lib", "tests"):
+            os.makedirs(os.path.join(package_dir, subdir))
+
+        def write(filename, content):
+            with io.open(os.path.join(package_dir, filename), "w") as fd:
+                fd.write(content)
+        write("lib/A.py", "a = 1\n")
+        write("lib/A.txt", "text\n")
+        write("tests/T.py", "t = 1\n")
+        digest = compute_code_digest(package_dir)
+        write("lib/A.txt", "other text\n")
+        write("tests/T.py", "t = 2\n")
+        self.assertEqual(digest, compute_code_digest(package_dir))
+        write("lib/A.py", "a = 2\n")
+        self.assertNotEqual(digest, compute_code_digest(package_dir))
@@ -0,0 +1,101 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the profiler
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+from rmtoo.lib.Profiler import Profiler
+
+
+class RMTTestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.__tmpdir)
+
+    @staticmethod
+    def __run_phases(profiler):
+        '''Runs some nested phases.'''
+        with profiler.phase("read"):
+            for _ in range(3):
+                with profiler.phase("parse"):
+                    sum(range(1000))
+        with profiler.phase("output"):
+            pass
+
+    def rmttest_pos_01(self):
+        "Profiler: nested phases"
+        profiler = Profiler()
+        self.__run_phases(profiler)
+        report = profiler.get_report()
+        self.assertEqual([["read"], ["read", "parse"], ["output"]],
+                         [phase["path"] for phase in report["phases"]])
+        self.assertEqual([1, 3, 1],
+                         [phase["count"] for phase in report["phases"]])
+        read, parse, _ = report["phases"]
+        self.assertEqual("parse", parse["name"])
+        self.assertGreaterEqual(read["wall"], parse["wall"])
+        self.assertGreaterEqual(parse["cpu"], 0.0)
+
+        profiler.reset()
+        self.assertEqual({"phases": []}, profiler.get_report())
+
+    def rmttest_pos_02(self):
+        "Profiler: exception in phase"
+        profiler = Profiler()
+        with self.assertRaises(ValueError):
+            with profiler.phase("read"):
+                raise ValueError()
+        with profiler.phase("output"):
+            pass
+        self.assertEqual([["read"], ["output"]],
+                         [phase["path"] for phase in
+                          profiler.get_report()["phases"]])
+
+    def rmttest_pos_03(self):
+        "Profiler: JSON report and cProfile dumps"
+        profiler = Profiler()
+        profiler.set_cprofile_directory(self.__tmpdir)
+        self.__run_phases(profiler)
+        filename = os.path.join(self.__tmpdir, "profile.json")
+        profiler.write_report(filename)
+        with io.open(filename, encoding="utf-8") as fd:
+            self.assertEqual(profiler.get_report(), json.load(fd))
+        self.assertEqual(["001-read.prof", "002-output.prof", "profile.json"],
+                         sorted(os.listdir(self.__tmpdir)))
+        stats = pstats.Stats(os.path.join(self.__tmpdir, "001-read.prof"))
+        self.assertTrue(stats.total_calls > 0)
+
+    def rmttest_pos_04(self):
+        "Profiler: timed function calls when enabled"
+        profiler = Profiler()
+        self.assertIs(sum, profiler.timed("sum", sum))
+        profiler.set_enabled(True)
+        timed_sum = profiler.timed("sum", sum)
+        with profiler.phase("walk"):
+            self.assertEqual(3, timed_sum([1, 2]))
+            with profiler.phase("topic"):
+                timed_sum([])
+            timed_sum([3])
+        report = profiler.get_report()
+        self.assertEqual([(["walk"], 1), (["walk", "sum"], 2),
+                          (["walk", "topic"], 1),
+                          (["walk", "topic", "sum"], 1)],
+                         [(phase["path"], phase["count"])
+                          for phase in report["phases"]])
@@ -17,6 +17,7 @@ except ImportError:
     from io import StringIO
 import unittest
 
+from rmtoo.lib.CE3 import CE3
 from rmtoo.lib.RequirementSet import RequirementSet
 from rmtoo.lib.InputModules import InputModules
 from rmtoo.lib.Requirement import Requirement
@@ -97,3 +98,42 @@ class RMTTestReqSet(unittest.TestCase):
 
         self.assertTrue(result0)
         self.assertTrue(result1)
+
+    def rmttest_restrict_to_topics_01(self):
+        "Restrict requirement set to topics"
+        config = TestConfig()
+        reqs = RequirementSet(config)
+        for rid, topic in [("A", "Basics"), ("B", "MoreBasics"),
+                           ("C", "Basics"), ("D", "Other"),
+                           ("E", "MoreBasics")]:
+            req = Requirement("Name: %s" % rid, rid, None, None, None)
+            req.set_value("Topic", topic)
+            req.set_value("Constraints", None)
+            req.set_value("Test Cases", None)
+            reqs.add_requirement(req)
+            reqs.add_ce3(rid, CE3())
+
+        self.assertEqual(
+            ["A", "C"],
+            list(reqs.restrict_to_topics("Basics")
+                 .get_all_requirement_ids()))
+        restricted = reqs.restrict_to_topics(
+            set(["Basics", "MoreBasics", "Unknown"]))
+        self.assertEqual(["A", "B", "C", "E"],
+                         list(restricted.get_all_requirement_ids()))
+        self.assertEqual(["A", "B", "C", "E"],
+                         [node.get_id() for node in restricted.nodes])
+        self.assertEqual(
+            [], list(reqs.restrict_to_topics([]).get_all_requirement_ids()))
+
+        # The index is updated when requirements are added.
+        req = Requirement("Name: F", "F", None, None, None)
+        req.set_value("Topic", "Other")
+        req.set_value("Constraints", None)
+        req.set_value("Test Cases", None)
+        reqs.add_requirement(req)
+        reqs.add_ce3("F", CE3())
+        self.assertEqual(
+            ["D", "F"],
+            list(reqs.restrict_to_topics("Other")
+                 .get_all_requirement_ids()))
@@ -0,0 +1,153 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the burndown statistics
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import datetime
+import random
+import unittest
+
+from rmtoo.lib.ClassType import ClassTypeImplementable, \
+    ClassTypeDetailable, ClassTypeSelected
+from rmtoo.lib.RequirementStatus import RequirementStatusNotDone, \
+    RequirementStatusAssigned, RequirementStatusFinished
+from rmtoo.lib.Statistics import Statistics
+
+
+class RequirementMock(object):
+    '''Requirement with the values used by the statistics.'''
+
+    def __init__(self, values, status):
+        self.__values = values
+        self.__status = status
+
+    def get_value(self, key):
+        return self.__values.get(key)
+
+    def get_status(self):
+        return self.__status
+
+
+class RequirementSetMock(object):
+    '''Requirement set with the given requirements.'''
+
+    def __init__(self, requirements):
+        self.__requirements = requirements
+
+    def get_requirements_iteritems(self):
+        return enumerate(self.__requirements)
+
+
+def create_requirement_set(rand, start_date, days, count):
+    '''Creates requirements with random dates, states and classes.'''
+    requirements = []
+    for _ in range(count):
+        invented_on = start_date + datetime.timedelta(
+            rand.randint(-10, days - 1))
+        date = (invented_on + datetime.timedelta(rand.randint(0, days)))
+        status = rand.choice([
+            RequirementStatusNotDone(None, "R", "not done"),
+            RequirementStatusAssigned(
+                None, "R", "assigned:me:%s" % date),
+            RequirementStatusFinished(
+                None, "R", "finished:me:%s:3h" % date),
+            RequirementStatusFinished(None, "R", "finished")])
+        requirements.append(RequirementMock(
+            {"Invented on": invented_on,
+             "Effort estimation": rand.choice([None, 1, 3, 34]),
+             "Class": rand.choice([ClassTypeImplementable(),
+                                   ClassTypeDetailable(),
+                                   ClassTypeSelected()])}, status))
+    return RequirementSetMock(requirements)
+
+
+def get_units_loop(rset, start_date, end_date):
+    '''The statistics computed day by day for each requirement.'''
+    days = (end_date - start_date).days + 1
+    result_vec = [[0, 0, 0] for _ in range(days)]
+
+    def add_period(column, first_date, last_date, efe):
+        first = max((first_date - start_date).days, 0)
+        last = min((last_date - start_date).days, days - 1)
+        for day in range(first, last + 1):
+            result_vec[day][column] += efe
+
+    for _, req in rset.get_requirements_iteritems():
+        efe = req.get_value("Effort estimation")
+        status = req.get_status()
+        if efe is None:
+            continue
+        if isinstance(status, RequirementStatusNotDone):
+            if req.get_value("Class").is_implementable():
+                add_period(0, req.get_value("Invented on"), end_date, efe)
+        elif status.get_date() is not None:
+            column = 1 if isinstance(status, RequirementStatusAssigned) \
+                else 2
+            add_period(0, start_date,
+                       status.get_date() - datetime.timedelta(1), efe)
+            add_period(column, max(status.get_date(), start_date),
+                       end_date, efe)
+    return result_vec
+
+
+class RMTTestStatistics(unittest.TestCase):
+
+    def rmttest_pos_01(self):
+        "Statistics: same result as counting each day"
+        rand = random.Random(1)
+        start_date = datetime.date(2011, 4, 25)
+        end_date = start_date + datetime.timedelta(99)
+        rset = create_requirement_set(rand, start_date, 100, 200)
+        self.assertEqual(get_units_loop(rset, start_date, end_date),
+                         Statistics.get_units(
+                             rset, start_date, end_date).tolist())
+
+    def rmttest_pos_02(self):
+        "Statistics: one requirement not done, assigned and finished"
+        start_date = datetime.date(2011, 4, 25)
+        end_date = datetime.date(2011, 4, 29)
+        rset = RequirementSetMock([
+            RequirementMock({"Invented on": datetime.date(2011, 4, 26),
+                             "Effort estimation": 3,
+                             "Class": ClassTypeImplementable()},
+                            RequirementStatusNotDone(None, "R", "not done")),
+            RequirementMock({"Invented on": datetime.date(2011, 4, 1),
+                             "Effort estimation": 5,
+                             "Class": ClassTypeSelected()},
+                            RequirementStatusAssigned(
+                                None, "R", "assigned:me:2011-04-27")),
+            RequirementMock({"Invented on": datetime.date(2011, 4, 1),
+                             "Effort estimation": 8,
+                             "Class": ClassTypeImplementable()},
+                            RequirementStatusFinished(
+                                None, "R", "finished:me:2011-04-28:3h"))])
+        self.assertEqual([[13, 0, 0], [16, 0, 0], [11, 5, 0], [3, 5, 8],
+                          [3, 5, 8]],
+                         Statistics.get_units(
+                             rset, start_date, end_date).tolist())
+        self.assertEqual([[5, 0, 0], [5, 0, 0], [0, 5, 0], [0, 5, 0],
+                          [0, 5, 0]],
+                         Statistics.get_units_sprint(
+                             rset, start_date, end_date).tolist())
+
+    def rmttest_pos_03(self):
+        "Statistics: result vector is shared for the same period"
+        rand = random.Random(2)
+        start_date = datetime.date(2011, 4, 25)
+        end_date = start_date + datetime.timedelta(9)
+        rset = create_requirement_set(rand, start_date, 10, 20)
+        result_vec = Statistics.get_units(rset, start_date, end_date)
+        self.assertIs(result_vec,
+                      Statistics.get_units(rset, start_date, end_date))
+        self.assertFalse(result_vec.flags.writeable)
+        self.assertIsNot(result_vec, Statistics.get_units(
+            rset, start_date, end_date - datetime.timedelta(1)))
+        self.assertIsNot(result_vec, Statistics.get_units_sprint(
+            rset, start_date, end_date))
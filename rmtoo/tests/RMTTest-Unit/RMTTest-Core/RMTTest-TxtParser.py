@@ -0,0 +1,46 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit test for the index based TxtParser
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import unicode_literals
+
+import unittest
+
+from rmtoo.lib.storagebackend.txtfile.TxtParser import TxtParser
+from rmtoo.tests.benchmark.BenchTxtParser import legacy_split_entries, \
+    create_record
+
+
+class RMTTestTxtParser(unittest.TestCase):
+
+    def rmttest_pos_01(self):
+        "TxtParser: split_entries does not modify the input"
+        split_lines = ["Name: t", " cont", "# comment", "", "Topic: x"]
+        success, doc = TxtParser.split_entries(
+            split_lines, "Parse", None, 1)
+        self.assertTrue(success)
+        self.assertEqual(5, len(split_lines))
+        self.assertEqual(
+            [["Name:", [" t", " cont"], ["# comment", ""]],
+             ["Topic:", [" x"], []]], doc)
+
+    def rmttest_pos_02(self):
+        "TxtParser: same result as the former implementation"
+        split_lines = create_record(1000)
+        self.assertEqual(
+            legacy_split_entries(list(split_lines), "Parse", 1),
+            TxtParser.split_entries(split_lines, "Parse", None, 1))
+
+    def rmttest_neg_01(self):
+        "TxtParser: same result as former implementation with errors"
+        split_lines = [" no tag", "Name: t", "rubbish", " cont",
+                       ": no tag", "Topic: x", "\tTab"]
+        self.assertEqual(
+            legacy_split_entries(list(split_lines), "Parse", 1),
+            TxtParser.split_entries(split_lines, "Parse", None, 1))
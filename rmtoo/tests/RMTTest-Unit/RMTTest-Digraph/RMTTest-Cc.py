@@ -13,7 +13,7 @@ import unittest
 from rmtoo.lib.RMTException import RMTException
 from rmtoo.lib.digraph.Digraph import Digraph
 from rmtoo.lib.digraph.ConnectedComponents \
-    import connected_components, ConnectedComponents
+    import connected_components, is_connected, ConnectedComponents
 
 
 class CCTest(unittest.TestCase):
@@ -40,3 +40,36 @@ class CCTest(unittest.TestCase):
         with self.assertRaises(RMTException) as rmte:
             ccc.find(None)
             self.assertEqual(68, rmte.get_id())
+
+    def rmttest_cc_004(self):
+        "digraph connected_component: components as string"
+        digraph = Digraph({"A": ["B"], "B": [], "C": ["D", "E"],
+                           "D": [], "E": ["C"], "F": []})
+        ccs = connected_components(digraph)
+        self.assertEqual(3, ccs.get_length())
+        self.assertEqual(
+            sorted([["A", "B"], ["C", "D", "E"], ["F"]]),
+            sorted(sorted(component) for component in ccs.as_string()))
+
+    def rmttest_cc_005(self):
+        "digraph is_connected"
+        self.assertFalse(is_connected(Digraph({})))
+        self.assertTrue(is_connected(Digraph({"A": []})))
+        self.assertTrue(is_connected(
+            Digraph({"A": ["B"], "B": [], "C": ["B"]})))
+        self.assertFalse(is_connected(
+            Digraph({"A": ["B"], "B": [], "C": ["D"], "D": []})))
+
+    def rmttest_cc_006(self):
+        "digraph connected_component: long chain"
+        node_cnt = 10000
+        chain = dict(("N%05d" % idx, ["N%05d" % (idx + 1)])
+                     for idx in range(node_cnt - 1))
+        chain["N%05d" % (node_cnt - 1)] = []
+        digraph = Digraph(chain)
+        self.assertEqual(1, connected_components(digraph).get_length())
+        self.assertTrue(is_connected(digraph))
+        digraph.find("N05000").outgoing = []
+        digraph.find("N05001").incoming = []
+        self.assertEqual(2, connected_components(digraph).get_length())
+        self.assertFalse(is_connected(digraph))
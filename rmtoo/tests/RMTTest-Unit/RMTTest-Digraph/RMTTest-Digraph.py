@@ -144,3 +144,33 @@ class RMTTestDigraph(unittest.TestCase):
         with self.assertRaises(RMTException) as rmte:
             dg.add_node(n2)
             self.assertEqual(39, rmte.id())
+
+    def rmttest_add_node_02(self):
+        "Digraph add node keeps the named nodes up to date"
+        dg = Digraph({"A": ["B"], "B": []})
+        dg.build_named_nodes()
+        n1 = Digraph.Node("C")
+        dg.add_node(n1)
+        self.assertEqual(n1, dg.get_named_node("C"))
+        self.assertEqual(n1, dg.find("C"))
+        self.assertEqual(["A", "B", "C"],
+                         sorted(node.name for node in dg.nodes))
+
+    def rmttest_find_03(self):
+        "Digraph find nodes which are directly appended or replaced"
+        dg = Digraph()
+        n1 = Digraph.Node("A")
+        dg.add_node(n1)
+        n2 = Digraph.Node("B")
+        dg.nodes.append(n2)
+        self.assertEqual(n2, dg.find("B"))
+        with self.assertRaises(RMTException) as rmte:
+            dg.add_node(Digraph.Node("B"))
+        self.assertEqual(39, rmte.exception.get_id())
+        n3 = Digraph.Node("C")
+        dg.nodes = [n3, n2]
+        self.assertEqual(n3, dg.find("C"))
+        self.assertIsNone(dg.find("A"))
+        dg.nodes = [n2]
+        self.assertIsNone(dg.find("C"))
+        self.assertEqual(n2, dg.find("B"))
@@ -0,0 +1,82 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Unit tests for the reachability index
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+import random
+import unittest
+
+from rmtoo.lib.digraph.Digraph import Digraph
+from rmtoo.lib.digraph.Reachability import Reachability
+
+
+class RMTTestReachability(unittest.TestCase):
+
+    def __check_all(self, digraph):
+        '''Compares the index with the recursive implementation for all
+           pairs of nodes.'''
+        reachability = Reachability(digraph)
+        for node in digraph.nodes:
+            for onode in digraph.nodes:
+                self.assertEqual(node.is_self_of_ancient(onode),
+                                 reachability.is_self_of_ancient(node, onode))
+                self.assertEqual(
+                    onode.is_self_of_ancient(node),
+                    reachability.is_self_of_descendant(node, onode))
+
+    def rmttest_pos_01(self):
+        "Reachability: tree"
+        dg = Digraph({"A": ["B", "C"], "B": ["D", "E"], "C": ["F"],
+                      "D": [], "E": [], "F": []})
+        reachability = Reachability(dg)
+        self.assertTrue(reachability.is_self_of_ancient(dg.find("E"),
+                                                        dg.find("A")))
+        self.assertTrue(reachability.is_self_of_ancient(dg.find("E"),
+                                                        dg.find("E")))
+        self.assertFalse(reachability.is_self_of_ancient(dg.find("E"),
+                                                         dg.find("C")))
+        self.assertFalse(reachability.is_self_of_ancient(dg.find("A"),
+                                                         dg.find("E")))
+        self.__check_all(dg)
+
+    def rmttest_pos_02(self):
+        "Reachability: random DAGs"
+        rand = random.Random(4711)
+        for _ in range(20):
+            names = ["N%02d" % idx for idx in range(25)]
+            dg = Digraph(dict(
+                (name, [oname for oname in names[idx + 1:]
+                        if rand.random() < 0.1])
+                for idx, name in enumerate(names)))
+            self.__check_all(dg)
+
+    def rmttest_pos_03(self):
+        "Reachability: nodes not in the nodes list and unknown nodes"
+        dg = Digraph()
+        root = Digraph.Node("Root")
+        child = Digraph.Node("Child")
+        dg.add_node(child)
+        Digraph.create_edge(root, child)
+        reachability = Reachability(dg)
+        self.assertTrue(reachability.is_self_of_ancient(child, root))
+        self.assertFalse(reachability.is_self_of_ancient(root, child))
+        self.assertFalse(reachability.is_self_of_ancient(child, None))
+        other = Digraph.Node("Other")
+        self.assertTrue(reachability.is_self_of_ancient(other, other))
+        self.assertFalse(reachability.is_self_of_ancient(other, child))
+
+    def rmttest_pos_04(self):
+        "Reachability: digraph with circles"
+        dg = Digraph({"A": ["B"], "B": ["C"], "C": ["B", "D"], "D": []})
+        reachability = Reachability(dg)
+        self.assertTrue(reachability.is_self_of_ancient(dg.find("B"),
+                                                        dg.find("C")))
+        self.assertTrue(reachability.is_self_of_ancient(dg.find("D"),
+                                                        dg.find("A")))
+        self.assertFalse(reachability.is_self_of_ancient(dg.find("A"),
+                                                         dg.find("B")))
@@ -75,3 +75,16 @@ class RMTTestSCCTests(unittest.TestCase):
         sccs = strongly_connected_components(dg)
         scc_exists = check_for_strongly_connected_components(sccs)
         self.assertEqual(scc_exists, True, "incorrect")
+
+    def rmttest_scc_009(self):
+        "Very deep digraph (deeper than the recursion limit) with circle"
+        depth = 10000
+        dg = Digraph(dict(("N%05d" % idx, ["N%05d" % ((idx + 1) % depth)])
+                          for idx in range(depth)))
+        sccs = strongly_connected_components(dg)
+        self.assertEqual(1, len(sccs))
+        self.assertEqual(depth, len(sccs[0]))
+        dg.find("N%05d" % (depth - 1)).outgoing = []
+        sccs = strongly_connected_components(dg)
+        self.assertEqual(depth, len(sccs))
+        self.assertFalse(check_for_strongly_connected_components(sccs))
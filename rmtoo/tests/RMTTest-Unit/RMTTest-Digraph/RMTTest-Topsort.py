@@ -69,3 +69,15 @@ class RMTTestTopologicalSearchTests(unittest.TestCase):
         self.assertTrue(self.__list_order(tnames, "B", "A"))
         self.assertTrue(self.__list_order(tnames, "C", "A"))
         self.assertTrue(self.__list_order(tnames, "E", "D"))
+
+    def rmttest_tsort_006(self):
+        "Very deep digraph (deeper than the recursion limit)"
+        depth = 10000
+        chain = dict(("N%05d" % idx, ["N%05d" % (idx + 1)])
+                     for idx in range(depth))
+        chain["N%05d" % depth] = []
+        dg = Digraph(chain)
+        tsort = topological_sort(dg)
+        tnames = node_list_to_node_name_list(tsort)
+        self.assertEqual(["N%05d" % idx for idx in range(depth, -1, -1)],
+                         tnames)
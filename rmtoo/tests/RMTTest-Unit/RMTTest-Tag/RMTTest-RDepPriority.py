@@ -16,6 +16,7 @@ from rmtoo.inputs.RDepPriority import RDepPriority
 from rmtoo.tests.lib.TestConfig import TestConfig
 from rmtoo.lib.RequirementSet import RequirementSet
 from rmtoo.lib.Requirement import Requirement
+from rmtoo.tests.benchmark.BenchRDepPriority import create_diamonds
 
 
 class RMTTestRDepPriority(unittest.TestCase):
@@ -120,3 +121,16 @@ Type: requirement''', 'D', None, None, None)
             0.4, reqset.get_named_node("C").get_value("Priority"))
         self.assertEqual(
             0.2, reqset.get_named_node("D").get_value("Priority"))
+
+    def rmttest_positive_04(self):
+        "Layered diamond digraph with many layers"
+        reqset = create_diamonds(64)
+        RDepPriority.rewrite(reqset)
+        # The best path uses only the 'B' nodes with a factor of 1.0
+        self.assertEqual(
+            reqset.find("L063A").get_value("Factor"),
+            reqset.find("L063A").get_value("Priority"))
+        self.assertEqual(
+            1.0, reqset.find("L063B").get_value("Priority"))
+        self.assertGreater(
+            1.0, reqset.find("L000A").get_value("Priority"))
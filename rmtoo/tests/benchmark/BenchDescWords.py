@@ -0,0 +1,94 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Micro benchmark for the DescWords analytics.
+   Compares the single scan of the WordMatcher with the former
+   implementation which removed the markup and called findall() for
+   each word.  The second run adds the given number of (generated)
+   words to the word list.
+
+   Usage: python -m rmtoo.tests.benchmark.BenchDescWords [descs] [words]
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import random
+import sys
+import timeit
+
+from rmtoo.lib.analytics.DescWords import DescWords
+from rmtoo.lib.analytics.Result import Result
+from rmtoo.lib.configuration.Cfg import Cfg
+
+
+class LegacyDescWords(DescWords):
+    '''The former implementation of analyse().'''
+
+    def analyse(self, lname, text):
+        level = -10
+        log = []
+        for wre, wlvl, wdsc in self.lwords:
+            plain_txt = self.markup.replace(text).strip()
+            fal = len(wre.findall(plain_txt))
+            if fal > 0:
+                level += fal * wlvl
+                log.append("%+4d:%d*%d: %s" % (fal * wlvl, fal, wlvl, wdsc))
+        return Result('DescWords', lname, level, log)
+
+
+def create_descriptions(desc_cnt):
+    '''Creates descriptions with some of the words.'''
+    rand = random.Random(1)
+    vocabulary = ["The", "system", "must", "should", "and", "or", "may",
+                  "e.g.", "some", "\\textbf{data}", "output", "etc.",
+                  "be", "written", "to", "the", "file."]
+    return [" ".join(rand.choice(vocabulary) for _ in range(30))
+            for _ in range(desc_cnt)]
+
+
+def analyse_all(desc_words, descriptions):
+    '''Analyses all the descriptions.'''
+    return [desc_words.analyse("REQ", description).get_value()
+            for description in descriptions]
+
+
+def run(desc_cnt=1000, word_cnt=2000, repeat=3):
+    '''Runs both implementations (with the default and with the
+    extended word list) and returns the best timings as
+    ((legacy, current), (legacy, current)).'''
+    descriptions = create_descriptions(desc_cnt)
+    config = Cfg()
+    config.set_value("processing.analytics.descwords.words.en_GB",
+                     [[" word%d " % idx, -1, "Word %d" % idx]
+                      for idx in range(word_cnt)])
+    timings = []
+    for cfg in [Cfg(), config]:
+        legacy = LegacyDescWords(cfg)
+        current = DescWords(cfg)
+        assert analyse_all(legacy, descriptions) \
+            == analyse_all(current, descriptions)
+        timings.append(tuple(
+            min(timeit.repeat(lambda: analyse_all(desc_words, descriptions),
+                              number=1, repeat=repeat))
+            for desc_words in [legacy, current]))
+    return timings
+
+
+def main(args):
+    '''Print the timings.'''
+    desc_cnt = int(args[0]) if args else 1000
+    word_cnt = int(args[1]) if len(args) > 1 else 2000
+    default_times, extended_times = run(desc_cnt, word_cnt)
+    print("descriptions [%d] default words: legacy [%.4fs] current "
+          "[%.4fs]" % ((desc_cnt,) + default_times))
+    print("descriptions [%d] with [%d] additional words: legacy [%.4fs] "
+          "current [%.4fs]" % ((desc_cnt, word_cnt) + extended_times))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
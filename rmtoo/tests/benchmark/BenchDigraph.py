@@ -0,0 +1,81 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Micro benchmark for the digraph.
+   Compares adding and finding nodes using the name index of the
+   Digraph with the former implementation which scanned the list
+   of all nodes.
+
+   Usage: python -m rmtoo.tests.benchmark.BenchDigraph [nodes]
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import timeit
+
+from rmtoo.lib.RMTException import RMTException
+from rmtoo.lib.digraph.Digraph import Digraph
+
+
+class LegacyDigraph(Digraph):
+    '''The former implementation of add_node() and find().'''
+
+    def add_node(self, node_a):
+        '''Adds a new node to the graph'''
+        for node_idx in self.nodes:
+            if node_idx.name == node_a.name:
+                raise RMTException(39, "Node with name '%s' already exists"
+                                   % node_a.name)
+        self.nodes.append(node_a)
+
+    def find(self, name):
+        '''Find a node with a given name'''
+        for node in self.nodes:
+            if name == node.name:
+                return node
+        return None
+
+
+def build_and_find(digraph_class, names):
+    '''Adds a node for each name and finds all of them afterwards.'''
+    digraph = digraph_class()
+    for name in names:
+        digraph.add_node(Digraph.Node(name))
+    for name in names:
+        assert digraph.find(name).name == name
+    return digraph
+
+
+def run(node_cnt=50000, legacy_node_cnt=5000, repeat=3):
+    '''Runs both implementations and returns the best timings
+    (legacy, current).  Because the legacy implementation is
+    quadratic, it uses less nodes by default.'''
+    names = ["REQ%06d" % idx for idx in range(node_cnt)]
+    legacy_names = names[:legacy_node_cnt]
+    legacy_time = min(timeit.repeat(
+        lambda: build_and_find(LegacyDigraph, legacy_names),
+        number=1, repeat=repeat))
+    current_time = min(timeit.repeat(
+        lambda: build_and_find(Digraph, names),
+        number=1, repeat=repeat))
+    return legacy_time, current_time
+
+
+def main(args):
+    '''Print the timings.'''
+    node_cnt = int(args[0]) if args else 50000
+    legacy_node_cnt = int(args[1]) if len(args) > 1 else 5000
+    legacy_time, current_time = run(node_cnt, legacy_node_cnt)
+    print("legacy: nodes [%d] time [%.4fs]; current: nodes [%d] time "
+          "[%.4fs]" % (legacy_node_cnt, legacy_time, node_cnt,
+                       current_time))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,140 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Regression benchmark for the priority computation.
+   Uses a layered diamond graph: each node of a layer is solved by
+   both nodes of the next layer.  The former implementation walked
+   the subtree again each time a higher priority was found, which
+   is exponential in the number of layers.
+
+   Usage: python -m rmtoo.tests.benchmark.BenchRDepPriority [layers]
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import sys
+import timeit
+
+from rmtoo.inputs.RDepPriority import RDepPriority
+from rmtoo.lib.digraph.Digraph import Digraph
+
+
+class BenchNode(Digraph.Node):
+    '''The parts of a requirement needed for the priority
+    computation.'''
+
+    def __init__(self, name, factor):
+        Digraph.Node.__init__(self, name)
+        self.values = {"Factor": factor}
+
+    def get_id(self):
+        '''Returns the id.'''
+        return self.name
+
+    def get_value(self, key):
+        '''Returns the value.'''
+        return self.values[key]
+
+    def set_value(self, key, value):
+        '''Sets the value.'''
+        self.values[key] = value
+
+    def is_value_available(self, key):
+        '''Checks if the value is available.'''
+        return key in self.values
+
+
+class BenchSet(Digraph):
+    '''The parts of a requirement set needed for the priority
+    computation.'''
+
+    def __init__(self):
+        Digraph.__init__(self)
+        self.master_nodes = set()
+
+    def get_master_nodes(self):
+        '''Returns the master nodes.'''
+        return self.master_nodes
+
+
+def legacy_rewrite(reqset):
+    '''The former implementation of RDepPriority.rewrite.'''
+
+    def handle_priorization(node, inc_weight):
+        '''Sets the priority and walks down the subtree if it was
+        increased.'''
+        weight = inc_weight * node.get_value("Factor")
+        if not node.is_value_available("Priority") \
+                or node.get_value("Priority") < weight:
+            node.set_value("Priority", weight)
+            for out_node in node.outgoing:
+                handle_priorization(out_node, weight)
+
+    for req in reqset.get_master_nodes():
+        handle_priorization(req, 1.0)
+
+
+def create_diamonds(layers):
+    '''Creates the layered diamond graph.  In each layer the node with
+    the lower factor comes first and the differences of the factors
+    of the upper layers are larger: the depth first search of the
+    legacy implementation then finds a higher priority for each path
+    and walks the subtree again.'''
+    reqset = BenchSet()
+    master = BenchNode("M", 1.0)
+    reqset.add_node(master)
+    reqset.master_nodes.add(master)
+    previous = [master]
+    for layer in range(layers):
+        current = [BenchNode("L%03dA" % layer,
+                             math.exp(-1e-6 * 2 ** (layers - layer))),
+                   BenchNode("L%03dB" % layer, 1.0)]
+        for node in current:
+            reqset.add_node(node)
+            for prev_node in previous:
+                Digraph.create_edge(prev_node, node)
+        previous = current
+    return reqset
+
+
+def priorities(reqset):
+    '''Returns the computed priorities.'''
+    return dict((node.name, node.get_value("Priority"))
+                for node in reqset.nodes)
+
+
+def run(layers=20, repeat=3):
+    '''Runs both implementations on the same graph and returns the
+    best timings (legacy, current).'''
+    legacy_set = create_diamonds(layers)
+    legacy_rewrite(legacy_set)
+    current_set = create_diamonds(layers)
+    RDepPriority.rewrite(current_set)
+    assert priorities(legacy_set) == priorities(current_set)
+
+    legacy_time = min(timeit.repeat(
+        lambda: legacy_rewrite(create_diamonds(layers)),
+        number=1, repeat=repeat))
+    current_time = min(timeit.repeat(
+        lambda: RDepPriority.rewrite(create_diamonds(layers)),
+        number=1, repeat=repeat))
+    return legacy_time, current_time
+
+
+def main(args):
+    '''Print the timings.'''
+    layers = int(args[0]) if args else 20
+    legacy_time, current_time = run(layers)
+    print("layers [%d] legacy [%.4fs] current [%.4fs] speedup [%.1f]"
+          % (layers, legacy_time, current_time,
+             legacy_time / current_time))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,127 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Micro benchmark for the burndown statistics.
+   Compares the difference arrays of Statistics.get_units_generic()
+   with the former implementation which incremented the counter of
+   each day of the time period of each requirement.
+
+   Usage: python -m rmtoo.tests.benchmark.BenchStatistics [reqs] [days]
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import datetime
+import random
+import sys
+import timeit
+
+from rmtoo.lib.ClassType import ClassTypeImplementable
+from rmtoo.lib.RequirementStatus import RequirementStatusNotDone, \
+    RequirementStatusAssigned, RequirementStatusFinished
+from rmtoo.lib.Statistics import Statistics
+
+
+class BenchRequirement(object):
+    '''The parts of a requirement needed for the statistics.'''
+
+    def __init__(self, values, status):
+        self.__values = values
+        self.__status = status
+
+    def get_value(self, key):
+        '''Returns the value.'''
+        return self.__values[key]
+
+    def get_status(self):
+        '''Returns the status.'''
+        return self.__status
+
+
+class BenchSet(object):
+    '''The parts of a requirement set needed for the statistics.'''
+
+    def __init__(self, requirements):
+        self.__requirements = requirements
+
+    def get_requirements_iteritems(self):
+        '''Iterates over the requirements.'''
+        return enumerate(self.__requirements)
+
+
+def legacy_get_units(rset, start_date, end_date):
+    '''The former implementation of get_units().'''
+    result_vec = [[0, 0, 0]
+                  for _ in range((end_date - start_date).days + 1)]
+
+    def inc_stats(idx, first_date, last_date, efe):
+        for i in range((first_date - start_date).days,
+                       (last_date - start_date).days + 1):
+            result_vec[i][idx] += efe
+
+    for _, req in rset.get_requirements_iteritems():
+        status = req.get_status()
+        efe = req.get_value("Effort estimation")
+        if isinstance(status, RequirementStatusNotDone):
+            inc_stats(0, max(req.get_value("Invented on"), start_date),
+                      end_date, efe)
+        else:
+            date = max(status.get_date(), start_date)
+            inc_stats(0, start_date, date - datetime.timedelta(1), efe)
+            inc_stats(1 if isinstance(status, RequirementStatusAssigned)
+                      else 2, date, end_date, efe)
+    return result_vec
+
+
+def create_requirement_set(req_cnt, days):
+    '''Creates requirements with dates in the time period.'''
+    rand = random.Random(1)
+    start_date = datetime.date(2011, 1, 1)
+    requirements = []
+    for _ in range(req_cnt):
+        invented_on = start_date + datetime.timedelta(rand.randint(0, days))
+        date = min(invented_on + datetime.timedelta(rand.randint(0, days)),
+                   start_date + datetime.timedelta(days))
+        status = rand.choice([
+            RequirementStatusNotDone(None, "B", "not done"),
+            RequirementStatusAssigned(None, "B", "assigned:me:%s" % date),
+            RequirementStatusFinished(None, "B",
+                                      "finished:me:%s:1h" % date)])
+        requirements.append(BenchRequirement(
+            {"Invented on": invented_on, "Effort estimation": 3,
+             "Class": ClassTypeImplementable()}, status))
+    return BenchSet(requirements), start_date, \
+        start_date + datetime.timedelta(days)
+
+
+def run(req_cnt=2000, days=3 * 365, repeat=3):
+    '''Runs both implementations and returns the best timings as
+    (legacy, current).'''
+    rset, start_date, end_date = create_requirement_set(req_cnt, days)
+    assert legacy_get_units(rset, start_date, end_date) \
+        == Statistics.get_units_generic(
+            rset, start_date, end_date, lambda _: False).tolist()
+    return (min(timeit.repeat(
+        lambda: legacy_get_units(rset, start_date, end_date),
+        number=1, repeat=repeat)),
+            min(timeit.repeat(
+                lambda: Statistics.get_units_generic(
+                    rset, start_date, end_date, lambda _: False),
+                number=1, repeat=repeat)))
+
+
+def main(args):
+    '''Print the timings.'''
+    req_cnt = int(args[0]) if args else 2000
+    days = int(args[1]) if len(args) > 1 else 3 * 365
+    print("requirements [%d] days [%d]: legacy [%.4fs] current [%.4fs]"
+          % ((req_cnt, days) + run(req_cnt, days)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
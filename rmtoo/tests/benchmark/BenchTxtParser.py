@@ -0,0 +1,113 @@
+'''
+ rmtoo
+   Free and Open Source Requirements Management Tool
+
+  Micro benchmark for the text parser.
+   Compares the index based TxtParser with the former
+   implementation which removed the consumed lines from the
+   front of the list.
+
+   Usage: python -m rmtoo.tests.benchmark.BenchTxtParser [lines]
+
+ (c) 2017 by flonatel GmbH & Co. KG
+
+ For licensing details see COPYING
+'''
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import timeit
+
+from rmtoo.lib.RMTException import RMTException
+from rmtoo.lib.storagebackend.txtfile.TxtParser import TxtParser
+
+
+def legacy_split_next_record(split_lines, rid, lineno):
+    '''The former implementation: consumed lines are deleted from the
+    front of the list.'''
+    i = 0
+    sl_len = len(split_lines)
+    retl = TxtParser.re_tag_line.match(split_lines[i])
+    if not retl:
+        raise RMTException(79, "Expected tag line not found",
+                           rid, lineno)
+    content = [retl.group(2)]
+    comment = []
+    tag = retl.group(1)
+    i += 1
+    while i < sl_len:
+        if TxtParser.re_tag_line.match(split_lines[i]):
+            break
+        elif split_lines[i] and split_lines[i][0] == " ":
+            content.append(split_lines[i])
+        elif TxtParser.is_comment_or_empty(split_lines[i]):
+            comment.append(split_lines[i])
+        i += 1
+    rec = [tag, content, comment]
+    del split_lines[0:i]
+    return rec
+
+
+def legacy_split_entries(split_lines, rid, lineno_offset):
+    '''The former implementation of TxtParser.split_entries.'''
+    doc = []
+    lineno = lineno_offset
+    success = True
+    while split_lines:
+        try:
+            next_record = legacy_split_next_record(
+                split_lines, rid, lineno)
+            doc.append(next_record)
+            lineno += len(next_record[1]) + len(next_record[2])
+        except RMTException:
+            del split_lines[0]
+            lineno += 1
+            success = False
+    return success, doc
+
+
+def create_record(line_cnt):
+    '''Creates a record with the given number of lines: a mixture
+    of tag lines, continuation lines and comments.'''
+    split_lines = []
+    for lineno in range(line_cnt):
+        if lineno % 4 == 0:
+            split_lines.append("Tag%d: value of tag %d" % (lineno, lineno))
+        elif lineno % 4 == 3:
+            split_lines.append("# comment %d" % lineno)
+        else:
+            split_lines.append(" continuation line %d" % lineno)
+    return split_lines
+
+
+def run(line_cnt=10000, repeat=3):
+    '''Runs both implementations on the same input and returns the
+    best timings (legacy, current).'''
+    split_lines = create_record(line_cnt)
+
+    legacy = legacy_split_entries(list(split_lines), "Bench", 1)
+    current = TxtParser.split_entries(list(split_lines), "Bench", None, 1)
+    assert legacy == current
+
+    legacy_time = min(timeit.repeat(
+        lambda: legacy_split_entries(list(split_lines), "Bench", 1),
+        number=1, repeat=repeat))
+    current_time = min(timeit.repeat(
+        lambda: TxtParser.split_entries(
+            list(split_lines), "Bench", None, 1),
+        number=1, repeat=repeat))
+    return legacy_time, current_time
+
+
+def main(args):
+    '''Print the timings.'''
+    line_cnt = int(args[0]) if args else 10000
+    legacy_time, current_time = run(line_cnt)
+    print("lines [%d] legacy [%.4fs] current [%.4fs] speedup [%.1f]"
+          % (line_cnt, legacy_time, current_time,
+             legacy_time / current_time))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])